@@ -54,6 +54,11 @@
 
 import argparse
 import logging
+import mmap
+import os
+import re
+import shutil
+import tempfile
 import yaml
 import numpy
 import time
@@ -61,7 +66,7 @@ from peewee import *
 from typing import List
 import multiprocessing
 from itertools import zip_longest
-from collections import defaultdict
+from collections import defaultdict, deque
 from tqdm import tqdm
 from plumbum.cmd import wc
 from math import ceil
@@ -72,6 +77,9 @@ DB      = SqliteDatabase(None)
 BLOCK   = 16<<10
 PROC_NR = 48
 DBBATCH = 95
+INFLIGHT = 2
+RANGES  = 4
+JOB_MEM = 512<<20
 PID     = 0
 
 def die(what: str):
@@ -311,11 +319,66 @@ class profiler:
 
 # ======================================================================
 
+# Plain YAML scalars the tokenizer resolves itself, anything else
+# (octal, floats, sexagesimal, ...) is left to yaml.
+YAML_WORDS = {
+    **dict.fromkeys(["true", "True", "TRUE", "yes", "Yes", "YES",
+                     "on", "On", "ON"], True),
+    **dict.fromkeys(["false", "False", "FALSE", "no", "No", "NO",
+                     "off", "Off", "OFF"], False),
+    **dict.fromkeys(["null", "Null", "NULL", "~"], None),
+}
+RE_DEC   = re.compile(r"-?(?:0|[1-9][0-9]*)\Z")
+RE_HEX   = re.compile(r"0x[0-9a-fA-F]+\Z")
+RE_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
 class ADDB2PP:
     @staticmethod
     def clean_yaml(yml):
         return yml.translate(str.maketrans("><-","''_"))
 
+    @staticmethod
+    def yaml_kv(fields, clean=False):
+        yml = "{"+" ".join(fields)+"}"
+        return yaml.safe_load(ADDB2PP.clean_yaml(yml) if clean else yml)
+
+    @staticmethod
+    def scalar(val):
+        if RE_DEC.match(val):
+            return int(val)
+        if val in YAML_WORDS:
+            return YAML_WORDS[val]
+        if RE_IDENT.match(val):
+            return val
+        if RE_HEX.match(val):
+            return int(val, 16)
+        if len(val) > 1 and val[0] == val[-1] == "'" and "'" not in val[1:-1]:
+            return val[1:-1]
+        return yaml.safe_load("{v: "+val+"}")["v"]
+
+    # Same dict as yaml_kv() for ['key:', 'val,', ..., 'key:', 'val'],
+    # records not laid out like that are handed over to yaml.
+    @staticmethod
+    def parse_kv(fields, clean=False):
+        if clean:
+            fields = [ADDB2PP.clean_yaml(f) for f in fields]
+        nr = len(fields)
+        ret = {}
+        if nr % 2:
+            return ADDB2PP.yaml_kv(fields)
+        for i in range(0, nr, 2):
+            key = fields[i]
+            val = fields[i+1]
+            if val[-1] == ',':
+                val = val[:-1]
+            elif i + 2 < nr:
+                return ADDB2PP.yaml_kv(fields)
+            if key[-1] != ':' or not RE_IDENT.match(key[:-1]) or \
+               key[:-1] in YAML_WORDS or not val:
+                return ADDB2PP.yaml_kv(fields)
+            ret[key[:-1]] = ADDB2PP.scalar(val)
+        return ret
+
     @staticmethod
     def to_unix(motr_time):
         mt = list(motr_time)
@@ -335,7 +398,7 @@ class ADDB2PP:
     # ['*', '2019-08-29-12:16:54.279414683',
     #  'motr-to-dix', 'motr_id:', '1170,', 'dix_id:', '1171']
     def p_1_to_2(measurement, labels, table):
-        ret = yaml.safe_load("{"+" ".join(measurement[3:])+"}")
+        ret = ADDB2PP.parse_kv(measurement[3:])
         return((table, ret))
 
     # ['*',
@@ -345,7 +408,7 @@ class ADDB2PP:
     def p_rpc_item_id(measurement, labels, table):
         name  = measurement[2]
         time  = measurement[1]
-        ret   = yaml.safe_load("{"+" ".join(measurement[3:])+"}")
+        ret   = ADDB2PP.parse_kv(measurement[3:])
         ret['time'] = ADDB2PP.to_unix(time)
         return((table, ret))
 
@@ -357,7 +420,7 @@ class ADDB2PP:
     def p_yaml_req(measurement, labels, table):
         name  = measurement[2]
         time  = measurement[1]
-        ret   = yaml.safe_load(ADDB2PP.clean_yaml("{"+" ".join(measurement[3:])+"}"))
+        ret   = ADDB2PP.parse_kv(measurement[3:], clean=True)
         ret['time'] = ADDB2PP.to_unix(time)
         return((table, ret))
 
@@ -365,7 +428,7 @@ class ADDB2PP:
     def p_cob_req(measurement, labels, table):
         name  = measurement[2]
         time  = measurement[1]
-        ret   = yaml.safe_load(ADDB2PP.clean_yaml("{"+" ".join(measurement[3:])+"}"))
+        ret   = ADDB2PP.parse_kv(measurement[3:], clean=True)
         ret['time']  = ADDB2PP.to_unix(time)
         ret['id']    = ret.pop('cob_id')
         ret['state'] = ret.pop('cob_state')
@@ -374,7 +437,7 @@ class ADDB2PP:
     def p_stio_req(measurement, mnl, param):
         name  = measurement[2]
         time  = measurement[1]
-        ret   = yaml.safe_load(ADDB2PP.clean_yaml("{"+" ".join(measurement[3:])+"}"))
+        ret   = ADDB2PP.parse_kv(measurement[3:], clean=True)
         ret['time']  = ADDB2PP.to_unix(time)
         ret['id']    = ret.pop('stio_id')
         ret['state'] = ret.pop('stio_state')
@@ -502,74 +565,204 @@ class ADDB2PP:
         }
 
 
-    def consume_record(self, rec):
-        def _add_pid(_,ret):
-            ret.update({"pid": PID})
-            return ((_,ret))
+    @staticmethod
+    def parse_labels(labels):
+        return dict([kvf for kvf in [kv.strip().split() for kv in labels.split("|")]
+                     if kvf and len(kvf)==2])
 
-        # measurement[0] and labels[1..] (mnl)
-        mnl = rec.split("|")
-        measurement = mnl[0].split()
+    def consume_record(self, rec, pid=None):
+        # measurement and labels after the first '|'
+        measurement, _, labels = rec.partition("|")
+        measurement = measurement.split()
         if measurement == []:
             return
-        measurement_name = measurement[2]
+        parser = self.parsers.get(measurement[2])
+        if parser is None:
+            return None
+        parser, table = parser
 
-        labels=dict([kvf for kvf in [kv.strip().split() for kv in mnl[1:]]
-                     if kvf and len(kvf)==2])
+        # Only queue statistics are told apart by their labels.
+        if parser is ADDB2PP.p_queue:
+            labels = ADDB2PP.parse_labels(labels)
+        else:
+            labels = None
 
-        for pname, (parser, table) in self.parsers.items():
-            if pname == measurement_name:
-                return _add_pid(*parser(measurement, labels, table))
-        return None
+        table, ret = parser(measurement, labels, table)
+        ret["pid"] = PID if pid is None else pid
+        return ((table, ret))
 
 APP = ADDB2PP()
-def fd_consume_record(rec):
-    return APP.consume_record(rec) if rec else None
+def fd_consume_record(rec, pid=None):
+    return APP.consume_record(rec, pid) if rec else None
 
-def fd_consume_data(file, pool):
+def fd_consume_chunk(pid, chunk):
+    tables = defaultdict(list)
+    for rec in chunk:
+        row = fd_consume_record(rec, pid)
+        if row:
+            tables[row[0]].append(row[1])
+    return tables
+
+def db_insert_tables(tables):
+    nr = 0
+    with DB.atomic():
+        for k, v in tables.items():
+            for batch in chunked(v, DBBATCH):
+                globals()[k].insert_many(batch).execute()
+            nr += len(v)
+    return nr
+
+# Workers parse chunks of BLOCK lines into per table rows, the main process
+# inserts them in file order. At most INFLIGHT chunks per worker are read
+# ahead of the insertion, this bounds memory by BLOCK * PROC_NR * INFLIGHT.
+def fd_consume_data(file, pool, pid):
     def grouper(n, iterable, padvalue=None):
         return zip_longest(*[iter(iterable)]*n,
                            fillvalue=padvalue)
-    results=[]
+    nr = 0
+    pending = deque()
     _wc = int(wc["-l", file]().split()[0])
     _wc = ceil(_wc/BLOCK)*BLOCK
 
     with tqdm(total=_wc, desc=f"Read file: {file}") as t:
         with open(file) as fd:
             for chunk in grouper(BLOCK, fd):
-                results.extend(pool.map(fd_consume_record, chunk))
-                t.update(BLOCK)
+                pending.append(pool.apply_async(fd_consume_chunk, (pid, chunk)))
+                if len(pending) >= PROC_NR * INFLIGHT:
+                    nr += db_insert_tables(pending.popleft().get())
+                    t.update(BLOCK)
+        while pending:
+            nr += db_insert_tables(pending.popleft().get())
+            t.update(BLOCK)
 
-    return results
+    return nr
 
 def db_consume_data(files: List[str]):
-    rows   = []
-    tables = defaultdict(list)
-
+    # One pool serves all dump files, the pid of a file goes with each task.
+    with multiprocessing.Pool(PROC_NR) as pool:
+        db_connect()
+        db_drop_tables()
+        db_create_tables()
+
+        with profiler(f"Read files: {files}"):
+            for f in files:
+                with profiler(f"    {f}"):
+                    nr = fd_consume_data(f, pool, len(f))
+                logging.info(f"    {f}: {nr} records")
+
+        db_close()
+
+# Lines of [start, end) byte range of mmap-ed file, BLOCK lines at a time
+# approximately, pieces end on a line boundary.
+def fd_range_blocks(mm, start, end):
+    step = BLOCK * 128
+    while start < end:
+        stop = min(start + step, end)
+        if stop < end:
+            stop = mm.find(b"\n", stop - 1, end) + 1 or end
+        yield mm[start:stop].decode().splitlines()
+        start = stop
+
+# Byte ranges of about size/nr each, every range starts at a line start.
+def fd_ranges(file, nr):
+    size = os.path.getsize(file)
+    bounds = [0]
+    with open(file, "rb") as fd:
+        if size == 0:
+            return []
+        with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for i in range(1, nr):
+                nl = mm.find(b"\n", max(size * i // nr, bounds[-1], 1) - 1)
+                if nl < 0:
+                    break
+                if nl + 1 > bounds[-1]:
+                    bounds.append(nl + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+# Worker side: parse one byte range of file straight into its own sqlite file.
+def fd_consume_range(task):
+    file, pid, start, end, path = task
+    db_init(path)
     db_connect()
-    db_drop_tables()
     db_create_tables()
-
-    with profiler(f"Read files: {files}"):
-        for f in files:
-            def pool_init(pid):
-                global PID; PID=pid
-            # Ugly reinitialisation of the pool due to PID value propagation
-            pool = multiprocessing.Pool(PROC_NR, pool_init, (len(f),))
-            rows.extend(filter(None, fd_consume_data(f, pool)))
-        for k,v in rows:
-            tables[k].append(v)
-
-    with tqdm(total=len(rows), desc="Insert records") as t:
-        with profiler("Write to db"):
-             for k in tables.keys():
-                 with profiler(f"    {k}/{len(tables[k])}"):
-                     with DB.atomic():
-                         for batch in chunked(tables[k], DBBATCH):
-                             globals()[k].insert_many(batch).execute()
-                             t.update(len(batch))
-
+    nr = 0
+    with open(file, "rb") as fd:
+        with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for lines in fd_range_blocks(mm, start, end):
+                nr += db_insert_tables(fd_consume_chunk(pid, lines))
     db_close()
+    return end - start, nr
+
+def db_merge_range(path):
+    DB.execute_sql("ATTACH DATABASE ? AS range_db", (path,))
+    with DB.atomic():
+        for model in db_create_delete_tables:
+            cols = ", ".join(f'"{f.column_name}"' for f in model._meta.sorted_fields
+                             if not isinstance(f, AutoField))
+            table = model._meta.table_name
+            DB.execute_sql(f'INSERT INTO "{table}" ({cols}) '
+                           f'SELECT {cols} FROM range_db."{table}" ORDER BY rowid')
+    DB.execute_sql("DETACH DATABASE range_db")
+
+# Each dump file is split into PROC_NR * RANGES byte ranges aligned to lines.
+# Workers mmap the file and parse their range into a temporary sqlite file,
+# so only file names and offsets cross process boundaries. Range files are
+# merged into the db in file order at the end.
+def db_consume_ranges(files: List[str]):
+    tmpdir = tempfile.mkdtemp(prefix="addb2db-",
+                              dir=os.path.dirname(os.path.abspath(DB.database)))
+    paths = []
+    try:
+        with profiler(f"Read files: {files}"), multiprocessing.Pool(PROC_NR) as pool:
+            for f in files:
+                tasks = [(f, len(f), start, end, os.path.join(tmpdir, f"{len(paths) + i}.db"))
+                         for i, (start, end) in enumerate(fd_ranges(f, PROC_NR * RANGES))]
+                paths.extend(task[4] for task in tasks)
+                nr = 0
+                with tqdm(total=os.path.getsize(f), unit="B", unit_scale=True,
+                          desc=f"Read file: {f}") as t:
+                    for size, records in pool.imap_unordered(fd_consume_range, tasks):
+                        nr += records
+                        t.update(size)
+                logging.info(f"    {f}: {nr} records")
+
+        db_connect()
+        db_drop_tables()
+        db_create_tables()
+        with profiler("Merge range files"):
+            for path in tqdm(paths, desc="Merge range files"):
+                db_merge_range(path)
+        db_close()
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+# Processes the machine can run: one per available core, as long as each
+# gets JOB_MEM bytes of the available memory.
+def jobs_auto():
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/proc/meminfo") as fd:
+            mem = next(int(l.split()[1]) << 10 for l in fd
+                       if l.startswith("MemAvailable:"))
+    except (OSError, StopIteration, ValueError):
+        return cpus
+    return max(1, min(cpus, mem // JOB_MEM))
+
+def parse_jobs(jobs):
+    if jobs == "auto":
+        return jobs_auto()
+    try:
+        nr = int(jobs)
+    except ValueError:
+        nr = 0
+    if nr < 1:
+        raise argparse.ArgumentTypeError(f"expected 'auto' or a positive number: {jobs}")
+    return nr
 
 def db_setup_loggers():
     format='%(asctime)s %(name)s %(levelname)s %(message)s'
@@ -602,20 +795,38 @@ python3 addb2db.py --dumps dump1.txt dump2.txt ...
     parser.add_argument('--procs', type=int, required=False,
                         default=PROC_NR,
                         help="Number of processes to parse dump files")
+    parser.add_argument('--jobs', type=parse_jobs, required=False,
+                        default=None,
+                        help="""
+Number of processes to parse dump files, 'auto' picks one per available
+core as far as available memory allows, overrides --procs
+""")
     parser.add_argument('--block', type=int, required=False,
                         default=BLOCK,
                         help="Block of data from dump files processed at once")
     parser.add_argument('--batch', type=int, required=False,
                         default=DBBATCH,
                         help="Number of samples commited at once")
+    parser.add_argument('--inflight', type=int, required=False,
+                        default=INFLIGHT,
+                        help="Blocks per process parsed ahead of db insertion")
+    parser.add_argument('--ranges', action='store_true',
+                        help="""
+Split dump files into byte ranges parsed by processes straight into
+temporary sqlite files next to --db, merged at the end
+""")
 
     return parser.parse_args()
 
 if __name__ == '__main__':
     args=db_parse_args()
     BLOCK=args.block
-    PROC_NR=args.procs
+    PROC_NR=args.jobs or args.procs
     DBBATCH=args.batch
+    INFLIGHT=args.inflight
     db_init(args.db)
     db_setup_loggers()
-    db_consume_data(args.dumps)
+    if args.ranges:
+        db_consume_ranges(args.dumps)
+    else:
+        db_consume_data(args.dumps)
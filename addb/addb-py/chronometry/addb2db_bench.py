@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+# Synthetic addb2dump output and record parsing benchmark of addb2db.py:
+#
+# python3 addb2db_bench.py --lines 200000
+# python3 addb2db_bench.py --lines 1000000 --dump dump.txt   # keep the dump
+
+import argparse
+import random
+import time
+import addb2db
+from addb2db import ADDB2PP
+
+TIME = "2020-01-26-17:14:{:02}.{:09}"
+
+def gen_record(rnd, i):
+    t = TIME.format(i // 1000000 % 60, i % 1000000000)
+    a = rnd.randrange(1, 1 << 20)
+    b = rnd.randrange(1, 1 << 20)
+    kind = i % 10
+    if kind == 0:
+        return f"* {t} motr-to-dix      motr_id: {a}, dix_id: {b}"
+    if kind == 1:
+        return f"* {t} rpc-item-id-assign id: {a}, opcode: 117, xid: {b}, session_id: 98789222400000038"
+    if kind == 2:
+        return (f"* {t} fom-descr        service: <7600000000000001:{a % 4}>, sender: {b}, "
+                f"req-opcode: M0_IOSERVICE_READV_OPCODE, rep-opcode: none, local: false, "
+                f"rpc_sm_id: {a}, fom_sm_id: {b}, fom_state_sm_id: {b + 1}")
+    if kind == 3:
+        return f"* {t} cob-req-state    cob_id: {a}, cob_state: {b % 4}"
+    if kind == 4:
+        return f"* {t} stio-req-state   stio_id: {a}, stio_state: {b % 4}"
+    if kind == 5:
+        return f"* {t} fom-to-tx        fom_id: {a}, tx_id: {b}"
+    if kind == 6:
+        return (f"* {t} wail             nr: {a % 1000} min: 1 max: 4 avg: 2.719758 dev: 0.461787"
+                f" |         locality         {b % 8}")
+    if kind == 7:
+        return f"* {t} fom-phase        sm_id: {a} --> HA_LINK_OUTGOING_STATE_WAIT_REPLY"
+    if kind == 8:
+        return f"* {t} s3-request-state s3_request_id: {a}, state: START"
+    return f"* {t} bulk-to-rpc      bulk_id: {a}, rpc_id: {b}"
+
+def gen_dump(nr, seed=0):
+    rnd = random.Random(seed)
+    return [gen_record(rnd, i) for i in range(nr)]
+
+def run(app, lines):
+    start = time.perf_counter()
+    rows = [app.consume_record(line) for line in lines]
+    return rows, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="addb2db.py record parsing benchmark")
+    parser.add_argument('--lines', type=int, default=200000,
+                        help="Number of synthetic records")
+    parser.add_argument('--dump', type=str, default=None,
+                        help="Also write the synthetic dump to this file")
+    args = parser.parse_args()
+
+    lines = gen_dump(args.lines)
+    if args.dump:
+        with open(args.dump, "w") as fd:
+            fd.write("\n".join(lines) + "\n")
+
+    app = addb2db.ADDB2PP()
+    rows, tokenizer = run(app, lines)
+
+    parse_kv = ADDB2PP.parse_kv
+    ADDB2PP.parse_kv = staticmethod(ADDB2PP.yaml_kv)
+    try:
+        yaml_rows, yaml = run(app, lines)
+    finally:
+        ADDB2PP.parse_kv = staticmethod(parse_kv)
+
+    assert rows == yaml_rows, "tokenizer and yaml records differ"
+    print(f"yaml:      {len(lines) / yaml:12.0f} lines/s")
+    print(f"tokenizer: {len(lines) / tokenizer:12.0f} lines/s  x{yaml / tokenizer:.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,142 @@
 
 """CORTXS3ListIndexResponse will list out index response."""
 import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+def iter_index_listing(index_content, header):
+    """
+    Yield entries of "Keys" of listing JSON one at a time, other top level
+    fields are stored into header. The listing is never decoded as a whole.
+    """
+    if isinstance(index_content, bytes):
+        index_content = index_content.decode("utf-8")
+    try:
+        pos = _WHITESPACE.match(index_content, 0).end()
+        if index_content[pos] != '{':
+            raise ValueError("Index listing is not a JSON object")
+        pos = _WHITESPACE.match(index_content, pos + 1).end()
+        if index_content[pos] == '}':
+            return
+        while True:
+            name, pos = _DECODER.raw_decode(index_content, pos)
+            pos = _WHITESPACE.match(index_content, pos).end()
+            if index_content[pos] != ':':
+                raise ValueError("Expected ':' at position " + str(pos))
+            pos = _WHITESPACE.match(index_content, pos + 1).end()
+            if name == "Keys" and index_content[pos] == '[':
+                pos = _WHITESPACE.match(index_content, pos + 1).end()
+                if index_content[pos] == ']':
+                    pos += 1
+                else:
+                    while True:
+                        entry, pos = _DECODER.raw_decode(index_content, pos)
+                        yield entry
+                        pos = _WHITESPACE.match(index_content, pos).end()
+                        pos += 1
+                        if index_content[pos - 1] == ']':
+                            break
+                        if index_content[pos - 1] != ',':
+                            raise ValueError("Expected ',' at position " + str(pos - 1))
+                        pos = _WHITESPACE.match(index_content, pos).end()
+            else:
+                value, pos = _DECODER.raw_decode(index_content, pos)
+                if name != "Keys":
+                    header[name] = value
+            pos = _WHITESPACE.match(index_content, pos).end()
+            pos += 1
+            if index_content[pos - 1] == '}':
+                return
+            if index_content[pos - 1] != ',':
+                raise ValueError("Expected ',' at position " + str(pos - 1))
+            pos = _WHITESPACE.match(index_content, pos).end()
+    except IndexError:
+        raise ValueError("Index listing JSON is truncated")
+
+
+def read_index_listing_header(index_content):
+    """
+    Return top level fields other than "Keys" of listing JSON without decoding
+    its entries. Fields before "Keys" are walked from the head of the listing
+    and fields after it, e.g. NextMarker, are decoded from its tail.
+    """
+    if isinstance(index_content, bytes):
+        index_content = index_content.decode("utf-8")
+    header = {}
+    entries = iter_index_listing(index_content, header)
+    # Fields before "Keys" are stored into header before its first entry is yielded.
+    if next(entries, None) is None:
+        return header
+    entries.close()
+    # "]" closing "Keys" is the last one outside of a string, a "]" inside
+    # of a string leaves a tail which does not decode as the rest of an object.
+    end = len(index_content)
+    while True:
+        end = index_content.rfind(']', 0, end)
+        if end < 0:
+            break
+        tail = index_content[end + 1:].strip()
+        if tail == '}':
+            return header
+        if tail.startswith(','):
+            try:
+                fields = json.loads('{' + tail[1:])
+            except ValueError:
+                continue
+            header.update(fields)
+            return header
+    header = {}
+    for _ in iter_index_listing(index_content, header):
+        pass
+    return header
+
+
+class CORTXS3IndexRecord(object):
+    """Key and value of one listed index entry, value JSON is decoded on access."""
+
+    __slots__ = ('_key', '_value', '_json_value')
+
+    def __init__(self, key, value):
+        """Initialise key and raw value."""
+        self._key = key
+        self._value = value
+        self._json_value = None
+
+    def get_key(self):
+        """Return key."""
+        return self._key
+
+    def get_value(self):
+        """Return value as listed."""
+        return self._value
+
+    def get_json_value(self):
+        """Return value decoded from JSON, decoded once."""
+        if self._json_value is None:
+            if isinstance(self._value, (str, bytes)):
+                self._json_value = json.loads(self._value)
+            else:
+                self._json_value = self._value
+        return self._json_value
+
+    def to_dict(self):
+        """Return record in the {"Key": .., "Value": ..} form of the listing."""
+        return {"Key": self._key, "Value": self._value}
+
+    def __getitem__(self, name):
+        """Allow record["Key"] and record["Value"] like listing dicts."""
+        if name == "Key":
+            return self._key
+        if name == "Value":
+            return self._value
+        raise KeyError(name)
+
+    def __repr__(self):
+        """Return record in its listing form."""
+        return str(self.to_dict())
 
 
 class CORTXS3ListIndexResponse(object):
@@ -27,18 +163,48 @@ class CORTXS3ListIndexResponse(object):
     _index_content = ""
 
     def __init__(self, index_content):
-        """Initialise index content."""
-        self._index_content = json.loads(index_content.decode("utf-8"))
+        """Initialise index content, it is decoded on first access."""
+        self._raw_index_content = index_content
+        self._index_content = None
+        self._listing_header = None
 
     def get_index_content(self):
         """return index content."""
+        if self._index_content is None:
+            self._index_content = json.loads(self._raw_index_content.decode("utf-8"))
         return self._index_content
 
+    def get_listing_header(self):
+        """
+        Return listing fields other than Keys, e.g. IsTruncated and NextMarker.
+        Entries of listing are not decoded for it.
+        """
+        if self._listing_header is None:
+            if self._index_content is not None:
+                self._listing_header = {name: value for name, value in
+                                        self._index_content.items() if name != "Keys"}
+            else:
+                self._listing_header = read_index_listing_header(self._raw_index_content)
+        return self._listing_header
+
+    def iter_records(self):
+        """Yield CORTXS3IndexRecord of every listed key, without decoding whole listing."""
+        if self._index_content is not None:
+            for entry in self._index_content.get("Keys") or []:
+                yield CORTXS3IndexRecord(entry["Key"], entry["Value"])
+            return
+        header = {}
+        for entry in iter_index_listing(self._raw_index_content, header):
+            yield CORTXS3IndexRecord(entry["Key"], entry["Value"])
+        self._listing_header = header
+
     def get_json(self, key):
         """Returns the content value based on key."""
-        json_value = json.loads(self._index_content[key].decode("utf-8"))
+        json_value = json.loads(self.get_index_content()[key].decode("utf-8"))
         return json_value
 
     def set_index_content(self, index_content):
         """Sets index content."""
+        self._raw_index_content = index_content
         self._index_content = json.loads(index_content.decode("utf-8"))
+        self._listing_header = None
@@ -0,0 +1,261 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Requests of the Index, Key-value and Object REST API's and how their
+responses are read, shared by the blocking and asyncio API classes.
+"""
+import urllib
+
+from s3backgrounddelete.cortx_list_index_response import CORTXS3ListIndexResponse
+from s3backgrounddelete.cortx_get_kv_response import CORTXS3GetKVResponse
+from s3backgrounddelete.cortx_s3_error_respose import CORTXS3ErrorResponse
+from s3backgrounddelete.cortx_s3_success_response import CORTXS3SuccessResponse
+from cortx.utils.log import Log
+
+# The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
+# urllib.parse.urlencode converts a mapping object or a sequence of two-element tuples, which may contain str or bytes objects, to a percent-encoded ASCII text string.
+# https://docs.python.org/3/library/urllib.parse.html
+# For example if index_id is 'AAAAAAAAAHg=-AwAQAAAAAAA=' and object_key_name is "testobject+"
+# urllib.parse.quote(index_id, safe='') and urllib.parse.quote(object_key_name) yields
+# 'AAAAAAAAAHg%3D-AwAQAAAAAAA%3D' and 'testobject%2B' respectively, request_uri is
+# '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D/testobject%2B'.
+# If oid is 'JwZSAwAAAAA=-AgAAAAAA4Ag=' and layout_id is 1, request_uri is
+# '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D' and absolute request uri is
+# '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D?layout-id=1'
+
+
+class CORTXS3ApiRequest(object):
+    """One signed API request and the response status it expects."""
+
+    def __init__(self, method, request_uri, query_params="", body=None,
+                 expected_status=200, success=CORTXS3SuccessResponse,
+                 success_msg="", failure_msg=""):
+        """
+        Initialise request, body is sent as is and signed as "" if None.
+        success(body) builds the response object of expected status, messages
+        are formatted with status and body of the response.
+        """
+        self.method = method
+        self.request_uri = request_uri
+        self.query_params = query_params
+        self.body = body
+        self.expected_status = expected_status
+        self.success = success
+        self.success_msg = success_msg
+        self.failure_msg = failure_msg
+
+    def get_absolute_uri(self):
+        """Return request uri with query params."""
+        if self.query_params:
+            return self.request_uri + '?' + self.query_params
+        return self.request_uri
+
+    def sign(self, s3_util):
+        """Return signed headers or None if signature could not be generated."""
+        body = "" if self.body is None else self.body
+        headers = s3_util.prepare_signed_header(self.method, self.request_uri,
+                                                self.query_params, body)
+        if headers['Authorization'] is None:
+            Log.error("Failed to generate v4 signature")
+            return None
+        return headers
+
+    def get_response(self, response):
+        """Return (status, response object) of raw response."""
+        if response['status'] == self.expected_status:
+            Log.info(self.success_msg.format(status=response['status'], body=response['body']))
+            return True, self.success(response['body'])
+        Log.info(self.failure_msg.format(status=response['status'], body=response['body']))
+        return False, CORTXS3ErrorResponse(
+            response['status'], response['reason'], response['body'])
+
+    @staticmethod
+    def get_exception_response(ex):
+        """Return (False, error response) of exception raised by request."""
+        Log.error(repr(ex))
+        if isinstance(ex, ConnectionRefusedError):
+            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
+            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
+        return False, CORTXS3ErrorResponse(500,"","InternalServerError")
+
+
+def _index_uri(index_id):
+    """Return request uri of index."""
+    return '/indexes/' + urllib.parse.quote(index_id, safe='')
+
+
+def _kv_uri(index_id, object_key_name):
+    """Return request uri of key in index."""
+    return '/indexes/' + \
+        urllib.parse.quote(index_id, safe='') + '/' + \
+        urllib.parse.quote(object_key_name)
+
+
+def _object_uri(oid):
+    """Return request uri of object."""
+    return '/objects/' + urllib.parse.quote(oid, safe='')
+
+
+def index_list_request(index_id, max_keys=1000, next_marker=None, additional_Query_params=None):
+    """Return LIST index request or None."""
+    if index_id is None:
+        Log.error("Index Id is required.")
+        return None
+    inputQueryParams = {}
+    inputQueryParams["max-keys"] = max_keys
+    if (next_marker is not None):
+        inputQueryParams["marker"] = next_marker
+    if (additional_Query_params is not None and isinstance(additional_Query_params, dict)):
+        # Add addtional query params
+        inputQueryParams.update(additional_Query_params)
+    #Generate sorted urlencoded query params into query_params
+    query_params = "&".join(urllib.parse.urlencode({key: inputQueryParams[key]})
+                            for key in sorted(inputQueryParams.keys()))
+    return CORTXS3ApiRequest('GET', _index_uri(index_id), query_params,
+                             success=CORTXS3ListIndexResponse,
+                             success_msg='Successfully listed Index details.',
+                             failure_msg='Failed to list Index details.')
+
+
+def index_put_request(index_id):
+    """Return PUT index request or None."""
+    if index_id is None:
+        Log.info("Index Id is required.")
+        return None
+    return CORTXS3ApiRequest('PUT', _index_uri(index_id), expected_status=201,
+                             success_msg='Successfully added Index.',
+                             failure_msg='Failed to add Index.')
+
+
+def index_delete_request(index_id):
+    """Return DELETE index request or None."""
+    if index_id is None:
+        Log.info("Index Id is required.")
+        return None
+    return CORTXS3ApiRequest('DELETE', _index_uri(index_id), expected_status=204,
+                             success_msg='Successfully deleted Index.',
+                             failure_msg='Failed to delete Index.')
+
+
+def index_head_request(index_id):
+    """Return HEAD index request or None."""
+    if index_id is None:
+        Log.error("Index id is required.")
+        return None
+    return CORTXS3ApiRequest('HEAD', _index_uri(index_id), body="",
+                             success_msg="HEAD Index called successfully with status code: "
+                                         "{status} response body: {body}",
+                             failure_msg="Failed to do HEAD Index with status code: "
+                                         "{status} response body: {body}")
+
+
+def _kv_args_valid(index_id, object_key_name):
+    """Return True if index and key are given."""
+    if index_id is None:
+        Log.error("Index Id is required.")
+        return False
+    if object_key_name is None:
+        Log.error("Key is required")
+        return False
+    return True
+
+
+def kv_put_request(index_id=None, object_key_name=None, value=""):
+    """Return PUT key-value request or None."""
+    if not _kv_args_valid(index_id, object_key_name):
+        return None
+    return CORTXS3ApiRequest('PUT', _kv_uri(index_id, object_key_name), body=value,
+                             success_msg="Key value details added successfully.",
+                             failure_msg='Failed to add key value details.')
+
+
+def kv_get_request(index_id=None, object_key_name=None):
+    """Return GET key-value request or None."""
+    if not _kv_args_valid(index_id, object_key_name):
+        return None
+    return CORTXS3ApiRequest('GET', _kv_uri(index_id, object_key_name),
+                             success=lambda body: CORTXS3GetKVResponse(object_key_name, body),
+                             success_msg="Get kv operation successfully.",
+                             failure_msg='Failed to get kv details.')
+
+
+def kv_delete_request(index_id=None, object_key_name=None):
+    """Return DELETE key-value request or None."""
+    if not _kv_args_valid(index_id, object_key_name):
+        return None
+    return CORTXS3ApiRequest('DELETE', _kv_uri(index_id, object_key_name),
+                             expected_status=204,
+                             success_msg='Key value deleted.',
+                             failure_msg='Failed to delete key value.')
+
+
+def object_put_request(oid, value):
+    """Return PUT object request or None."""
+    if oid is None:
+        Log.error("Object Id is required.")
+        return None
+    return CORTXS3ApiRequest('PUT', _object_uri(oid), body=value, expected_status=201,
+                             success_msg="Object added successfully.",
+                             failure_msg='Failed to add Object.')
+
+
+def object_get_request(oid):
+    """Return GET object request or None."""
+    if oid is None:
+        Log.error("Object Id is required.")
+        return None
+    return CORTXS3ApiRequest('GET', _object_uri(oid),
+                             success_msg='Successfully fetched object details.',
+                             failure_msg='Failed to fetch object details.')
+
+
+def object_delete_request(oid, layout_id, pvid_str):
+    """Return DELETE object request or None."""
+    if oid is None:
+        Log.error("Object Id is required.")
+        return None
+    if layout_id is None:
+        Log.error("Layout Id is required.")
+        return None
+    if pvid_str is None:
+        Log.error("pvid_str is required.")
+        return None
+    query_params = urllib.parse.urlencode({'layout-id': layout_id})
+    query_params += "&" + urllib.parse.urlencode({'pvid': pvid_str}, safe='')
+    return CORTXS3ApiRequest('DELETE', _object_uri(oid), query_params, body='',
+                             expected_status=204,
+                             success_msg='Object deleted successfully.',
+                             failure_msg='Failed to delete Object.')
+
+
+def object_head_request(oid, layout_id):
+    """Return HEAD object request or None."""
+    if oid is None:
+        Log.error("Object Id is required.")
+        return None
+    if layout_id is None:
+        Log.error("Layout Id is required.")
+        return None
+    query_params = urllib.parse.urlencode({'layout-id': layout_id})
+    return CORTXS3ApiRequest('HEAD', _object_uri(oid), query_params, body='',
+                             success_msg="HEAD Object called successfully with status code: "
+                                         "{status} response body: {body}",
+                             failure_msg="Failed to do HEAD Object with status code: "
+                                         "{status} response body: {body}")
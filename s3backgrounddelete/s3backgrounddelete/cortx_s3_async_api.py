@@ -0,0 +1,119 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+This provides asyncio variants of the Index, Key-value and Object REST API's.
+
+They return the same (status, response) tuples and response objects as
+CORTXS3IndexApi, CORTXS3KVApi and CORTXS3ObjectApi, so that many metadata
+lookups and deletes can be awaited concurrently from one event loop, e.g.
+
+    kvapi = CORTXS3AsyncKVApi(config, CONNECTION_TYPE_CONSUMER)
+    results = await asyncio.gather(*[kvapi.get(index_id, key) for key in keys])
+"""
+from s3backgrounddelete.cortx_s3_async_client import CORTXS3AsyncClient
+from s3backgrounddelete.cortx_s3_util import CORTXS3Util
+from s3backgrounddelete.cortx_s3_api_request import index_list_request, \
+    index_put_request, index_delete_request, index_head_request
+from s3backgrounddelete.cortx_s3_api_request import kv_put_request, \
+    kv_get_request, kv_delete_request
+from s3backgrounddelete.cortx_s3_api_request import object_put_request, \
+    object_get_request, object_delete_request, object_head_request
+
+
+class CORTXS3AsyncApi(CORTXS3AsyncClient):
+    """Signs requests and maps responses like the blocking API's."""
+
+    def __init__(self, config, connectionType, max_connections=None):
+        """Initialise config."""
+        self.config = config
+        self.s3_util = CORTXS3Util(self.config, connectionType)
+        super(CORTXS3AsyncApi, self).__init__(self.config, connectionType,
+                                              max_connections=max_connections)
+
+    async def _perform(self, request):
+        """Sign and perform CORTXS3ApiRequest, return (status, response)."""
+        if (request is None):
+            return False, None
+        headers = request.sign(self.s3_util)
+        if (headers is None):
+            return False, None
+        try:
+            response = await self._request(request.method, request.get_absolute_uri(),
+                                           request.body, headers)
+        except Exception as ex:
+            return request.get_exception_response(ex)
+        return request.get_response(response)
+
+
+class CORTXS3AsyncIndexApi(CORTXS3AsyncApi):
+    """CORTXS3AsyncIndexApi provides index REST-API's List, Put, Delete and Head."""
+
+    async def list(self, index_id, max_keys=1000, next_marker=None, additional_Query_params=None):
+        """Perform LIST request and generate response."""
+        return await self._perform(index_list_request(index_id, max_keys, next_marker,
+                                                      additional_Query_params))
+
+    async def put(self, index_id):
+        """Perform PUT request and generate response."""
+        return await self._perform(index_put_request(index_id))
+
+    async def delete(self, index_id):
+        """Perform DELETE request and generate response."""
+        return await self._perform(index_delete_request(index_id))
+
+    async def head(self, index_id):
+        """Perform HEAD request and generate response."""
+        return await self._perform(index_head_request(index_id))
+
+
+class CORTXS3AsyncKVApi(CORTXS3AsyncApi):
+    """CORTXS3AsyncKVApi provides key-value REST-API's Put, Get & Delete."""
+
+    async def put(self, index_id=None, object_key_name=None, value=""):
+        """Perform PUT request and generate response."""
+        return await self._perform(kv_put_request(index_id, object_key_name, value))
+
+    async def get(self, index_id=None, object_key_name=None):
+        """Perform GET request and generate response."""
+        return await self._perform(kv_get_request(index_id, object_key_name))
+
+    async def delete(self, index_id=None, object_key_name=None):
+        """Perform DELETE request and generate response."""
+        return await self._perform(kv_delete_request(index_id, object_key_name))
+
+
+class CORTXS3AsyncObjectApi(CORTXS3AsyncApi):
+    """CORTXS3AsyncObjectApi provides object REST-API's Put, Get, Delete and Head."""
+
+    async def put(self, oid, value):
+        """Perform PUT request and generate response."""
+        return await self._perform(object_put_request(oid, value))
+
+    async def get(self, oid):
+        """Perform GET request and generate response."""
+        return await self._perform(object_get_request(oid))
+
+    async def delete(self, oid, layout_id, pvid_str):
+        """Perform DELETE request and generate response."""
+        return await self._perform(object_delete_request(oid, layout_id, pvid_str))
+
+    async def head(self, oid, layout_id):
+        """Perform HEAD request and generate response."""
+        return await self._perform(object_head_request(oid, layout_id))
@@ -0,0 +1,249 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""This is an asyncio s3 client which will do GET,PUT,DELETE and HEAD requests."""
+
+import asyncio
+import logging
+import time
+import urllib
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_PRODUCER
+from s3backgrounddelete.cortx_s3_rate_limiter import get_connection_rate_limiter
+from s3backgrounddelete.cortx_s3_rate_limiter import get_request_api
+from s3backgrounddelete.cortx_s3_metrics import record_http_request
+
+# Errors seen when a kept-alive connection was closed by the peer in between
+# two requests. The request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    asyncio.IncompleteReadError,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError)
+
+DEFAULT_MAX_CONNECTIONS = 64
+
+
+class CORTXS3AsyncClient(object):
+    """creates asyncio s3 client with keep-alive connections."""
+    _config = None
+    _logger = None
+    _limiters = None
+    _limiter_name = None
+    _limiter_settings = None
+
+    def __init__(self, config, connectionType, logger=None, max_connections=None):
+        """Initialise s3 client using config and logger."""
+        if (logger is None):
+            self._logger = logging.getLogger("CORTXS3AsyncClient")
+        else:
+            self._logger = logger
+        self._config = config
+        self._host = None
+        self._port = None
+        if (connectionType == CONNECTION_TYPE_CONSUMER):
+            self._netloc = self._get_endpoint_netloc(
+                self._config.get_cortx_s3_endpoint_for_consumer)
+            # Rate limiters shared with the blocking clients are looked up on
+            # first request and after config reload.
+            self._limiter_name = "consumer"
+        elif (connectionType == CONNECTION_TYPE_PRODUCER):
+            self._netloc = self._get_endpoint_netloc(
+                self._config.get_cortx_s3_endpoint_for_producer)
+            self._limiter_name = "producer"
+        else:
+            self._logger.error("Connection is none, Invalid \
+            Connection type specified.")
+            self._netloc = None
+        if (self._netloc is not None):
+            url = urllib.parse.urlsplit('//' + self._netloc)
+            self._host = url.hostname
+            self._port = url.port or 80
+        if (max_connections is None):
+            max_connections = DEFAULT_MAX_CONNECTIONS
+        self._max_connections = max_connections
+        self._idle_timeout = self._config.get_connection_idle_timeout()
+        # Semaphore is created on first use so that it binds to the running loop.
+        self._slots = None
+        # Idle connections as (reader, writer, last_used), most recently used last.
+        self._idle = []
+
+    def _get_endpoint_netloc(self, get_endpoint):
+        """Return netloc of endpoint from config or None."""
+        try:
+            return urllib.parse.urlparse(get_endpoint()).netloc
+        except KeyError as ex:
+            self._logger.error(str(ex))
+            return None
+
+    def _get_limiter(self, request_uri):
+        """Return rate limiter of API of request_uri or None."""
+        if (self._limiter_name is None):
+            return None
+        settings = self._config.get_settings()
+        if (settings is not self._limiter_settings):
+            # Looked up on first request and again after config reload.
+            self._limiters = {}
+            self._limiter_settings = settings
+        limiters = self._limiters
+        api = get_request_api(request_uri)
+        if (api not in limiters):
+            limiters[api] = get_connection_rate_limiter(self._config, self._limiter_name, api)
+        return limiters[api]
+
+    def _take_idle(self):
+        """Return most recently used idle connection, closing expired ones, or None."""
+        now = time.monotonic()
+        while self._idle:
+            reader, writer, last_used = self._idle.pop()
+            if (now - last_used) <= self._idle_timeout:
+                return reader, writer
+            writer.close()
+        return None
+
+    async def _open(self):
+        """Open new connection to endpoint."""
+        return await asyncio.open_connection(self._host, self._port)
+
+    async def _send(self, reader, writer, method, request_uri, body, headers):
+        """Write request and parse response."""
+        if body is None:
+            body = b''
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
+        lines = ['{} {} HTTP/1.1'.format(method, request_uri),
+                 'Host: {}'.format(self._netloc),
+                 'Content-Length: {}'.format(len(body))]
+        for key, value in headers.items():
+            lines.append('{}: {}'.format(key, value))
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b'\r\n')
+        # e.g. 'HTTP/1.1 204 No Content', reason phrase may be empty
+        status_parts = status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        status = int(status_parts[1])
+        reason = status_parts[2] if len(status_parts) > 2 else ''
+        response_headers = []
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            response_headers.append((key.strip(), value.strip()))
+        header_map = {key.lower(): value for key, value in response_headers}
+
+        will_close = header_map.get('connection', '').lower() == 'close'
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            response_body = b''
+        elif 'chunked' in header_map.get('transfer-encoding', '').lower():
+            response_body = await self._read_chunked(reader)
+        elif 'content-length' in header_map:
+            response_body = await reader.readexactly(int(header_map['content-length']))
+        else:
+            response_body = await reader.read()
+            will_close = True
+        result = {'status': status, 'headers': response_headers,
+                  'body': response_body, 'reason': reason}
+        return result, will_close
+
+    async def _read_chunked(self, reader):
+        """Read body sent with chunked transfer encoding."""
+        chunks = []
+        while True:
+            size_line = await reader.readuntil(b'\r\n')
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                # Skip trailers until the blank line.
+                while (await reader.readuntil(b'\r\n')) != b'\r\n':
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    async def _request(self, method, request_uri, body=None, headers=None):
+        """Perform request on a pooled connection and generate response."""
+        if (self._netloc is None):
+            raise TypeError("Failed to create connection instance")
+        if (headers is None):
+            headers = {
+                "Content-type": "application/x-www-form-urlencoded",
+                "Accept": "text/plain"}
+        limiter = self._get_limiter(request_uri)
+        if (limiter is not None):
+            throttled = limiter.reserve(method)
+            if throttled > 0:
+                await asyncio.sleep(throttled)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_connections)
+
+        async with self._slots:
+            start = time.monotonic()
+            connection = self._take_idle()
+            reused = connection is not None
+            if reused:
+                reader, writer = connection
+            else:
+                reader, writer = await self._open()
+            try:
+                try:
+                    result, will_close = await self._send(
+                        reader, writer, method, request_uri, body, headers)
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    # Server closed the idle connection, retry on a new one.
+                    writer.close()
+                    reader, writer = await self._open()
+                    result, will_close = await self._send(
+                        reader, writer, method, request_uri, body, headers)
+            except BaseException:
+                writer.close()
+                raise
+            if will_close:
+                writer.close()
+            else:
+                self._idle.append((reader, writer, time.monotonic()))
+            latency = time.monotonic() - start
+        if (limiter is not None):
+            limiter.record_response(result['status'], latency)
+        record_http_request(method, request_uri, result['status'], latency)
+        return result
+
+    async def put(self, request_uri, body=None, headers=None):
+        """Perform PUT request and generate response."""
+        return await self._request('PUT', request_uri, body, headers)
+
+    async def get(self, request_uri, body=None, headers=None):
+        """Perform GET request and generate response."""
+        return await self._request('GET', request_uri, body, headers)
+
+    async def delete(self, request_uri, body=None, headers=None):
+        """Perform DELETE request and generate response."""
+        return await self._request('DELETE', request_uri, body, headers)
+
+    async def head(self, request_uri, body=None, headers=None):
+        """Perform HEAD request and generate response."""
+        return await self._request('HEAD', request_uri, body, headers)
+
+    def close(self):
+        """Close all idle connections."""
+        while self._idle:
+            _, writer, _ = self._idle.pop()
+            writer.close()
@@ -21,10 +21,16 @@
 
 import sys
 import logging
+import time
 import http.client
 import urllib
+from concurrent.futures import ThreadPoolExecutor
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_PRODUCER
+from s3backgrounddelete.cortx_s3_connection_pool import get_connection_pool
+from s3backgrounddelete.cortx_s3_rate_limiter import get_connection_rate_limiter
+from s3backgrounddelete.cortx_s3_rate_limiter import get_request_api
+from s3backgrounddelete.cortx_s3_metrics import record_http_request
 
 
 class CORTXS3Client(object):
@@ -32,6 +38,10 @@ class CORTXS3Client(object):
     _config = None
     _logger = None
     _conn = None
+    _pool = None
+    _limiters = None
+    _limiter_name = None
+    _limiter_settings = None
 
     def __init__(self, config, connectionType, logger=None, connection=None):
         """Initialise s3 client using config, connection object and logger."""
@@ -40,15 +50,21 @@ class CORTXS3Client(object):
         else:
             self._logger = logger
         self._config = config
+        self._connection_type = connectionType
         if (connection is None):
+            # Requests borrow keep-alive connections from the shared pool
+            # of the endpoint instead of opening one connection per request.
             if (connectionType == CONNECTION_TYPE_CONSUMER):
-                self._conn = self._get_consumer_connection()
+                self._pool = self._get_consumer_pool()
+                # Rate limiters are looked up on first request and after config reload.
+                self._limiter_name = "consumer"
             elif (connectionType == CONNECTION_TYPE_PRODUCER):
-                self._conn = self._get_producer_connection()
+                self._pool = self._get_producer_pool()
+                self._limiter_name = "producer"
             else:
                 self._logger.error("Connection is none, Invalid \
                 Connection type specified.")
-                self._conn = None
+                self._pool = None
         else:
             self._conn = connection
 
@@ -72,67 +88,123 @@ class CORTXS3Client(object):
             return None
         return http.client.HTTPConnection(endpoint_url)
 
-    def put(self, request_uri, body=None, headers=None):
-        """Perform PUT request and generate response."""
-        if (self._conn is None):
+    def _get_consumer_pool(self):
+        """Return shared connection pool for consumer endpoint."""
+        try:
+            endpoint_url = urllib.parse.urlparse(
+                self._config.get_cortx_s3_endpoint_for_consumer()).netloc
+        except KeyError as ex:
+            self._logger.error(str(ex))
+            return None
+        return self._get_pool(endpoint_url)
+
+    def _get_producer_pool(self):
+        """Return shared connection pool for producer endpoint."""
+        try:
+            endpoint_url = urllib.parse.urlparse(
+                self._config.get_cortx_s3_endpoint_for_producer()).netloc
+        except KeyError as ex:
+            self._logger.error(str(ex))
+            return None
+        return self._get_pool(endpoint_url)
+
+    def _get_pool(self, endpoint_url):
+        """Return pool for endpoint, sized as per config."""
+        return get_connection_pool(endpoint_url,
+                                   self._config.get_connection_pool_size(),
+                                   self._config.get_connection_idle_timeout())
+
+    def _get_rate_limiter(self, name, api):
+        """Return shared rate limiter of connection type and API, None if rates are unlimited."""
+        return get_connection_rate_limiter(self._config, name, api)
+
+    def _get_limiter(self, request_uri):
+        """Return rate limiter of API of request_uri or None."""
+        if (self._limiter_name is None):
+            return None
+        settings = self._config.get_settings()
+        if (settings is not self._limiter_settings):
+            # Looked up on first request and again after config reload.
+            self._limiters = {}
+            self._limiter_settings = settings
+        limiters = self._limiters
+        api = get_request_api(request_uri)
+        if (api not in limiters):
+            limiters[api] = self._get_rate_limiter(self._limiter_name, api)
+        return limiters[api]
+
+    def _request(self, method, request_uri, body=None, headers=None):
+        """Perform request and generate response."""
+        if (self._conn is None and self._pool is None):
             raise TypeError("Failed to create connection instance")
         if (headers is None):
             headers = {
                 "Content-type": "application/x-www-form-urlencoded",
                 "Accept": "text/plain"}
 
-        self._conn.request('PUT', request_uri, body, headers)
-        response = self._conn.getresponse()
-        result = {'status': response.status, 'headers': response.getheaders(),
-                  'body': response.read(), 'reason': response.reason}
-        self._conn.close()
+        limiter = self._get_limiter(request_uri)
+        if (limiter is not None):
+            limiter.acquire(method)
+        start = time.monotonic()
+        if (self._pool is not None):
+            result = self._pool.request(method, request_uri, body, headers)
+        else:
+            self._conn.request(method, request_uri, body, headers)
+            response = self._conn.getresponse()
+            result = {'status': response.status, 'headers': response.getheaders(),
+                      'body': response.read(), 'reason': response.reason}
+            self._conn.close()
+        latency = time.monotonic() - start
+        if (limiter is not None):
+            limiter.record_response(result['status'], latency)
+        record_http_request(method, request_uri, result['status'], latency)
         return result
 
-    def get(self, request_uri, body=None, headers=None):
-        """Perform GET request and generate response."""
-        if (self._conn is None):
-            raise TypeError("Failed to create connection instance")
+    def _perform(self, request):
+        """Sign and perform CORTXS3ApiRequest, return (status, response)."""
+        if (request is None):
+            return False, None
+        headers = request.sign(self.s3_util)
         if (headers is None):
-            headers = {
-                "Content-type": "application/x-www-form-urlencoded",
-                "Accept": "text/plain"}
+            return False, None
+        try:
+            response = self._request(request.method, request.get_absolute_uri(),
+                                     request.body, headers)
+        except Exception as ex:
+            return request.get_exception_response(ex)
+        return request.get_response(response)
 
-        self._conn.request('GET', request_uri, body, headers)
-        response = self._conn.getresponse()
-        result = {'status': response.status, 'headers': response.getheaders(),
-                  'body': response.read(), 'reason': response.reason}
-        self._conn.close()
-        return result
+    def put(self, request_uri, body=None, headers=None):
+        """Perform PUT request and generate response."""
+        return self._request('PUT', request_uri, body, headers)
+
+    def get(self, request_uri, body=None, headers=None):
+        """Perform GET request and generate response."""
+        return self._request('GET', request_uri, body, headers)
 
     def delete(self, request_uri, body=None, headers=None):
         """Perform DELETE request and generate response."""
-        if (self._conn is None):
-            raise TypeError("Failed to create connection instance")
-        if (headers is None):
-            headers = {
-                "Content-type": "application/x-www-form-urlencoded",
-                "Accept": "text/plain"}
-
-        self._conn.request('DELETE', request_uri, body, headers)
-        response = self._conn.getresponse()
-        result = {'status': response.status, 'headers': response.getheaders(),
-                  'body': response.read(), 'reason': response.reason}
-        self._conn.close()
-        return result
+        return self._request('DELETE', request_uri, body, headers)
 
     def head(self, request_uri, body=None, headers=None):
         """Perform HEAD request and generate response."""
-        if (self._conn is None):
-            raise TypeError("Failed to create connection instance")
-        if (headers is None):
-            headers = {
-                "Content-type": "application/x-www-form-urlencoded",
-                "Accept": "text/plain"}
-
-        self._conn.request('HEAD', request_uri, body, headers)
-        response = self._conn.getresponse()
-        result = {'status': response.status, 'headers': response.getheaders(),
-                  'body': response.read(), 'reason': response.reason}
-        self._conn.close()
-        return result
-
+        return self._request('HEAD', request_uri, body, headers)
+
+    def _bulk(self, operation, items, max_workers=None):
+        """
+        Perform operation(api, item) for every item, return results in item order.
+
+        There are no batch endpoints on the server, so requests are pipelined
+        over the pooled keep-alive connections from a few worker threads.
+        """
+        items = list(items)
+        if (self._pool is None or len(items) <= 1):
+            # Injected connection can not be shared between threads.
+            return [operation(self, item) for item in items]
+        if (max_workers is None):
+            max_workers = self._config.get_bulk_request_concurrency()
+        if (max_workers <= 1):
+            return [operation(self, item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: operation(self, item), items))
@@ -25,6 +25,7 @@ import shutil
 import logging
 import yaml
 import uuid
+from collections import namedtuple
 
 from s3backgrounddelete.cortx_cluster_config import CipherInvalidToken
 from s3confstore.cortx_s3_confstore import S3CortxConfStore
@@ -36,6 +37,106 @@ except (ModuleNotFoundError, ImportError):
     # Cort-utils will not be installed in dev VM's
     pass
 
+
+def _to_bool(value):
+    """Return True if value is "true" in any case."""
+    return str(value).lower() == "true"
+
+
+def _to_daemon_mode(value):
+    """Return value as is if it is false, else daemon mode True."""
+    return value if not value else True
+
+
+def _to_positive_int(value):
+    """Return value as int of at least 1."""
+    return max(1, int(value))
+
+
+# (attribute, confstore key, conversion or None, default) of every setting.
+# Conversion is applied once at load to values present in config file, missing
+# values take the default. A default of None leaves the error of a missing
+# required value to its getter.
+_SETTINGS = (
+    ('config_version', 'version_config>version', int, None),
+    ('processor_logger_directory', 'logconfig>processor_logger_directory', None, None),
+    ('scheduler_logger_directory', 'logconfig>scheduler_logger_directory', None, None),
+    ('scheduler_logger_name', 'logconfig>scheduler_logger_name', None, None),
+    ('processor_logger_name', 'logconfig>processor_logger_name', None, None),
+    ('file_log_level', 'logconfig>file_log_level', None, None),
+    ('max_log_size_mb', 'logconfig>max_log_size_mb', int, None),
+    ('backup_count', 'logconfig>backup_count', int, None),
+    ('record_log_sample_rate', 'logconfig>record_log_sample_rate', int, 100),
+    ('cortx_s3_endpoint', 'cortx_s3>endpoint', None, None),
+    ('cortx_s3_endpoint_for_consumer', 'cortx_s3>consumer_endpoint', None, None),
+    ('cortx_s3_endpoint_for_producer', 'cortx_s3>producer_endpoint', None, None),
+    ('cortx_s3_service', 'cortx_s3>service', None, None),
+    ('cortx_s3_region', 'cortx_s3>default_region', None, None),
+    ('connection_pool_size', 'cortx_s3>connection_pool_size', int, 8),
+    ('bulk_request_concurrency', 'cortx_s3>bulk_request_concurrency', int, 8),
+    ('consumer_requests_per_sec', 'cortx_s3>consumer_requests_per_sec', float, 0),
+    ('consumer_deletes_per_sec', 'cortx_s3>consumer_deletes_per_sec', float, 0),
+    ('producer_requests_per_sec', 'cortx_s3>producer_requests_per_sec', float, 0),
+    ('producer_deletes_per_sec', 'cortx_s3>producer_deletes_per_sec', float, 0),
+    ('consumer_index_requests_per_sec', 'cortx_s3>consumer_index_requests_per_sec', float, 0),
+    ('consumer_index_deletes_per_sec', 'cortx_s3>consumer_index_deletes_per_sec', float, 0),
+    ('consumer_object_requests_per_sec', 'cortx_s3>consumer_object_requests_per_sec', float, 0),
+    ('consumer_object_deletes_per_sec', 'cortx_s3>consumer_object_deletes_per_sec', float, 0),
+    ('producer_index_requests_per_sec', 'cortx_s3>producer_index_requests_per_sec', float, 0),
+    ('producer_index_deletes_per_sec', 'cortx_s3>producer_index_deletes_per_sec', float, 0),
+    ('producer_object_requests_per_sec', 'cortx_s3>producer_object_requests_per_sec', float, 0),
+    ('producer_object_deletes_per_sec', 'cortx_s3>producer_object_deletes_per_sec', float, 0),
+    ('adaptive_throttling', 'cortx_s3>adaptive_throttling', _to_bool, False),
+    ('throttle_latency_ms', 'cortx_s3>throttle_latency_ms', int, 500),
+    ('connection_idle_timeout', 'cortx_s3>connection_idle_timeout', int, 60),
+    ('daemon_mode', 'cortx_s3>daemon_mode', _to_daemon_mode, None),
+    ('schedule_interval', 'cortx_s3>scheduler_schedule_interval', int, None),
+    ('messaging_platform', 'cortx_s3>messaging_platform', None, None),
+    ('metrics_producer_port', 'metrics>producer_http_port', int, 0),
+    ('metrics_consumer_port', 'metrics>consumer_http_port', int, 0),
+    ('statsd_enabled', 'metrics>statsd_enabled', _to_bool, False),
+    ('statsd_host', 'metrics>statsd_host', None, "127.0.0.1"),
+    ('statsd_port', 'metrics>statsd_port', int, 8125),
+    ('statsd_prefix', 'metrics>statsd_prefix', None, "s3backgrounddelete"),
+    ('statsd_flush_interval', 'metrics>statsd_flush_interval', int, 10),
+    ('probable_delete_index_id', 'indexid>probable_delete_index_id', None, None),
+    ('max_keys', 'indexid>max_keys', int, None),
+    ('resume_marker_file', 'indexid>resume_marker_file', None, None),
+    ('threshold', 'indexid>threshold', int, None),
+    ('global_instance_index_id', 'indexid>global_instance_index_id', None, None),
+    ('instance_cache_ttl', 'indexid>instance_cache_ttl', int, 60),
+    ('global_bucket_index_id', 'indexid>global_bucket_index_id', None, None),
+    ('bucket_metadata_index_id', 'indexid>bucket_metadata_index_id', None, None),
+    ('leak_processing_delay_in_mins', 'leakconfig>leak_processing_delay_in_mins', int, None),
+    ('version_processing_delay_in_mins', 'leakconfig>version_processing_delay_in_mins', int, None),
+    ('cleanup_enabled', 'leakconfig>cleanup_enabled', None, None),
+    ('msgbus_topic', 'message_bus>topic', None, None),
+    ('msgbus_consumer_group', 'message_bus>consumer_group', None, None),
+    ('msgbus_consumer_id_prefix', 'message_bus>consumer_id_prefix', None, None),
+    ('msgbus_consumer_sleep_time', 'message_bus>consumer_sleep', int, None),
+    ('msgbus_consumer_min_sleep_ms', 'message_bus>consumer_min_sleep_ms', int, 50),
+    ('msgbus_consumer_receive_timeout', 'message_bus>consumer_receive_timeout', float, 0.5),
+    ('msgbus_consumer_journal_file', 'message_bus>consumer_journal_file', None, None),
+    ('msgbus_consumer_journal_ttl', 'message_bus>consumer_journal_ttl', int, 3600),
+    ('msgbus_consumer_journal_retry_ttl', 'message_bus>consumer_journal_retry_ttl', int, 300),
+    ('msgbus_consumer_journal_slots', 'message_bus>consumer_journal_slots', int, 65536),
+    ('msgbus_consumer_workers', 'message_bus>consumer_workers', _to_positive_int, 1),
+    # Default of 2 * consumer workers is filled in by _load_settings.
+    ('msgbus_consumer_max_inflight', 'message_bus>consumer_max_inflight', _to_positive_int, None),
+    ('msgbus_consumer_processes', 'message_bus>consumer_processes', _to_positive_int, 1),
+    ('msgbus_producer_id', 'message_bus>producer_id', None, None),
+    ('msgbus_producer_batch_size', 'message_bus>producer_batch_size', _to_positive_int, 1),
+    ('msgbus_producer_batch_linger_ms', 'message_bus>producer_batch_linger_ms', int, 0),
+    ('msgbus_producer_delivery_mechanism', 'message_bus>producer_delivery_mechanism', None, None),
+    ('msgbus_producer_enqueue_mode', 'message_bus>producer_enqueue_mode', None, "purge"),
+    ('msgbus_incremental_resend_interval', 'message_bus>incremental_resend_interval', int, 3600),
+    ('msgbus_admin_id', 'message_bus>admin_id', None, None),
+    ('purge_sleep_time', 'message_bus>purge_sleep', int, None),
+)
+
+# Immutable settings of one load of config file, values already converted.
+CORTXS3Settings = namedtuple('CORTXS3Settings', [setting[0] for setting in _SETTINGS])
+
 class CORTXS3Config(object):
     """Configuration for s3 background delete."""
     _config = None
@@ -49,10 +150,14 @@ class CORTXS3Config(object):
         if os.path.isfile(os.path.join(base_cfg_path,"s3/s3backgrounddelete/config.yaml")):
             # Load config.yaml file through confstore.
             bgdelete_conf_file = cfg_type + os.path.join(base_cfg_path,"s3/s3backgrounddelete/config.yaml")
+            self._conf_url = bgdelete_conf_file
             if self.s3confstore is None:
                 self.s3confstore = S3CortxConfStore(config=bgdelete_conf_file, index= str(uuid.uuid1()))
         else:
             self._load_and_fetch_config()
+            self._conf_url = self._conf_file
+        # Getters return attributes of these settings, read and converted once.
+        self._settings = self._load_settings(self.s3confstore)
         if log_init:
           Log.init(self.get_scheduler_logger_name(),
                    self.get_scheduler_logger_directory(),
@@ -97,6 +202,50 @@ class CORTXS3Config(object):
         self._conf_file ='yaml://' + self._conf_file
         self.s3confstore = S3CortxConfStore(config=self._conf_file, index= str(uuid.uuid1()))
         
+    @staticmethod
+    def _load_settings(s3confstore):
+        """Return CORTXS3Settings of confstore or ValueError if a value is malformed."""
+        values = {}
+        for attribute, key, conversion, default in _SETTINGS:
+            value = s3confstore.get_config(key)
+            if value is None:
+                value = default
+            elif conversion is not None:
+                try:
+                    value = conversion(value)
+                except (TypeError, ValueError):
+                    raise ValueError("Could not parse " + key + " from config file")
+            values[attribute] = value
+        if values['msgbus_consumer_max_inflight'] is None:
+            # Default value used for S/W update
+            values['msgbus_consumer_max_inflight'] = 2 * values['msgbus_consumer_workers']
+        return CORTXS3Settings(**values)
+
+    def get_settings(self):
+        """
+        Return current CORTXS3Settings, a new object after every reload. Holders
+        of values derived from settings compare it to rebuild them on reload.
+        """
+        return self._settings
+
+    def reload(self):
+        """
+        Re-read config file and swap in its settings as a whole, keep current
+        settings if it can not be parsed. Signing credentials and rate limits
+        follow on next request; endpoints, connection pool size, idle timeout,
+        consumer workers and log files need a restart.
+        """
+        s3confstore = S3CortxConfStore(config=self._conf_url, index= str(uuid.uuid1()))
+        try:
+            settings = self._load_settings(s3confstore)
+        except ValueError as ex:
+            Log.error(str(ex) + ", keeping current settings")
+            return
+        self.cache_credentials()
+        self.s3confstore = s3confstore
+        # Single reference swap, readers see either old or new settings, never a mix.
+        self._settings = settings
+
     def generate_key(self, config, use_base64, key_len, const_key):
         s3cipher = CortxS3Cipher(config, use_base64, key_len, const_key)
         return s3cipher.generate_key()
@@ -114,116 +263,57 @@ class CORTXS3Config(object):
             self.s3bgd_secret_key = None
             Log.info("S3cipher failed due to "+ str(err) +". Using credentails from config file")
 
+    def _required(self, value, description):
+        """Return value or KeyError if it is missing from config file."""
+        if value is None:
+            raise KeyError(
+                "Could not parse " + description + " from config file " +
+                str(self._conf_url))
+        return value
+
     def get_config_version(self):
         """Return version of S3 background delete config file or KeyError."""
-        try:
-          config_version = self.s3confstore.get_config('version_config>version')
-          return int(config_version)
-        except:
-            raise KeyError("Could not parse version from config file " + self._conf_file)
+        return self._required(self._settings.config_version, "version")
 
     def get_processor_logger_directory(self):
-        """Return logger directory path for background delete from config file or KeyError."""
-        try:
-          log_directory = self.s3confstore.get_config('logconfig>processor_logger_directory')
-          return log_directory
-        except:
-            raise KeyError(
-                "Could not parse logger directory path from config file " +
-                self._conf_file)
-
+        """Return logger directory path for background delete from config file."""
+        return self._settings.processor_logger_directory
 
     def get_scheduler_logger_directory(self):
-        """Return logger directory path for background delete from config file or KeyError."""
-        try:
-          log_directory = self.s3confstore.get_config('logconfig>scheduler_logger_directory')
-          return log_directory
-        except:
-            raise KeyError(
-                "Could not parse logger directory path from config file " +
-                self._conf_file)
+        """Return logger directory path for background delete from config file."""
+        return self._settings.scheduler_logger_directory
 
     def get_scheduler_logger_name(self):
-        """Return logger name for scheduler from config file or KeyError."""
-        try:
-          scheduler_log_name = self.s3confstore.get_config('logconfig>scheduler_logger_name')
-          return scheduler_log_name
-        except:
-            raise KeyError(
-                "Could not parse scheduler loggername from config file " +
-                self._conf_file)
+        """Return logger name for scheduler from config file."""
+        return self._settings.scheduler_logger_name
 
     def get_processor_logger_name(self):
-        """Return logger name for processor from config file or KeyError."""
-        try:
-          processor_log_name = self.s3confstore.get_config('logconfig>processor_logger_name')
-          return processor_log_name
-        except:
-            raise KeyError(
-                "Could not parse processor loggername from config file " +
-                self._conf_file)
+        """Return logger name for processor from config file."""
+        return self._settings.processor_logger_name
 
     def get_file_log_level(self):
-        """Return file log level from config file or KeyError."""
-        try:
-          log_level = self.s3confstore.get_config('logconfig>file_log_level')
-          return log_level
-        except:
-            raise KeyError(
-                "Could not parse file loglevel from config file " +
-                self._conf_file)
+        """Return file log level from config file."""
+        return self._settings.file_log_level
 
     def get_cortx_s3_endpoint(self):
-        """Return endpoint from config file or KeyError."""
-        try:
-            cortx_s3_endpoint = self.s3confstore.get_config('cortx_s3>endpoint')
-            return cortx_s3_endpoint
-        except:
-            raise KeyError(
-                "Could not find cortx_s3 endpoint from config file " +
-                self._conf_file)
+        """Return endpoint from config file."""
+        return self._settings.cortx_s3_endpoint
 
     def get_cortx_s3_endpoint_for_consumer(self):
-        """Return endpoint from config file or KeyError."""
-        try:
-            #change from cortx_s3>endpoint to cortx_s3>consumer_endpoint
-            cortx_s3_endpoint = self.s3confstore.get_config('cortx_s3>consumer_endpoint')
-            return cortx_s3_endpoint
-        except:
-            raise KeyError(
-                "Could not find cortx_s3 endpoint from config file " +
-                self._conf_file)
+        """Return consumer endpoint from config file."""
+        return self._settings.cortx_s3_endpoint_for_consumer
 
     def get_cortx_s3_endpoint_for_producer(self):
-        """Return endpoint from config file or KeyError."""
-        try:
-            #change from cortx_s3>endpoint to cortx_s3>producer_endpoint
-            cortx_s3_endpoint = self.s3confstore.get_config('cortx_s3>producer_endpoint')
-            return cortx_s3_endpoint
-        except:
-            raise KeyError(
-                "Could not find cortx_s3 endpoint from config file " +
-                self._conf_file)
+        """Return producer endpoint from config file."""
+        return self._settings.cortx_s3_endpoint_for_producer
 
     def get_cortx_s3_service(self):
-        """Return service from config file or KeyError."""
-        try:
-          cortx_s3_service = self.s3confstore.get_config('cortx_s3>service')
-          return cortx_s3_service
-        except:
-            raise KeyError(
-                "Could not find cortx_s3 service from config file " +
-                self._conf_file)
+        """Return service from config file."""
+        return self._settings.cortx_s3_service
 
     def get_cortx_s3_region(self):
-        """Return region from config file or KeyError."""
-        try:
-          cortx_s3_region = self.s3confstore.get_config('cortx_s3>default_region')
-          return cortx_s3_region
-        except:
-            raise KeyError(
-                "Could not find cortx_s3 default_region from config file " +
-                self._conf_file)
+        """Return region from config file."""
+        return self._settings.cortx_s3_region
 
     def get_cortx_s3_access_key(self):
         """Return access_key cipher or config file or KeyError."""
@@ -241,122 +331,179 @@ class CORTXS3Config(object):
         raise KeyError(
             "Could not find s3bgd_secret_key")
 
+    def get_connection_pool_size(self):
+        """Return max keep-alive connections per endpoint from config file or default."""
+        return self._settings.connection_pool_size
+
+    def get_bulk_request_concurrency(self):
+        """Return number of concurrent requests used by bulk KV/object operations or default."""
+        return self._settings.bulk_request_concurrency
+
+    def get_consumer_requests_per_sec(self):
+        """Return max requests per second sent to consumer endpoint, 0 for unlimited."""
+        return self._settings.consumer_requests_per_sec
+
+    def get_consumer_deletes_per_sec(self):
+        """Return max delete requests per second sent to consumer endpoint, 0 for unlimited."""
+        return self._settings.consumer_deletes_per_sec
+
+    def get_producer_requests_per_sec(self):
+        """Return max requests per second sent to producer endpoint, 0 for unlimited."""
+        return self._settings.producer_requests_per_sec
+
+    def get_producer_deletes_per_sec(self):
+        """Return max delete requests per second sent to producer endpoint, 0 for unlimited."""
+        return self._settings.producer_deletes_per_sec
+
+    def get_consumer_index_requests_per_sec(self):
+        """Return max requests per second sent by consumer to /indexes, 0 for consumer_requests_per_sec."""
+        return self._settings.consumer_index_requests_per_sec
+
+    def get_consumer_index_deletes_per_sec(self):
+        """Return max delete requests per second sent by consumer to /indexes, 0 for consumer_deletes_per_sec."""
+        return self._settings.consumer_index_deletes_per_sec
+
+    def get_consumer_object_requests_per_sec(self):
+        """Return max requests per second sent by consumer to /objects, 0 for consumer_requests_per_sec."""
+        return self._settings.consumer_object_requests_per_sec
+
+    def get_consumer_object_deletes_per_sec(self):
+        """Return max delete requests per second sent by consumer to /objects, 0 for consumer_deletes_per_sec."""
+        return self._settings.consumer_object_deletes_per_sec
+
+    def get_producer_index_requests_per_sec(self):
+        """Return max requests per second sent by producer to /indexes, 0 for producer_requests_per_sec."""
+        return self._settings.producer_index_requests_per_sec
+
+    def get_producer_index_deletes_per_sec(self):
+        """Return max delete requests per second sent by producer to /indexes, 0 for producer_deletes_per_sec."""
+        return self._settings.producer_index_deletes_per_sec
+
+    def get_producer_object_requests_per_sec(self):
+        """Return max requests per second sent by producer to /objects, 0 for producer_requests_per_sec."""
+        return self._settings.producer_object_requests_per_sec
+
+    def get_producer_object_deletes_per_sec(self):
+        """Return max delete requests per second sent by producer to /objects, 0 for producer_deletes_per_sec."""
+        return self._settings.producer_object_deletes_per_sec
+
+    def get_adaptive_throttling(self):
+        """Return True if rates are lowered while s3server is slow or failing."""
+        return self._settings.adaptive_throttling
+
+    def get_throttle_latency_ms(self):
+        """Return response latency in ms above which rates are lowered or default."""
+        return self._settings.throttle_latency_ms
+
+    def get_connection_idle_timeout(self):
+        """Return idle time in seconds after which pooled connection is dropped or default."""
+        return self._settings.connection_idle_timeout
+
+    def get_metrics_producer_port(self):
+        """Return local port of producer /metrics endpoint, 0 if disabled."""
+        return self._settings.metrics_producer_port
+
+    def get_metrics_consumer_port(self):
+        """Return local port of first consumer /metrics endpoint, 0 if disabled."""
+        return self._settings.metrics_consumer_port
+
+    def get_statsd_enabled(self):
+        """Return True if metrics are pushed to statsd."""
+        return self._settings.statsd_enabled
+
+    def get_statsd_host(self):
+        """Return statsd host or default."""
+        return self._settings.statsd_host
+
+    def get_statsd_port(self):
+        """Return statsd UDP port or default of s3statsd-config.js."""
+        return self._settings.statsd_port
+
+    def get_statsd_prefix(self):
+        """Return prefix of metric names pushed to statsd or default."""
+        return self._settings.statsd_prefix
+
+    def get_statsd_flush_interval(self):
+        """Return seconds between pushes to statsd or default."""
+        return self._settings.statsd_flush_interval
+
     def get_daemon_mode(self):
         """Return daemon_mode flag value for scheduler from config file\
            else it should return default as "True"."""
-        daemon_mode = self.s3confstore.get_config('cortx_s3>daemon_mode')
-        if not daemon_mode:
-            return daemon_mode
-        else:
-            #Return default mode as daemon mode i.e. "True"
-            return True
+        return self._settings.daemon_mode
 
     def get_schedule_interval(self):
         """Return schedule interval of object recovery scheduler from config file or KeyError."""
-        try:
-          schedule_interval = self.s3confstore.get_config('cortx_s3>scheduler_schedule_interval')
-          return int(schedule_interval)
-        except:
-            raise KeyError(
-                "Could not parse schedule interval for object recovery scheduler from config file " +
-                self._conf_file)
+        return self._required(self._settings.schedule_interval,
+                              "schedule interval for object recovery scheduler")
 
     def get_probable_delete_index_id(self):
-        """Return probable delete index-id from config file or KeyError."""
-        try:
-          probable_delete_index_id = self.s3confstore.get_config('indexid>probable_delete_index_id')
-          return probable_delete_index_id
-        except:
-            raise KeyError(
-                "Could not parse probable delete index-id from config file " +
-                self._conf_file)
+        """Return probable delete index-id from config file."""
+        return self._settings.probable_delete_index_id
 
     def get_max_keys(self):
-        """Return maximum number of keys from config file or KeyError."""
-        max_keys = self.s3confstore.get_config('indexid>max_keys')
-        if max_keys is not None:
-            return int(max_keys)
-        else:
+        """Return maximum number of keys from config file or Exception."""
+        max_keys = self._settings.max_keys
+        if max_keys is None:
             raise Exception(f'Failed to read indexid>max_keys: '
                         f'{max_keys}\n')
+        return max_keys
+
+    def get_resume_marker_file(self):
+        """Return file used to persist probable delete index listing marker or None."""
+        return self._settings.resume_marker_file
 
     def get_threshold(self):
         """Return the threshold for max."""
-        threshold = self.s3confstore.get_config('indexid>threshold')
-        if threshold is not None:
-            return int(threshold)
-        else:
+        threshold = self._settings.threshold
+        if threshold is None:
             raise Exception(f'Failed to read indexid>threshold: '
                         f'{threshold}\n')
-                        
+        return threshold
 
     def get_global_instance_index_id(self):
-        """Return probable delete index-id from config file or KeyError."""
-        try:
-          global_instance_index_id = self.s3confstore.get_config('indexid>global_instance_index_id')
-          return global_instance_index_id
-        except:
-            raise KeyError(
-                "Could not parse global instance index-id from config file " +
-                self._conf_file)
+        """Return global instance index-id from config file."""
+        return self._settings.global_instance_index_id
+
+    def get_instance_cache_ttl(self):
+        """Return seconds for which active instance ids listed from global instance index are cached or default."""
+        return self._settings.instance_cache_ttl
 
     def get_max_log_size_mb(self):
         """Return maximum log size in mb for a log file"""
-        try:
-          max_log_size_mb = self.s3confstore.get_config('logconfig>max_log_size_mb')
-          return int(max_log_size_mb)
-        except:
-            raise KeyError(
-                "Could not parse max log size in mb from config file " +
-                self._conf_file)
+        return self._required(self._settings.max_log_size_mb, "max log size in mb")
 
     def get_backup_count(self):
         """Return count of log files"""
-        try:
-          backup_count = self.s3confstore.get_config('logconfig>backup_count')
-          return int(backup_count)
-        except:
-            raise KeyError(
-                "Could not parse backupcount from config file " +
-                self._conf_file)
+        return self._required(self._settings.backup_count, "backupcount")
+
+    def get_record_log_sample_rate(self):
+        """Return N, INFO messages of one of every N records are logged, or default."""
+        return self._settings.record_log_sample_rate
 
     def get_leak_processing_delay_in_mins(self):
         """Return 'leak_processing_delay_in_mins' from 'leakconfig' section """
-        leak_processing_delay_in_mins = self.s3confstore.get_config('leakconfig>leak_processing_delay_in_mins')
-        if leak_processing_delay_in_mins is not None:
-            return int(leak_processing_delay_in_mins)
-        else:
+        leak_processing_delay_in_mins = self._settings.leak_processing_delay_in_mins
+        if leak_processing_delay_in_mins is None:
             raise Exception(f'Failed to read leakconfig>leak_processing_delay_in_mins: '
                         f'{leak_processing_delay_in_mins}\n')
+        return leak_processing_delay_in_mins
 
     def get_version_processing_delay_in_mins(self):
         """Return 'version_processing_delay_in_mins' from 'leakconfig' section """
-        version_processing_delay_in_mins = self.s3confstore.get_config('leakconfig>version_processing_delay_in_mins')
-        if version_processing_delay_in_mins is not None:
-            return int(version_processing_delay_in_mins)
-        else:
+        version_processing_delay_in_mins = self._settings.version_processing_delay_in_mins
+        if version_processing_delay_in_mins is None:
             raise Exception(f'Failed to read leakconfig>version_processing_delay_in_mins: '
                         f'{version_processing_delay_in_mins}\n')
+        return version_processing_delay_in_mins
 
     def get_global_bucket_index_id(self):
-        """Return probable delete index-id from config file or KeyError."""
-        try:
-          global_bucket_index_id = self.s3confstore.get_config('indexid>global_bucket_index_id')
-          return global_bucket_index_id
-        except:
-            raise KeyError(
-                "Could not parse global_bucket index-id from config file " +
-                self._conf_file)
+        """Return global bucket index-id from config file."""
+        return self._settings.global_bucket_index_id
 
     def get_bucket_metadata_index_id(self):
-        """Return probable delete index-id from config file or KeyError."""
-        try:
-          bucket_metadata_index_id = self.s3confstore.get_config('indexid>bucket_metadata_index_id')
-          return bucket_metadata_index_id
-        except:
-            raise KeyError(
-                "Could not parse bucket_metadata index_id from config file " +
-                self._conf_file)
+        """Return bucket metadata index-id from config file."""
+        return self._settings.bucket_metadata_index_id
 
     def get_s3_recovery_access_key(self):
         """Return access_key from cipher or config file or KeyError."""
@@ -373,103 +520,95 @@ class CORTXS3Config(object):
 
         raise KeyError(
                 "Could not find s3_recovery secret_key")
-        
 
     def get_cleanup_enabled(self):
         """Return flag cleanup_enabled for S3 non active"""
-        try:
-            cleanup_enabled = self.s3confstore.get_config('leakconfig>cleanup_enabled')
-            return cleanup_enabled
-        except KeyError:
-            # Default value used for S/W update
-            return False
+        return self._settings.cleanup_enabled
 
     def get_messaging_platform(self):
-        """Return use_msgbus from config file or False"""
-        try:
-          messaging_platform = self.s3confstore.get_config('cortx_s3>messaging_platform')
-          return messaging_platform
-        except:
-            raise KeyError(
-                "Could not parse messaging_platform from config file " +
-                self._conf_file)
+        """Return messaging_platform from config file."""
+        return self._settings.messaging_platform
 
     def get_msgbus_topic(self):
-        """Return topic of msgbus from config file or KeyError."""
-        try:
-          msgbus_topic = self.s3confstore.get_config('message_bus>topic')
-          return msgbus_topic
-        except:
-            raise KeyError(
-                "Could not parse topic from config file " +
-                self._conf_file)
+        """Return topic of msgbus from config file."""
+        return self._settings.msgbus_topic
 
     def get_msgbus_consumer_group(self):
-        """Return consumer group id from config file or KeyError."""
-        try:
-          msgbus_consumer_group = self.s3confstore.get_config('message_bus>consumer_group')
-          return msgbus_consumer_group
-        except:
-            raise KeyError(
-                "Could not parse consumer_group from config file " +
-                self._conf_file)
+        """Return consumer group id from config file."""
+        return self._settings.msgbus_consumer_group
 
     def get_msgbus_consumer_id_prefix(self):
-        """Return consumer id prefix from config file or KeyError."""
-        try:
-          msgbus_consumer_id_prefix = self.s3confstore.get_config('message_bus>consumer_id_prefix')
-          return msgbus_consumer_id_prefix
-        except:
-            raise KeyError(
-                "Could not parse consumer_id_prefix from config file " +
-                self._conf_file)
+        """Return consumer id prefix from config file."""
+        return self._settings.msgbus_consumer_id_prefix
 
     def get_msgbus_consumer_sleep_time(self):
         """Return consumer sleep time from config file or KeyError."""
-        try:
-          msgbus_consumer_sleep_time = self.s3confstore.get_config('message_bus>consumer_sleep')
-          return int(msgbus_consumer_sleep_time)
-        except:
-            raise KeyError(
-                "Could not parse consumer_sleep from config file " +
-                self._conf_file)
+        return self._required(self._settings.msgbus_consumer_sleep_time, "consumer_sleep")
+
+    def get_msgbus_consumer_min_sleep_ms(self):
+        """Return first backoff sleep in ms after an empty receive or default."""
+        return self._settings.msgbus_consumer_min_sleep_ms
+
+    def get_msgbus_consumer_receive_timeout(self):
+        """Return seconds a receive waits for a message or default."""
+        return self._settings.msgbus_consumer_receive_timeout
+
+    def get_msgbus_consumer_journal_file(self):
+        """Return file of journal of processed leak records or None."""
+        return self._settings.msgbus_consumer_journal_file
+
+    def get_msgbus_consumer_journal_ttl(self):
+        """Return seconds a processed leak record is skipped for or default."""
+        return self._settings.msgbus_consumer_journal_ttl
+
+    def get_msgbus_consumer_journal_retry_ttl(self):
+        """Return seconds a leak record whose leak entry was not deleted is skipped for or default."""
+        return self._settings.msgbus_consumer_journal_retry_ttl
+
+    def get_msgbus_consumer_journal_slots(self):
+        """Return number of leak records kept in journal or default."""
+        return self._settings.msgbus_consumer_journal_slots
+
+    def get_msgbus_consumer_workers(self):
+        """Return number of records processed concurrently by consumer or default."""
+        return self._settings.msgbus_consumer_workers
+
+    def get_msgbus_consumer_max_inflight(self):
+        """Return max records received but not yet acknowledged by consumer or default."""
+        return self._settings.msgbus_consumer_max_inflight
+
+    def get_msgbus_consumer_processes(self):
+        """Return number of consumer processes, i.e. consumer group members, per node or default."""
+        return self._settings.msgbus_consumer_processes
 
     def get_msgbus_producer_id(self):
-        """Return producer_id prefix from config file or KeyError."""
-        try:
-          msgbus_producer_id = self.s3confstore.get_config('message_bus>producer_id')
-          return msgbus_producer_id
-        except:
-            raise KeyError(
-                "Could not parse producer_id from config file " +
-                self._conf_file)
+        """Return producer_id prefix from config file."""
+        return self._settings.msgbus_producer_id
+
+    def get_msgbus_producer_batch_size(self):
+        """Return max records coalesced into one message bus send or default."""
+        return self._settings.msgbus_producer_batch_size
+
+    def get_msgbus_producer_batch_linger_ms(self):
+        """Return max time in ms a record waits in a partial batch or default."""
+        return self._settings.msgbus_producer_batch_linger_ms
 
     def get_msgbus_producer_delivery_mechanism(self):
-        """Return producer delivery mechanism from config file or KeyError."""
-        try:
-          msgbus_producer_delivery_mechanism = self.s3confstore.get_config('message_bus>producer_delivery_mechanism')
-          return msgbus_producer_delivery_mechanism
-        except:
-            raise KeyError(
-                "Could not parse producer_delivery_mechanism from config file " +
-                self._conf_file)
+        """Return producer delivery mechanism from config file."""
+        return self._settings.msgbus_producer_delivery_mechanism
+
+    def get_msgbus_producer_enqueue_mode(self):
+        """Return producer enqueue mode 'purge' or 'incremental' from config file or default."""
+        return self._settings.msgbus_producer_enqueue_mode
+
+    def get_msgbus_incremental_resend_interval(self):
+        """Return seconds after which an enqueued but unprocessed record is sent again or default."""
+        return self._settings.msgbus_incremental_resend_interval
 
     def get_msgbus_admin_id(self):
-        """Return admin id from config file or KeyError."""
-        try:
-          msgbus_admin_id = self.s3confstore.get_config('message_bus>admin_id')
-          return msgbus_admin_id
-        except:
-            raise KeyError(
-                "Could not parse admin id from config file " +
-                self._conf_file)
+        """Return admin id from config file."""
+        return self._settings.msgbus_admin_id
 
     def get_purge_sleep_time(self):
         """Return purge sleep time from config file or KeyError."""
-        try:
-          msgbus_purge_sleep = self.s3confstore.get_config('message_bus>purge_sleep')
-          return int(msgbus_purge_sleep)
-        except:
-            raise KeyError(
-                "Could not parse purge sleep from config file " +
-                self._conf_file)
+        return self._required(self._settings.purge_sleep_time, "purge sleep")
@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""This is a bounded HTTP/1.1 keep-alive connection pool shared per endpoint."""
+
+import collections
+import http.client
+import threading
+import time
+
+# Errors raised by http.client when a kept-alive connection was closed by
+# the peer in between two requests. The request is retried once on a fresh
+# connection when one of these is seen.
+_STALE_CONNECTION_ERRORS = (
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine)
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_IDLE_TIMEOUT = 60
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class CORTXS3ConnectionPool(object):
+    """Keeps up to max_size persistent connections open to one endpoint."""
+
+    def __init__(self, netloc, max_size=DEFAULT_POOL_SIZE,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, connection_factory=None):
+        """Initialise pool for endpoint netloc i.e. 'host:port'."""
+        self._netloc = netloc
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        if (connection_factory is None):
+            self._connection_factory = lambda: http.client.HTTPConnection(netloc)
+        else:
+            self._connection_factory = connection_factory
+        # Idle connections as (connection, last_used) in LIFO order, so the
+        # most recently used (and least likely to be timed out) goes first.
+        self._idle = collections.deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._metrics = {
+            'created': 0,
+            'reused': 0,
+            'reconnects': 0,
+            'evicted_idle': 0,
+            'discarded': 0,
+            'requests': 0,
+            'in_use': 0}
+
+    def get_netloc(self):
+        """Return endpoint served by this pool."""
+        return self._netloc
+
+    def get_metrics(self):
+        """Return a snapshot of the pool counters."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['idle'] = len(self._idle)
+        return metrics
+
+    def _borrow(self):
+        """Return an idle connection or a new one, evicting expired ones."""
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if (now - last_used) <= self._idle_timeout:
+                    self._metrics['reused'] += 1
+                    self._metrics['in_use'] += 1
+                    return conn
+                self._metrics['evicted_idle'] += 1
+                conn.close()
+            self._metrics['created'] += 1
+            self._metrics['in_use'] += 1
+        return self._connection_factory()
+
+    def _release(self, conn, reusable):
+        """Hand connection back to the pool or close it."""
+        with self._lock:
+            self._metrics['in_use'] -= 1
+            if reusable:
+                self._idle.append((conn, time.monotonic()))
+                return
+            self._metrics['discarded'] += 1
+        conn.close()
+
+    def _new_connection(self):
+        """Replace a broken connection by a fresh one."""
+        with self._lock:
+            self._metrics['reconnects'] += 1
+            self._metrics['created'] += 1
+        return self._connection_factory()
+
+    def request(self, method, request_uri, body=None, headers=None):
+        """Perform request on a pooled connection and generate response."""
+        self._slots.acquire()
+        try:
+            conn = self._borrow()
+            reusable = False
+            try:
+                try:
+                    response = self._send(conn, method, request_uri, body, headers)
+                except _STALE_CONNECTION_ERRORS:
+                    # Server closed the idle connection, retry on a new one.
+                    conn.close()
+                    conn = self._new_connection()
+                    response = self._send(conn, method, request_uri, body, headers)
+                result = {'status': response.status, 'headers': response.getheaders(),
+                          'body': response.read(), 'reason': response.reason}
+                reusable = not response.will_close
+            finally:
+                self._release(conn, reusable)
+        finally:
+            self._slots.release()
+        return result
+
+    def _send(self, conn, method, request_uri, body, headers):
+        """Send a request and return the response object."""
+        with self._lock:
+            self._metrics['requests'] += 1
+        conn.request(method, request_uri, body, headers)
+        return conn.getresponse()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                conn.close()
+
+
+def get_connection_pool(netloc, max_size=DEFAULT_POOL_SIZE,
+                        idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """Return the process wide connection pool for endpoint netloc."""
+    with _pools_lock:
+        pool = _pools.get(netloc)
+        if (pool is None):
+            pool = CORTXS3ConnectionPool(netloc, max_size, idle_timeout)
+            _pools[netloc] = pool
+        return pool
+
+
+def get_all_pool_metrics():
+    """Return metrics of every pool keyed by endpoint."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.get_netloc(): pool.get_metrics() for pool in pools}
+
+
+def close_all_pools():
+    """Close idle connections of every pool and forget the pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -20,13 +20,12 @@
 """This class provides Index  REST API i.e. List, PUT."""
 
 import logging
-import urllib
+from concurrent.futures import ThreadPoolExecutor
 
-from s3backgrounddelete.cortx_list_index_response import CORTXS3ListIndexResponse
 from s3backgrounddelete.cortx_s3_client import CORTXS3Client
-from s3backgrounddelete.cortx_s3_error_respose import CORTXS3ErrorResponse
-from s3backgrounddelete.cortx_s3_success_response import CORTXS3SuccessResponse
 from s3backgrounddelete.cortx_s3_util import CORTXS3Util
+from s3backgrounddelete.cortx_s3_api_request import index_list_request, \
+    index_put_request, index_delete_request, index_head_request
 from cortx.utils.log import Log
 #from s3backgrounddelete.IEMutil import IEMutil
 
@@ -50,197 +49,66 @@ class CORTXS3IndexApi(CORTXS3Client):
 
     def list(self, index_id, max_keys=1000, next_marker=None, additional_Query_params=None):
         """Perform LIST request and generate response."""
-        if index_id is None:
-            Log.error("Index Id is required.")
+        request = index_list_request(index_id, max_keys, next_marker, additional_Query_params)
+        if request is None:
             return False, None
 
         Log.info("Processing request in IndexAPI")
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if index_id is 'AAAAAAAAAHg=-AwAQAAAAAAA=' urllib.parse.quote(index_id, safe='') yields 'AAAAAAAAAHg%3D-AwAQAAAAAAA%3D'
-        # And request_uri is '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D'
-
-        request_uri = '/indexes/' + urllib.parse.quote(index_id, safe='')
-        query_params = ""
-        inputQueryParams = {}
-        inputQueryParams["max-keys"] = max_keys
-        if (next_marker is not None):
-            inputQueryParams["marker"] = next_marker
-
-        if (additional_Query_params is not None and isinstance(additional_Query_params, dict)):
-            # Add addtional query params
-            inputQueryParams.update(additional_Query_params)
-
-        #Generate sorted urlencoded query params into query_params
-        for key in sorted(inputQueryParams.keys()):
-            d = {}
-            d[key] = inputQueryParams[key]
-            if (query_params == ""):
-                query_params += urllib.parse.urlencode(d)
-            else:
-                query_params += "&" + urllib.parse.urlencode(d)
-
-        absolute_request_uri = request_uri + '?' + query_params
-
-        body = ""
-        headers = self.s3_util.prepare_signed_header('GET', request_uri, query_params, body)
-
-        if(headers['Authorization'] is None):
-            Log.error("Failed to generate v4 signature")
-            return False, None
+        return self._perform(request)
+
+    @staticmethod
+    def is_truncated(index_content):
+        """Return True if listing content has more keys after NextMarker."""
+        is_truncated = index_content.get("IsTruncated")
+        return is_truncated is True or str(is_truncated).lower() == "true"
+
+    def list_pages(self, index_id, max_keys=1000, next_marker=None,
+                   additional_Query_params=None, prefetch=True):
+        """
+        Generator over all listing pages of an index, following NextMarker.
+
+        Yields (True, CORTXS3ListIndexResponse) per page, or a single
+        (False, error response) if a listing fails. With prefetch, request for
+        the next page is sent from a helper thread while caller works on
+        the current one, so this instance must not be used concurrently
+        by the caller while walking.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
         try:
-            response = super(
-                CORTXS3IndexApi,
-                self).get(
-                absolute_request_uri,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 200:
-            Log.info('Successfully listed Index details.')
-            return True, CORTXS3ListIndexResponse(response['body'])
-        else:
-            Log.info('Failed to list Index details.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+            if executor is not None:
+                pending = executor.submit(self.list, index_id, max_keys,
+                                          next_marker, additional_Query_params)
+            while True:
+                if executor is not None:
+                    result, index_response = pending.result()
+                else:
+                    result, index_response = self.list(index_id, max_keys,
+                                                       next_marker, additional_Query_params)
+                if not result:
+                    yield result, index_response
+                    return
+                listing_header = index_response.get_listing_header()
+                next_marker = listing_header.get("NextMarker")
+                has_more = self.is_truncated(listing_header) and bool(next_marker)
+                if has_more and executor is not None:
+                    pending = executor.submit(self.list, index_id, max_keys,
+                                              next_marker, additional_Query_params)
+                yield result, index_response
+                if not has_more:
+                    return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
     def put(self, index_id):
         """Perform PUT request and generate response."""
-        if index_id is None:
-            Log.info("Index Id is required.")
-            return False, None
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if index_id is 'AAAAAAAAAHg=-AwAQAAAAAAA=' urllib.parse.quote(index_id, safe='') yields 'AAAAAAAAAHg%3D-AwAQAAAAAAA%3D'
-        # And request_uri is '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D'
-
-        request_uri = '/indexes/' + urllib.parse.quote(index_id, safe='')
-
-        query_params = ""
-        body = ""
-        headers = self.s3_util.prepare_signed_header('PUT', request_uri, query_params, body)
-
-        if(headers['Authorization'] is None):
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3IndexApi,
-                self).put(
-                request_uri,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 201:
-            Log.info('Successfully added Index.')
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info('Failed to add Index.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+        return self._perform(index_put_request(index_id))
 
     def delete(self, index_id):
         """Perform DELETE request and generate response."""
-        if index_id is None:
-            Log.info("Index Id is required.")
-            return False, None
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if index_id is 'AAAAAAAAAHg=-AwAQAAAAAAA=' urllib.parse.quote(index_id, safe='') yields 'AAAAAAAAAHg%3D-AwAQAAAAAAA%3D'
-        # And request_uri is '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D'
-
-        request_uri = '/indexes/' + urllib.parse.quote(index_id, safe='')
-
-        query_params = ""
-        body = ""
-        headers = self.s3_util.prepare_signed_header('DELETE', request_uri, query_params, body)
-
-        if(headers['Authorization'] is None):
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3IndexApi,
-                self).delete(
-                request_uri,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 204:
-            Log.info('Successfully deleted Index.')
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info('Failed to delete Index.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+        return self._perform(index_delete_request(index_id))
 
 
     def head(self, index_id):
-            """Perform HEAD request and generate response."""
-            if index_id is None:
-                Log.error("Index id is required.")
-                return False, None
-
-            # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-            # urllib.parse.urlencode converts a mapping object or a sequence of two-element tuples, which may contain str or bytes objects, to a percent-encoded ASCII text string.
-            # https://docs.python.org/3/library/urllib.parse.html
-            # For example if oid is 'JwZSAwAAAAA=-AgAAAAAA4Ag=' urllib.parse.quote(oid, safe='') yields 'JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D'
-            # And request_uri is '/indexes/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D'
-
-            request_uri = '/indexes/' + urllib.parse.quote(index_id, safe='')
-
-            query_params = ""
-            body = ""
-            headers = self.s3_util.prepare_signed_header('HEAD', request_uri, query_params, body)
-
-            if headers['Authorization'] is None:
-                Log.error("Failed to generate v4 signature")
-                return False, None
-
-            try:
-                response = super(
-                    CORTXS3IndexApi,
-                    self).head(
-                    request_uri,
-                    body,
-                    headers=headers)
-            except ConnectionRefusedError as ex:
-                #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-                Log.error(repr(ex))
-                return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-            except Exception as ex:
-                Log.error(repr(ex))
-                return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-            if response['status'] == 200:
-                Log.info("HEAD Index called successfully with status code: "\
-                    + str(response['status']) + " response body: " + str(response['body']))
-                return True, CORTXS3SuccessResponse(response['body'])
-            else:
-                Log.info("Failed to do HEAD Index with status code: "\
-                    + str(response['status']) + " response body: " + str(response['body']))
-                return False, CORTXS3ErrorResponse(
-                    response['status'], response['reason'], response['body'])
+        """Perform HEAD request and generate response."""
+        return self._perform(index_head_request(index_id))
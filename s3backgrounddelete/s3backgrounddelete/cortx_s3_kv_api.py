@@ -19,13 +19,11 @@
 
 """This class provides Key-value REST API i.e. GET,PUT and DELETE."""
 import logging
-import urllib
 
 from s3backgrounddelete.cortx_s3_client import CORTXS3Client
-from s3backgrounddelete.cortx_get_kv_response import CORTXS3GetKVResponse
-from s3backgrounddelete.cortx_s3_error_respose import CORTXS3ErrorResponse
-from s3backgrounddelete.cortx_s3_success_response import CORTXS3SuccessResponse
 from s3backgrounddelete.cortx_s3_util import CORTXS3Util
+from s3backgrounddelete.cortx_s3_api_request import kv_put_request, \
+    kv_get_request, kv_delete_request
 from cortx.utils.log import Log
 #from s3backgrounddelete.IEMutil import IEMutil
 
@@ -46,154 +44,22 @@ class CORTXS3KVApi(CORTXS3Client):
 
     def put(self, index_id=None, object_key_name=None, value=""):
         """Perform PUT request and generate response."""
-        if index_id is None:
-            Log.error("Index Id is required.")
-            return False, None
-        if object_key_name is None:
-            Log.error("Key is required")
-            return False, None
-
-        query_params = ""
-        request_body = value
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if index_id is 'AAAAAAAAAHg=-AwAQAAAAAAA=' and object_key_name is "testobject+"
-        # urllib.parse.quote(index_id, safe='') and urllib.parse.quote(object_key_name) yields 'testobject%2B' respectively
-        # And request_uri is
-        # '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D/testobject%2B'
-
-        request_uri = '/indexes/' + \
-            urllib.parse.quote(index_id, safe='') + '/' + \
-            urllib.parse.quote(object_key_name)
-        headers = self.s3_util.prepare_signed_header('PUT', request_uri, query_params, request_body)
-
-        if(headers['Authorization'] is None):
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3KVApi,
-                self).put(
-                request_uri,
-                request_body,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-
-
-        if response['status'] == 200:
-            Log.info("Key value details added successfully.")
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info('Failed to add key value details.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+        return self._perform(kv_put_request(index_id, object_key_name, value))
 
     def get(self, index_id=None, object_key_name=None):
         """Perform GET request and generate response."""
-        if index_id is None:
-            Log.error("Index Id is required.")
-            return False, None
-        if object_key_name is None:
-            Log.error("Key is required")
-            return False, None
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if index_id is 'AAAAAAAAAHg=-AwAQAAAAAAA=' and object_key_name is "testobject+"
-        # urllib.parse.quote(index_id, safe='') and urllib.parse.quote(object_key_name) yields 'testobject%2B' respectively
-        # And request_uri is
-        # '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D/testobject%2B'
-
-        request_uri = '/indexes/' + \
-            urllib.parse.quote(index_id, safe='') + '/' + \
-            urllib.parse.quote(object_key_name)
-
-        query_params = ""
-        body = ""
-        headers = self.s3_util.prepare_signed_header('GET', request_uri, query_params, body)
-
-        if(headers['Authorization'] is None):
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3KVApi,
-                self).get(
-                request_uri,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 200:
-            Log.info("Get kv operation successfully.")
-            return True, CORTXS3GetKVResponse(
-                object_key_name, response['body'])
-        else:
-            Log.info('Failed to get kv details.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+        return self._perform(kv_get_request(index_id, object_key_name))
 
     def delete(self, index_id=None, object_key_name=None):
         """Perform DELETE request and generate response."""
-        if index_id is None:
-            Log.error("Index Id is required.")
-            return False, None
-        if object_key_name is None:
-            Log.error("Key is required")
-            return False, None
+        return self._perform(kv_delete_request(index_id, object_key_name))
 
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if index_id is 'AAAAAAAAAHg=-AwAQAAAAAAA=' and object_key_name is "testobject+"
-        # urllib.parse.quote(index_id, safe='') and urllib.parse.quote(object_key_name) yields 'testobject%2B' respectively
-        # And request_uri is
-        # '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D/testobject%2B'
+    def get_many(self, index_id, object_key_names, max_workers=None):
+        """Perform GET of many keys, return list of (status, response) in key order."""
+        return self._bulk(lambda api, key: api.get(index_id, key),
+                          object_key_names, max_workers)
 
-        request_uri = '/indexes/' + \
-            urllib.parse.quote(index_id, safe='') + '/' + \
-            urllib.parse.quote(object_key_name)
-
-        body = ""
-        query_params = ""
-        headers = self.s3_util.prepare_signed_header('DELETE', request_uri, query_params, body)
-
-        if(headers['Authorization'] is None):
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3KVApi,
-                self).delete(
-                request_uri,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 204:
-            Log.info('Key value deleted.')
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info('Failed to delete key value.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+    def delete_many(self, index_id, object_key_names, max_workers=None):
+        """Perform DELETE of many keys, return list of (status, response) in key order."""
+        return self._bulk(lambda api, key: api.delete(index_id, key),
+                          object_key_names, max_workers)
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Level guarded and sampled logging for per record messages. Messages are
+formatted with str.format only when they are actually logged.
+"""
+import itertools
+import logging
+
+from cortx.utils.log import Log
+
+
+def is_enabled_for(level):
+    """Return True if messages of level reach the log."""
+    logger = getattr(Log, "logger", None)
+    return logger is None or logger.isEnabledFor(level)
+
+
+def _format(msg, args):
+    """Return msg formatted with args, if any."""
+    return msg.format(*args) if args else msg
+
+
+def log_debug(msg, *args):
+    """Log msg.format(*args) at DEBUG level, formatting only if DEBUG is enabled."""
+    if is_enabled_for(logging.DEBUG):
+        Log.debug(_format(msg, args))
+
+
+def log_info(msg, *args):
+    """Log msg.format(*args) at INFO level, formatting only if INFO is enabled."""
+    if is_enabled_for(logging.INFO):
+        Log.info(_format(msg, args))
+
+
+class CORTXS3LogSampler(object):
+    """Lets one of every rate events through, or all of them at DEBUG level."""
+
+    def __init__(self, rate):
+        """Initialise sampler, rate <= 1 lets every event through."""
+        self._rate = max(1, rate)
+        # next() on itertools.count is atomic, so the sampler is thread safe.
+        self._events = itertools.count()
+
+    def sample(self):
+        """Return True if this event is to be logged."""
+        event = next(self._events)
+        return event % self._rate == 0 or is_enabled_for(logging.DEBUG)
+
+    def info(self, msg, *args):
+        """Log msg.format(*args) at INFO level if event is sampled."""
+        if self.sample() and is_enabled_for(logging.INFO):
+            Log.info(_format(msg, args))
+
+
+class CORTXS3RecordLog(object):
+    """INFO log of one record, messages of records not sampled are dropped."""
+
+    def __init__(self, sampled=True):
+        """Initialise log of a record."""
+        self._sampled = sampled and is_enabled_for(logging.INFO)
+
+    def is_sampled(self):
+        """Return True if INFO messages of the record are logged."""
+        return self._sampled
+
+    def info(self, msg, *args):
+        """Log msg.format(*args) at INFO level if record is sampled."""
+        if self._sampled:
+            Log.info(_format(msg, args))
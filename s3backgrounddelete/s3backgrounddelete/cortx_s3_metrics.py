@@ -0,0 +1,304 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+In process metrics of background delete, served in Prometheus text format
+on a local HTTP /metrics endpoint and optionally pushed to statsd.
+"""
+import bisect
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from s3backgrounddelete.cortx_s3_connection_pool import get_all_pool_metrics
+from s3backgrounddelete.cortx_s3_rate_limiter import get_all_limiter_metrics
+from cortx.utils.log import Log
+
+# Upper bounds (in seconds) of histogram buckets, from request latencies
+# up to record ages and cycle durations.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+                   30, 60, 300, 900, 3600)
+
+# Max size of one statsd UDP packet, lines are sent newline separated.
+_STATSD_PACKET_SIZE = 1400
+
+
+def _label_key(labels):
+    """Return hashable form of labels dict."""
+    if not labels:
+        return ()
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class CORTXS3MetricsRegistry(object):
+    """Thread safe counters, gauges and histograms with labels."""
+
+    def __init__(self):
+        """Initialise empty registry."""
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        # (name, labels) -> [bucket counts, sum, count]
+        self._histograms = {}
+        self._collectors = []
+
+    def inc(self, name, value=1, labels=None):
+        """Add value to counter."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name, value, labels=None):
+        """Set gauge to value."""
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, labels=None):
+        """Add observation, e.g. a duration in seconds, to histogram."""
+        key = (name, _label_key(labels))
+        index = bisect.bisect_left(DEFAULT_BUCKETS, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = [[0] * (len(DEFAULT_BUCKETS) + 1), 0.0, 0]
+                self._histograms[key] = histogram
+            histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def add_collector(self, collector):
+        """Register collector() returning (name, labels, value) gauges read at export."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def snapshot(self):
+        """Return copies of counters, gauges including collected ones and histograms."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = {key: (list(histogram[0]), histogram[1], histogram[2])
+                          for key, histogram in self._histograms.items()}
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                for name, labels, value in collector():
+                    gauges[(name, _label_key(labels))] = value
+            except Exception as exception:
+                Log.error("Metrics collector exception: {}".format(exception))
+        return counters, gauges, histograms
+
+    def render_prometheus(self):
+        """Return all metrics in Prometheus text exposition format."""
+        counters, gauges, histograms = self.snapshot()
+        lines = []
+        for metrics, metric_type in ((counters, "counter"), (gauges, "gauge")):
+            for name in sorted({name for name, _ in metrics}):
+                lines.append("# TYPE " + name + " " + metric_type)
+                for (metric_name, labels), value in sorted(metrics.items()):
+                    if metric_name == name:
+                        lines.append(name + _format_labels(labels) + " " + _format_value(value))
+        for name in sorted({name for name, _ in histograms}):
+            lines.append("# TYPE " + name + " histogram")
+            for (metric_name, labels), (buckets, total, count) in sorted(histograms.items()):
+                if metric_name != name:
+                    continue
+                cumulative = 0
+                for bound, bucket_count in zip(DEFAULT_BUCKETS + ("+Inf",), buckets):
+                    cumulative += bucket_count
+                    lines.append(name + "_bucket" + _format_labels(labels + (("le", str(bound)),)) +
+                                 " " + str(cumulative))
+                lines.append(name + "_sum" + _format_labels(labels) + " " + _format_value(total))
+                lines.append(name + "_count" + _format_labels(labels) + " " + str(count))
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels):
+    """Return {name="value",..} of label key."""
+    if not labels:
+        return ""
+    return "{" + ",".join(name + '="' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+                          for name, value in labels) + "}"
+
+
+def _format_value(value):
+    """Return metric value as text."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class CORTXS3StatsdExporter(object):
+    """Pushes registry to statsd over UDP every interval seconds."""
+
+    def __init__(self, registry, host, port, prefix, interval):
+        """Initialise exporter, call start() to begin pushing."""
+        self._registry = registry
+        self._address = (host, port)
+        self._prefix = prefix
+        self._interval = interval
+        self._sent_counters = {}
+        self._sent_histograms = {}
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _metric_name(self, name, labels):
+        """Return statsd name, label values are appended as name components."""
+        parts = [self._prefix, name] + [value.replace('.', '_').replace(':', '_')
+                                        for _, value in labels]
+        return ".".join(part for part in parts if part)
+
+    def lines(self):
+        """Return statsd lines for changes since previous call."""
+        counters, gauges, histograms = self._registry.snapshot()
+        lines = []
+        for key, value in counters.items():
+            delta = value - self._sent_counters.get(key, 0)
+            if delta:
+                lines.append(self._metric_name(*key) + ":" + _format_value(delta) + "|c")
+            self._sent_counters[key] = value
+        for key, value in gauges.items():
+            lines.append(self._metric_name(*key) + ":" + _format_value(value) + "|g")
+        for key, (_, total, count) in histograms.items():
+            sent_total, sent_count = self._sent_histograms.get(key, (0.0, 0))
+            if count > sent_count:
+                # Mean of the interval's observations, statsd scales count by 1/rate.
+                mean_ms = (total - sent_total) * 1000.0 / (count - sent_count)
+                lines.append(self._metric_name(*key) + ":" + "%.3f" % mean_ms +
+                             "|ms|@" + "%g" % (1.0 / (count - sent_count)))
+            self._sent_histograms[key] = (total, count)
+        return lines
+
+    def push(self):
+        """Send changes since previous push."""
+        packet = ""
+        for line in self.lines():
+            if packet and len(packet) + len(line) + 1 > _STATSD_PACKET_SIZE:
+                self._socket.sendto(packet.encode('utf-8'), self._address)
+                packet = ""
+            packet = packet + "\n" + line if packet else line
+        if packet:
+            self._socket.sendto(packet.encode('utf-8'), self._address)
+
+    def start(self):
+        """Push from a daemon thread."""
+        thread = threading.Thread(target=self._push_periodically,
+                                  name="statsd-exporter", daemon=True)
+        thread.start()
+
+    def _push_periodically(self):
+        """Body of the exporter thread."""
+        while True:
+            time.sleep(self._interval)
+            try:
+                self.push()
+            except Exception as exception:
+                Log.error("Statsd push exception: {}".format(exception))
+
+
+class _MetricsHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """HTTP server handling each scrape on its own thread."""
+    daemon_threads = True
+
+
+def start_metrics_server(registry, port, host="127.0.0.1"):
+    """Serve registry on http://host:port/metrics from a daemon thread, return server."""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Handler of /metrics requests."""
+
+        def do_GET(self):
+            """Return metrics in Prometheus text format."""
+            if self.path.split('?', 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """Scrapes are not logged."""
+
+    server = _MetricsHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
+
+
+def _collect_client_metrics():
+    """Return connection pool and rate limiter gauges."""
+    for endpoint, metrics in get_all_pool_metrics().items():
+        for name, value in metrics.items():
+            yield "s3bgd_connection_pool_" + name, {"endpoint": endpoint}, value
+    for limiter, metrics in get_all_limiter_metrics().items():
+        for name, value in metrics.items():
+            yield "s3bgd_rate_limiter_" + name, {"limiter": limiter}, value
+
+
+def _api_label(method, request_uri):
+    """Return API of request, e.g. index_list, kv_get or object_delete."""
+    parts = request_uri.split('?', 1)[0].strip('/').split('/')
+    if parts[0] == "indexes":
+        if len(parts) > 2:
+            return "kv_" + method.lower()
+        return "index_list" if method == "GET" else "index_" + method.lower()
+    if parts[0] == "objects":
+        return "object_" + method.lower()
+    return parts[0] + "_" + method.lower()
+
+
+def record_http_request(method, request_uri, status, latency):
+    """Record latency in seconds and status of a request to s3server."""
+    api = _api_label(method, request_uri)
+    _registry.observe("s3bgd_http_request_seconds", latency, {"api": api})
+    _registry.inc("s3bgd_http_responses_total", 1,
+                  {"api": api, "status": str(status // 100) + "xx"})
+
+
+_registry = CORTXS3MetricsRegistry()
+_registry.add_collector(_collect_client_metrics)
+_exporters_started = False
+_exporters_lock = threading.Lock()
+
+
+def get_metrics_registry():
+    """Return the process wide metrics registry."""
+    return _registry
+
+
+def start_metrics_exporters(config, http_port):
+    """Start /metrics endpoint on http_port (0 to disable) and statsd push once per process."""
+    global _exporters_started
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+    if http_port:
+        try:
+            start_metrics_server(_registry, http_port)
+            Log.info("Serving metrics on http://127.0.0.1:" + str(http_port) + "/metrics")
+        except OSError as e:
+            Log.error("Failed to serve metrics on port " + str(http_port) + " : " + str(e))
+    if config.get_statsd_enabled():
+        CORTXS3StatsdExporter(_registry, config.get_statsd_host(), config.get_statsd_port(),
+                              config.get_statsd_prefix(),
+                              config.get_statsd_flush_interval()).start()
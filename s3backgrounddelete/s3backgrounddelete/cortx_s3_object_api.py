@@ -19,12 +19,11 @@
 
 """This class provides Object  REST API i.e. GET,PUT,DELETE and HEAD."""
 import logging
-import urllib
 
-from s3backgrounddelete.cortx_s3_error_respose import CORTXS3ErrorResponse
-from s3backgrounddelete.cortx_s3_success_response import CORTXS3SuccessResponse
 from s3backgrounddelete.cortx_s3_client import CORTXS3Client
 from s3backgrounddelete.cortx_s3_util import CORTXS3Util
+from s3backgrounddelete.cortx_s3_api_request import object_put_request, \
+    object_get_request, object_delete_request, object_head_request
 from cortx.utils.log import Log
 #from s3backgrounddelete.IEMutil import IEMutil
 
@@ -45,198 +44,24 @@ class CORTXS3ObjectApi(CORTXS3Client):
 
     def put(self, oid, value):
         """Perform PUT request and generate response."""
-        if oid is None:
-            Log.error("Object Id is required.")
-            return False, None
-
-        query_params = ""
-        request_body = value
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if oid is 'JwZSAwAAAAA=-AgAAAAAA4Ag=' urllib.parse.quote(oid, safe='') yields 'JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D'
-        # And request_uri is '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D'
-
-        request_uri = '/objects/' + urllib.parse.quote(oid, safe='')
-
-        headers = self.s3_util.prepare_signed_header('PUT', request_uri, query_params, request_body)
-
-        if headers['Authorization'] is None:
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3ObjectApi,
-                self).put(
-                request_uri,
-                request_body,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 201:
-            Log.info("Object added successfully.")
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info('Failed to add Object.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+        return self._perform(object_put_request(oid, value))
 
     def get(self, oid):
         """Perform GET request and generate response."""
-        if oid is None:
-            Log.error("Object Id is required.")
-            return False, None
-        request_uri = '/objects/' + urllib.parse.quote(oid, safe='')
-
-        query_params = ""
-        body = ""
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if oid is 'JwZSAwAAAAA=-AgAAAAAA4Ag=' urllib.parse.quote(oid, safe='') yields 'JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D'
-        # And request_uri is '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D'
-
-        headers = self.s3_util.prepare_signed_header('GET', request_uri, query_params, body)
-
-        if headers['Authorization'] is None:
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3ObjectApi,
-                self).get(
-                request_uri,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 200:
-            Log.info('Successfully fetched object details.')
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info('Failed to fetch object details.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+        return self._perform(object_get_request(oid))
 
     def delete(self, oid, layout_id, pvid_str):
         """Perform DELETE request and generate response."""
-        if oid is None:
-            Log.error("Object Id is required.")
-            return False, None
-        if layout_id is None:
-            Log.error("Layout Id is required.")
-            return False, None
-        if pvid_str is None:
-            Log.error("pvid_str is required.")
-            return False, None
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # urllib.parse.urlencode converts a mapping object or a sequence of two-element tuples, which may contain str or bytes objects, to a percent-encoded ASCII text string.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if oid is 'JwZSAwAAAAA=-AgAAAAAA4Ag=' urllib.parse.quote(oid, safe='') yields 'JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D' and layout_id is 1
-        # urllib.parse.urlencode({'layout-id': layout_id}) yields layout-id=1
-        # And request_uri is '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D' ,
-        # absolute_request_uri is layout-id is '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D?layout-id=1'
-
-        query_params = urllib.parse.urlencode({'layout-id': layout_id})
-        query_params += "&" + urllib.parse.urlencode({'pvid': pvid_str}, safe='')
-        request_uri = '/objects/' + urllib.parse.quote(oid, safe='')
-        absolute_request_uri = request_uri + '?' + query_params
-
-        body = ''
-        headers = self.s3_util.prepare_signed_header('DELETE', request_uri, query_params, body)
-
-        if headers['Authorization'] is None:
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3ObjectApi,
-                self).delete(
-                absolute_request_uri,
-                body,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 204:
-            Log.info('Object deleted successfully.')
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info('Failed to delete Object.')
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
+        return self._perform(object_delete_request(oid, layout_id, pvid_str))
 
 
     def head(self, oid, layout_id):
         """Perform HEAD request and generate response."""
-        if oid is None:
-            Log.error("Object Id is required.")
-            return False, None
-        if layout_id is None:
-            Log.error("Layout Id is required.")
-            return False, None
-
-        # The URL quoting functions focus on taking program data and making it safe for use as URL components by quoting special characters and appropriately encoding non-ASCII text.
-        # urllib.parse.urlencode converts a mapping object or a sequence of two-element tuples, which may contain str or bytes objects, to a percent-encoded ASCII text string.
-        # https://docs.python.org/3/library/urllib.parse.html
-        # For example if oid is 'JwZSAwAAAAA=-AgAAAAAA4Ag=' urllib.parse.quote(oid, safe='') yields 'JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D' and layout_id is 1
-        # urllib.parse.urlencode({'layout-id': layout_id}) yields layout-id=1
-        # And request_uri is '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D' ,
-        # absolute_request_uri is layout-id is '/objects/JwZSAwAAAAA%3D-AgAAAAAA4Ag%3D?layout-id=1'
-
-        query_params = urllib.parse.urlencode({'layout-id': layout_id})
-        request_uri = '/objects/' + urllib.parse.quote(oid, safe='')
-        absolute_request_uri = request_uri + '?' + query_params
-
-        body = ''
-        headers = self.s3_util.prepare_signed_header('HEAD', request_uri, query_params, body)
-
-        if headers['Authorization'] is None:
-            Log.error("Failed to generate v4 signature")
-            return False, None
-
-        try:
-            response = super(
-                CORTXS3ObjectApi,
-                self).head(
-                absolute_request_uri,
-                body,
-                headers=headers)
-        except ConnectionRefusedError as ex:
-            #IEMutil("ERROR", IEMutil.S3_CONN_FAILURE, IEMutil.S3_CONN_FAILURE_STR)
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(502,"","ConnectionRefused")
-        except Exception as ex:
-            Log.error(repr(ex))
-            return False, CORTXS3ErrorResponse(500,"","InternalServerError")
-
-        if response['status'] == 200:
-            Log.info("HEAD Object called successfully with status code: "\
-                 + str(response['status']) + " response body: " + str(response['body']))
-            return True, CORTXS3SuccessResponse(response['body'])
-        else:
-            Log.info("Failed to do HEAD Object with status code: "\
-                 + str(response['status']) + " response body: " + str(response['body']))
-            return False, CORTXS3ErrorResponse(
-                response['status'], response['reason'], response['body'])
-
+        return self._perform(object_head_request(oid, layout_id))
+
+    def delete_many(self, objects, max_workers=None):
+        """
+        Perform DELETE of many objects given as (oid, layout_id, pvid_str),
+        return list of (status, response) in object order.
+        """
+        return self._bulk(lambda api, obj: api.delete(*obj), objects, max_workers)
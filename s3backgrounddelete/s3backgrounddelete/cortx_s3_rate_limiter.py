@@ -0,0 +1,260 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""Token bucket rate limiting of requests sent to one s3server endpoint."""
+
+import threading
+import time
+
+# Lowest fraction of the configured rates adaptive throttling goes down to.
+MIN_RATE_FACTOR = 0.05
+# Rates are adjusted at most once per interval (in seconds): halved if at
+# least CONGESTED_FRACTION of the responses of the interval were slow or 5xx,
+# otherwise raised back by RATE_FACTOR_STEP. Intervals with fewer than
+# MIN_SAMPLES responses are extended until enough responses arrive. Without
+# a configured request rate, backoff starts from the response rate observed
+# in the first congested interval and the limit is lifted once back there.
+ADJUST_INTERVAL = 1.0
+RATE_FACTOR_STEP = 0.1
+CONGESTED_FRACTION = 0.2
+MIN_SAMPLES = 10
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class CORTXS3TokenBucket(object):
+    """Allows rate tokens per second with bursts of up to one second worth."""
+
+    def __init__(self, rate, clock=time.monotonic, sleep=time.sleep):
+        """Initialise full bucket, rate <= 0 means unlimited."""
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._tokens = max(1.0, rate)
+        self._last = clock()
+
+    def _refill(self, now):
+        """Add tokens for time since last refill, called with lock held."""
+        self._tokens = min(max(1.0, self._rate),
+                           self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    def set_rate(self, rate):
+        """Change tokens per second."""
+        with self._lock:
+            if self._rate > 0:
+                self._refill(self._clock())
+            self._rate = rate
+
+    def reserve(self):
+        """Take a token, return seconds to wait until it is available."""
+        with self._lock:
+            if self._rate <= 0:
+                return 0
+            self._refill(self._clock())
+            # Token is reserved now, so concurrent callers queue up behind it.
+            self._tokens -= 1
+            return -self._tokens / self._rate if self._tokens < 0 else 0
+
+    def acquire(self):
+        """Take a token, sleeping until it is available, return seconds slept."""
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class CORTXS3RateLimiter(object):
+    """
+    Limits requests and deletes per second sent to one endpoint. With adaptive
+    throttling rates are halved when a good part of the responses of an
+    interval are slow or 5xx, and raised back step by step once the server
+    keeps up again.
+    """
+
+    def __init__(self, requests_per_sec=0, deletes_per_sec=0, adaptive=False,
+                 latency_target=0.5, clock=time.monotonic, sleep=time.sleep):
+        """Initialise limiter, a rate <= 0 means unlimited."""
+        self._requests_per_sec = requests_per_sec
+        self._deletes_per_sec = deletes_per_sec
+        self._adaptive = adaptive
+        self._latency_target = latency_target
+        self._clock = clock
+        self._sleep = sleep
+        self._requests = CORTXS3TokenBucket(requests_per_sec, clock, sleep)
+        self._deletes = CORTXS3TokenBucket(deletes_per_sec, clock, sleep)
+        self._lock = threading.Lock()
+        self._rate_factor = 1.0
+        # Request rate at factor 1.0, the observed rate while adaptive
+        # throttling backs off without a configured request rate.
+        self._base_requests_per_sec = requests_per_sec
+        self._window_start = clock()
+        self._window_responses = 0
+        self._window_congested = 0
+        self._metrics = {
+            'requests': 0,
+            'deletes': 0,
+            'throttled_sec': 0.0,
+            'congested_responses': 0,
+            'rate_decreases': 0}
+
+    def configure(self, requests_per_sec, deletes_per_sec, adaptive, latency_target):
+        """Change configured rates and throttling, e.g. after config reload."""
+        with self._lock:
+            self._requests_per_sec = requests_per_sec
+            self._deletes_per_sec = deletes_per_sec
+            self._adaptive = adaptive
+            self._latency_target = latency_target
+            if not adaptive:
+                self._rate_factor = 1.0
+            if requests_per_sec > 0 or self._rate_factor >= 1.0:
+                self._base_requests_per_sec = requests_per_sec
+            base_requests_per_sec = self._base_requests_per_sec
+            rate_factor = self._rate_factor
+        self._requests.set_rate(base_requests_per_sec * rate_factor)
+        self._deletes.set_rate(deletes_per_sec * rate_factor)
+
+    def is_limited(self):
+        """Return True if any rate is configured or rates are adapted to the server."""
+        return self._requests_per_sec > 0 or self._deletes_per_sec > 0 or self._adaptive
+
+    def reserve(self, method):
+        """Take tokens of request of method, return seconds to wait before sending it."""
+        throttled = self._requests.reserve()
+        if method == 'DELETE':
+            throttled = max(throttled, self._deletes.reserve())
+        with self._lock:
+            self._metrics['requests'] += 1
+            if method == 'DELETE':
+                self._metrics['deletes'] += 1
+            self._metrics['throttled_sec'] += throttled
+        return throttled
+
+    def acquire(self, method):
+        """Wait until request of method may be sent."""
+        throttled = self.reserve(method)
+        if throttled > 0:
+            self._sleep(throttled)
+
+    def record_response(self, status, latency):
+        """Feed response status and latency in seconds back to adaptive throttling."""
+        if not self._adaptive:
+            return
+        congested = status >= 500 or latency > self._latency_target
+        now = self._clock()
+        with self._lock:
+            self._window_responses += 1
+            if congested:
+                self._window_congested += 1
+                self._metrics['congested_responses'] += 1
+            if (now - self._window_start < ADJUST_INTERVAL or
+                    self._window_responses < MIN_SAMPLES):
+                return
+            congested = (self._window_congested >=
+                         CONGESTED_FRACTION * self._window_responses)
+            observed_rate = self._window_responses / (now - self._window_start)
+            self._window_start = now
+            self._window_responses = 0
+            self._window_congested = 0
+            if congested and self._rate_factor > MIN_RATE_FACTOR:
+                if self._base_requests_per_sec <= 0:
+                    self._base_requests_per_sec = observed_rate
+                self._rate_factor = max(MIN_RATE_FACTOR, self._rate_factor / 2)
+                self._metrics['rate_decreases'] += 1
+            elif not congested and self._rate_factor < 1.0:
+                self._rate_factor = min(1.0, self._rate_factor + RATE_FACTOR_STEP)
+                if self._rate_factor >= 1.0:
+                    self._base_requests_per_sec = self._requests_per_sec
+            else:
+                return
+            base_requests_per_sec = self._base_requests_per_sec
+            rate_factor = self._rate_factor
+        self._requests.set_rate(base_requests_per_sec * rate_factor)
+        self._deletes.set_rate(self._deletes_per_sec * rate_factor)
+
+    def get_metrics(self):
+        """Return a snapshot of the limiter counters."""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['rate_factor'] = self._rate_factor
+            metrics['requests_per_sec'] = self._base_requests_per_sec * self._rate_factor
+        return metrics
+
+
+def get_rate_limiter(name, requests_per_sec, deletes_per_sec, adaptive,
+                     latency_target):
+    """
+    Return the process wide rate limiter for name, e.g. endpoint of a
+    connection type, an existing one is changed to the given rates.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if (limiter is None):
+            limiter = CORTXS3RateLimiter(requests_per_sec, deletes_per_sec,
+                                         adaptive, latency_target)
+            _limiters[name] = limiter
+        else:
+            limiter.configure(requests_per_sec, deletes_per_sec, adaptive,
+                              latency_target)
+        return limiter
+
+
+def get_request_api(request_uri):
+    """Return API rates of request are configured for, "index" or "object"."""
+    return "object" if request_uri.startswith('/objects') else "index"
+
+
+def get_connection_rate_limiter(config, name, api="index"):
+    """
+    Return rate limiter of requests of connection type name, i.e. "consumer"
+    or "producer", to api "index" or "object" as configured, None if
+    unlimited. An API with rates of its own gets a limiter of its own, with
+    rates it leaves at 0 taken from the connection type. Other APIs share
+    the limiter of the connection type.
+    """
+    if (name == "consumer"):
+        requests_per_sec = config.get_consumer_requests_per_sec()
+        deletes_per_sec = config.get_consumer_deletes_per_sec()
+    else:
+        requests_per_sec = config.get_producer_requests_per_sec()
+        deletes_per_sec = config.get_producer_deletes_per_sec()
+    # e.g. get_consumer_object_requests_per_sec
+    api_requests_per_sec = getattr(config, "get_" + name + "_" + api + "_requests_per_sec")()
+    api_deletes_per_sec = getattr(config, "get_" + name + "_" + api + "_deletes_per_sec")()
+    if (api_requests_per_sec or api_deletes_per_sec):
+        name = name + "_" + api
+        requests_per_sec = api_requests_per_sec or requests_per_sec
+        deletes_per_sec = api_deletes_per_sec or deletes_per_sec
+    adaptive = config.get_adaptive_throttling()
+    if (not requests_per_sec and not deletes_per_sec and not adaptive):
+        return None
+    limiter = get_rate_limiter(name, requests_per_sec, deletes_per_sec, adaptive,
+                               config.get_throttle_latency_ms() / 1000.0)
+    if (not limiter.is_limited()):
+        return None
+    return limiter
+
+
+def get_all_limiter_metrics():
+    """Return metrics of every rate limiter keyed by name."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {name: limiter.get_metrics() for name, limiter in limiters.items()}
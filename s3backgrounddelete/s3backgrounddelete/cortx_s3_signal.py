@@ -31,7 +31,6 @@ import signal
 from logging import handlers
 from functools import partial
 
-from s3backgrounddelete.cortx_s3_config import CORTXS3Config
 
 class DynamicConfigHandler(object):
     """Signal handler class for dynamically changing config parameters"""
@@ -43,7 +42,8 @@ class DynamicConfigHandler(object):
 
     def sighup_handler_callback(self, sighupArg, signum, frame):
         """Reload the configuration"""
-        sighupArg.config = CORTXS3Config()
+        # Reload in place, so every holder of the config sees the new settings.
+        sighupArg.config.reload()
         sighupArg.logger.setLevel(sighupArg.config.get_file_log_level())
 
         sighupArg.logger.info("Logging level has been changed")
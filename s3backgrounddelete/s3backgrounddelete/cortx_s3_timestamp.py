@@ -0,0 +1,77 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Parsing of s3server create_timestamp values, e.g. "2020-03-16T16:24:04.000Z",
+into UTC epoch seconds without going through datetime.strptime.
+"""
+import calendar
+import datetime
+import time
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
+
+# "YYYY-MM-DD" -> epoch seconds of its midnight, leak records of one
+# listing mostly share a handful of dates.
+_day_start_cache = {}
+
+
+def _day_start(date_str):
+    """Return UTC epoch seconds of midnight of YYYY-MM-DD date."""
+    day_start = _day_start_cache.get(date_str)
+    if day_start is None:
+        day_start = calendar.timegm((int(date_str[0:4]), int(date_str[5:7]),
+                                     int(date_str[8:10]), 0, 0, 0))
+        if len(_day_start_cache) > 1024:
+            _day_start_cache.clear()
+        _day_start_cache[date_str] = day_start
+    return day_start
+
+
+def parse_timestamp(timestamp):
+    """Return UTC epoch seconds of create_timestamp or ValueError."""
+    if (len(timestamp) != 24 or timestamp[4] != '-' or timestamp[7] != '-' or
+            timestamp[10] != 'T' or timestamp[13] != ':' or timestamp[16] != ':' or
+            timestamp[19:] != '.000Z'):
+        # Unexpected layout, let strptime validate it or raise ValueError.
+        return calendar.timegm(
+            datetime.datetime.strptime(timestamp, TIMESTAMP_FORMAT).timetuple())
+    return (_day_start(timestamp[0:10]) + int(timestamp[11:13]) * 3600 +
+            int(timestamp[14:16]) * 60 + int(timestamp[17:19]))
+
+
+def now_timestamp():
+    """Return current UTC epoch seconds, taken once per listing page."""
+    return time.time()
+
+
+def is_older_than(timestamp, older_in_mins, now=None):
+    """Return True if create_timestamp is at least older_in_mins whole minutes old."""
+    if now is None:
+        now = now_timestamp()
+    # floor((now - t) / 60) >= mins is the same as t <= now - mins * 60
+    return parse_timestamp(timestamp) <= now - older_in_mins * 60
+
+
+def select_older_than(timestamps, older_in_mins, now=None):
+    """Return list of flags telling which of timestamps are old enough."""
+    if now is None:
+        now = now_timestamp()
+    cutoff = now - older_in_mins * 60
+    return [parse_timestamp(timestamp) <= cutoff for timestamp in timestamps]
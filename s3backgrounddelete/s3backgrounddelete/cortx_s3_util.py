@@ -27,6 +27,63 @@ import datetime
 from s3backgrounddelete.cortx_s3_config import CORTXS3Config
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_PRODUCER
+from cortx.utils.log import Log
+
+class CORTXS3SigningContext(object):
+   """Precomputed state for AWS v4 signing of requests to one endpoint."""
+
+   ALGORITHM = 'AWS4-HMAC-SHA256'
+   # Sorted names of headers returned by CORTXS3Util.get_headers
+   SIGNED_HEADERS = 'host;x-amz-content-sha256;x-amz-date'
+
+   def __init__(self, access_key, secret_key, host, service, region):
+       """Initialise credentials and endpoint details."""
+       self._access_key = access_key
+       self._secret_key = secret_key
+       self._region = region
+       self._service = service
+       self._canonical_host = 'host:' + host.strip() + '\n'
+       self._scope_suffix = '/' + region + '/' + service + '/' + 'aws4_request'
+       # (date, signing key), derived key only changes once a day.
+       self._signing_key = (None, None)
+
+   @staticmethod
+   def body_hash(body):
+       """Return hex SHA-256 of request body."""
+       if isinstance(body, str):
+           body = body.encode('utf-8')
+       return hashlib.sha256(body).hexdigest()
+
+   def get_signing_key(self, date_stamp):
+       """Return v4 signing key for date, derived once per date."""
+       cached_date, signing_key = self._signing_key
+       if cached_date != date_stamp:
+           signing_key = ('AWS4' + self._secret_key).encode('utf-8')
+           for msg in (date_stamp, self._region, self._service, 'aws4_request'):
+               signing_key = hmac.new(signing_key, msg.encode('utf-8'), hashlib.sha256).digest()
+           # Tuple is swapped as a whole so concurrent signers never see a mismatch.
+           self._signing_key = (date_stamp, signing_key)
+       return signing_key
+
+   def authorization(self, method, canonical_uri, canonical_query_string, body_hash_hex, amz_date):
+       """Return authorization header value for request."""
+       if method is None:
+           Log.error("method can not be null")
+           return None
+       date_stamp = amz_date[:8]
+       canonical_request = method + '\n' + canonical_uri + '\n' + canonical_query_string + '\n' + \
+           self._canonical_host + 'x-amz-content-sha256:' + body_hash_hex + '\n' + \
+           'x-amz-date:' + amz_date + '\n' + '\n' + self.SIGNED_HEADERS + '\n' + body_hash_hex
+       credential_scope = date_stamp + self._scope_suffix
+       string_to_sign = self.ALGORITHM + '\n' + amz_date + '\n' + credential_scope + '\n' + \
+           hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+       signature = hmac.new(
+           self.get_signing_key(date_stamp),
+           string_to_sign.encode('utf-8'),
+           hashlib.sha256).hexdigest()
+       return self.ALGORITHM + ' ' + 'Credential=' + self._access_key + '/' + \
+           credential_scope + ', ' + 'SignedHeaders=' + self.SIGNED_HEADERS + \
+           ', ' + 'Signature=' + signature
 
 class CORTXS3Util(object):
    """Generate Authorization headers to validate requests."""
@@ -39,6 +96,9 @@ class CORTXS3Util(object):
         else:
             self._config = config
         self._connectionType = connectionType
+        self._host = None
+        # (settings it was built from, signing context)
+        self._signing_context = (None, None)
 
    def get_headers(self, host, epoch_t, body_256hash):
         headers = {
@@ -131,18 +191,37 @@ class CORTXS3Util(object):
        """Return timestamp in YMDTHMSZ format."""
        return epoch_t.strftime('%Y%m%dT%H%M%SZ')
 
+   def get_signing_context(self):
+        """Return signing context, built from config on first use and after config reload."""
+        settings = self._config.get_settings()
+        signing_settings, signing_context = self._signing_context
+        if signing_context is None or signing_settings is not settings:
+            if self._host is None:
+                # Host stays that of the pooled connections, which keep their
+                # endpoint until restart.
+                if self._connectionType == CONNECTION_TYPE_PRODUCER:
+                    url_parse_result  = urllib.parse.urlparse(self._config.get_cortx_s3_endpoint_for_producer())
+                else:
+                    url_parse_result  = urllib.parse.urlparse(self._config.get_cortx_s3_endpoint_for_consumer())
+                self._host = url_parse_result.netloc
+            signing_context = CORTXS3SigningContext(
+                self._config.get_cortx_s3_access_key(), self._config.get_cortx_s3_secret_key(),
+                self._host, self._config.get_cortx_s3_service(),
+                self._config.get_cortx_s3_region())
+            # Swapped as a whole, so concurrent signers never see a mismatch.
+            self._signing_context = (settings, signing_context)
+        return signing_context
+
    def prepare_signed_header(self, http_request, request_uri, query_params, body):
         """Generate headers used for authorization requests."""
-        if self._connectionType == CONNECTION_TYPE_PRODUCER:
-            url_parse_result  = urllib.parse.urlparse(self._config.get_cortx_s3_endpoint_for_producer())
-        else:
-            url_parse_result  = urllib.parse.urlparse(self._config.get_cortx_s3_endpoint_for_consumer())
-        
-        epoch_t = datetime.datetime.utcnow()
+        signing_context = self.get_signing_context()
+        amz_date = self.get_amz_timestamp(datetime.datetime.utcnow())
+        # Body hash is kept local, so one util can sign from many threads.
+        body_hash_hex = signing_context.body_hash(body)
         headers = {'content-type': 'application/x-www-form-urlencoded',
                 'Accept': 'text/plain'}
-        headers['Authorization'] = self.sign_request_v4(http_request, request_uri ,query_params, body, epoch_t, url_parse_result.netloc,
-            self._config.get_cortx_s3_service(), self._config.get_cortx_s3_region())
-        headers['x-amz-date'] = self.get_amz_timestamp(epoch_t)
-        headers['x-amz-content-sha256'] = self.body_hash_hex
+        headers['Authorization'] = signing_context.authorization(
+            http_request, request_uri, query_params, body_hash_hex, amz_date)
+        headers['x-amz-date'] = amz_date
+        headers['x-amz-content-sha256'] = body_hash_hex
         return headers
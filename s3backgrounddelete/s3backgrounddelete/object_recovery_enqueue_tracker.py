@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+ObjectRecoveryEnqueueTracker remembers which probable delete records are
+already enqueued, so the producer only sends new or changed ones.
+"""
+import time
+import zlib
+
+
+class ObjectRecoveryEnqueueTracker(object):
+    """Tracks enqueued probable delete keys with a version stamp of their value."""
+
+    def __init__(self, resend_interval):
+        """Initialise tracker, records are sent again after resend_interval seconds."""
+        self._resend_interval = resend_interval
+        # key -> (crc32 of value, time of enqueue). A record still present in
+        # the index after resend_interval failed to be processed, so it is sent
+        # again instead of waiting forever.
+        self._enqueued = {}
+        self._seen = set()
+
+    @staticmethod
+    def version_stamp(value):
+        """Return compact stamp of record value."""
+        if not isinstance(value, str):
+            value = str(value)
+        return zlib.crc32(value.encode('utf-8'))
+
+    def start_walk(self):
+        """Start of a new listing of the probable delete index."""
+        self._seen = set()
+
+    def finish_walk(self):
+        """Forget keys which were not listed in a complete walk of the index."""
+        for key in [key for key in self._enqueued if key not in self._seen]:
+            del self._enqueued[key]
+        self._seen = set()
+
+    def should_send(self, key, value, now = None):
+        """Return True if record is new, changed or due for a resend."""
+        self._seen.add(key)
+        entry = self._enqueued.get(key)
+        if entry is None:
+            return True
+        if now is None:
+            now = time.monotonic()
+        stamp, enqueued_at = entry
+        return (stamp != self.version_stamp(value) or
+                now - enqueued_at >= self._resend_interval)
+
+    def mark_enqueued(self, key, value, now = None):
+        """Remember record as enqueued."""
+        if now is None:
+            now = time.monotonic()
+        self._enqueued[key] = (self.version_stamp(value), now)
+
+    def forget(self, key):
+        """Forget record, e.g. because its send failed."""
+        self._enqueued.pop(key, None)
+
+    def __len__(self):
+        """Return number of tracked records."""
+        return len(self._enqueued)
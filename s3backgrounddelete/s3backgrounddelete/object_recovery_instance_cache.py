@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+ObjectRecoveryInstanceCache keeps the set of active s3server instance ids
+listed from the global instance index.
+"""
+import threading
+import time
+
+from s3backgrounddelete.cortx_s3_index_api import CORTXS3IndexApi
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
+from cortx.utils.log import Log
+
+
+class ObjectRecoveryInstanceCache(object):
+    """Process wide TTL cache of active s3server instance ids."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ttl):
+        """Initialise empty cache, entries are valid for ttl seconds."""
+        self._ttl = ttl
+        self._active_instances = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+
+    @classmethod
+    def get_instance(cls, ttl):
+        """Return cache shared by the whole process."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(ttl)
+            return cls._instance
+
+    def invalidate(self):
+        """Drop cached instance ids, next lookup lists the index again."""
+        with self._lock:
+            self._active_instances = None
+            self._loaded_at = 0
+
+    def refresh(self, indexapi, index_id, max_keys):
+        """List global instance index into the cache, return False on failure."""
+        active_instances = set()
+        marker = None
+        while True:
+            result, instance_response = indexapi.list(index_id, max_keys, marker)
+            if not result:
+                Log.error("Failed to list global instance index")
+                self.invalidate()
+                return False
+            active_instances.update(record.get_value() for record in instance_response.iter_records())
+            listing_header = instance_response.get_listing_header()
+            marker = listing_header.get("NextMarker")
+            if not (CORTXS3IndexApi.is_truncated(listing_header) and marker):
+                break
+        with self._lock:
+            self._active_instances = frozenset(active_instances)
+            self._loaded_at = time.monotonic()
+        Log.info("Global instance index lists " + str(len(active_instances)) + " active instances")
+        return True
+
+    def get_active_instances(self, indexapi, index_id, max_keys):
+        """Return set of active instance ids, or None if they could not be listed."""
+        with self._lock:
+            active_instances = self._active_instances
+            fresh = (time.monotonic() - self._loaded_at) < self._ttl
+        if active_instances is not None and fresh:
+            return active_instances
+        if not self.refresh(indexapi, index_id, max_keys):
+            return None
+        with self._lock:
+            return self._active_instances
+
+    def start_background_refresh(self, config):
+        """Refresh the cache from a daemon thread every half of the ttl."""
+        with self._lock:
+            if self._refresh_thread is not None:
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_periodically, args=(config,),
+                name="instance-cache-refresh", daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh_periodically(self, config):
+        """Body of the background refresh thread."""
+        indexapi = CORTXS3IndexApi(config, connectionType=CONNECTION_TYPE_CONSUMER)
+        while True:
+            try:
+                self.refresh(indexapi, config.get_global_instance_index_id(),
+                             config.get_max_keys())
+            except Exception as exception:
+                Log.error("Instance cache refresh exception: {}".format(exception))
+                self.invalidate()
+            time.sleep(max(1, self._ttl / 2))
@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+ObjectRecoveryJournal remembers leak records a consumer finished recently, in
+a memory mapped file so that it survives consumer restarts.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+# Leak entry was removed from probable delete index.
+JOURNAL_DONE = 1
+# Record can never be processed, e.g. it is badly formatted.
+JOURNAL_FAILED = 2
+# Leak entry is still in probable delete index, e.g. validation or a delete
+# failed, record is processed again once the shorter retry ttl passed.
+JOURNAL_RETRY = 3
+
+_MAGIC = b"S3BGJRN1"
+_HEADER = struct.Struct("<8sI4x")
+# fingerprint, wall clock time of outcome, outcome
+_SLOT = struct.Struct("<QdB7x")
+# Slots probed for a fingerprint, a full window evicts its oldest slot.
+_PROBE = 8
+
+
+class ObjectRecoveryJournal(object):
+    """Fixed size open addressing table of record fingerprint -> outcome."""
+
+    def __init__(self, path, ttl, slots, retry_ttl = None):
+        """Open or create journal file with given number of slots, retry_ttl defaults to ttl."""
+        self._ttl = ttl
+        self._retry_ttl = ttl if retry_ttl is None else retry_ttl
+        self._slots = max(_PROBE, slots)
+        self._lock = threading.Lock()
+        size = _HEADER.size + self._slots * _SLOT.size
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            valid = False
+            if os.fstat(fd).st_size == size:
+                magic, slot_count = _HEADER.unpack(os.pread(fd, _HEADER.size, 0))
+                valid = magic == _MAGIC and slot_count == self._slots
+            if not valid:
+                # New file or one written with another slot count, start empty.
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, self._slots), 0)
+            self._mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def fingerprint(msg):
+        """Return non zero 64 bit fingerprint of message text."""
+        digest = hashlib.blake2b(msg.encode('utf-8'), digest_size=8).digest()
+        return struct.unpack("<Q", digest)[0] or 1
+
+    def _offsets(self, fingerprint):
+        """Return offsets of slots probed for fingerprint."""
+        start = fingerprint % self._slots
+        return [_HEADER.size + ((start + probe) % self._slots) * _SLOT.size
+                for probe in range(_PROBE)]
+
+    def _outcome_ttl(self, outcome):
+        """Return seconds for which outcome is kept."""
+        return self._retry_ttl if outcome == JOURNAL_RETRY else self._ttl
+
+    def lookup(self, fingerprint, now = None):
+        """Return outcome recorded for fingerprint within ttl or None."""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            for offset in self._offsets(fingerprint):
+                slot_fingerprint, recorded_at, outcome = _SLOT.unpack_from(self._mmap, offset)
+                if slot_fingerprint == fingerprint:
+                    return outcome if now - recorded_at < self._outcome_ttl(outcome) else None
+                if slot_fingerprint == 0:
+                    return None
+        return None
+
+    def record(self, fingerprint, outcome, now = None):
+        """Remember outcome of fingerprint."""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            target = None
+            first_expiring = None
+            for offset in self._offsets(fingerprint):
+                slot_fingerprint, recorded_at, outcome_in_slot = _SLOT.unpack_from(self._mmap, offset)
+                if slot_fingerprint == fingerprint or slot_fingerprint == 0:
+                    target = offset
+                    break
+                expires_at = recorded_at + self._outcome_ttl(outcome_in_slot)
+                if first_expiring is None or expires_at < first_expiring[1]:
+                    first_expiring = (offset, expires_at)
+            if target is None:
+                # Expired slots expire first, reuse them first.
+                target = first_expiring[0]
+            _SLOT.pack_into(self._mmap, target, fingerprint, now, outcome)
+
+    def close(self):
+        """Flush journal to its file and unmap it."""
+        with self._lock:
+            if not self._mmap.closed:
+                self._mmap.flush()
+                self._mmap.close()
@@ -20,11 +20,25 @@
 """Implementation of MessageBus for object recovery."""
 
 import json
+import random
 import socket
+import threading
 import time
 import traceback
+from concurrent.futures import wait
 from s3msgbus.cortx_s3_msgbus import S3CortxMsgBus
 from s3backgrounddelete.object_recovery_validator import ObjectRecoveryValidator
+from s3backgrounddelete.object_recovery_instance_cache import ObjectRecoveryInstanceCache
+from s3backgrounddelete.object_recovery_partitioned_executor import ObjectRecoveryPartitionedExecutor
+from s3backgrounddelete.object_recovery_journal import ObjectRecoveryJournal, JOURNAL_DONE, JOURNAL_FAILED, JOURNAL_RETRY
+from s3backgrounddelete.cortx_s3_kv_api import CORTXS3KVApi
+from s3backgrounddelete.cortx_s3_object_api import CORTXS3ObjectApi
+from s3backgrounddelete.cortx_s3_index_api import CORTXS3IndexApi
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
+from s3backgrounddelete.cortx_s3_connection_pool import close_all_pools
+from s3backgrounddelete.cortx_s3_metrics import get_metrics_registry
+from s3backgrounddelete.cortx_s3_timestamp import now_timestamp, parse_timestamp
+from s3backgrounddelete.cortx_s3_log import CORTXS3LogSampler, CORTXS3RecordLog, log_debug
 from cortx.utils.log import Log
 
 class ObjectRecoveryMsgbus(object):
@@ -39,35 +53,149 @@ class ObjectRecoveryMsgbus(object):
         self.__isconsumersetupcomplete = False
         self._daemon_mode = config.get_daemon_mode()
         self._sleep_time = config.get_msgbus_consumer_sleep_time()
+        self._receive_timeout = config.get_msgbus_consumer_receive_timeout()
+        self._backoff = ObjectRecoveryPollBackoff(
+            config.get_msgbus_consumer_min_sleep_ms() / 1000.0, self._sleep_time)
+        self._workers = config.get_msgbus_consumer_workers()
+        self._max_inflight = config.get_msgbus_consumer_max_inflight()
+        # API clients are kept per worker thread, they share the connection pool.
+        self._apis = threading.local()
+        self._journal = None
+        self._metrics = get_metrics_registry()
+        self._record_sampler = CORTXS3LogSampler(config.get_record_log_sample_rate())
+
+    def _get_apis(self):
+        """Return API clients reused across messages processed by this thread."""
+        if getattr(self._apis, 'objectapi', None) is None:
+            self._apis.objectapi = CORTXS3ObjectApi(self._config, connectionType=CONNECTION_TYPE_CONSUMER)
+            self._apis.kvapi = CORTXS3KVApi(self._config, connectionType=CONNECTION_TYPE_CONSUMER)
+            self._apis.indexapi = CORTXS3IndexApi(self._config, connectionType=CONNECTION_TYPE_CONSUMER)
+        return self._apis.objectapi, self._apis.kvapi, self._apis.indexapi
+
+    def get_poll_metrics(self):
+        """Return receive poll counters and latencies of consumer."""
+        return self._backoff.get_metrics()
+
+    def _open_journal(self, consumer_id):
+        """Open journal of processed leak records of this consumer, if configured."""
+        journal_file = self._config.get_msgbus_consumer_journal_file()
+        if not journal_file:
+            return
+        if consumer_id:
+            # Consumer group members of one node keep separate journals.
+            journal_file = journal_file + "." + consumer_id
+        try:
+            self._journal = ObjectRecoveryJournal(journal_file,
+                self._config.get_msgbus_consumer_journal_ttl(),
+                self._config.get_msgbus_consumer_journal_slots(),
+                self._config.get_msgbus_consumer_journal_retry_ttl())
+        except (OSError, ValueError) as e:
+            Log.error("Failed to open journal " + journal_file + " : " + str(e))
+            self._journal = None
 
     def close(self):
         """Closure and cleanup for ObjectRecoveryMsgbus."""
-        pass
+        if self._journal is not None:
+            self._journal.close()
+        close_all_pools()
 
-    def __process_msg(self, msg):
-        """Loads the json message and sends it to validation and processing."""
-        Log.info(
-            "Processing following records in consumer: " + msg)
+    def __process_msg(self, msg, probable_delete_records, leak_info):
+        """Sends record decoded from json message by _decode_msg to validation and processing."""
+        received_at = now_timestamp()
+        self._metrics.inc("s3bgd_records_received_total")
+        fingerprint = None
+        if self._journal is not None:
+            fingerprint = self._journal.fingerprint(msg)
+            outcome = self._journal.lookup(fingerprint)
+            if outcome is not None:
+                # Redelivered or enqueued again before the purge, already handled.
+                self._record_sampler.info("Skipping record finished with outcome {} : {}", outcome, msg)
+                self._metrics.inc("s3bgd_records_skipped_total", 1, {"reason": "journal"})
+                return True
+        record_log = CORTXS3RecordLog(self._record_sampler.sample())
+        record_log.info("Processing following records in consumer: {}", msg)
         try:
-            # msg: {"Key": "egZPBQAAAAA=-ZQIAAAAAJKc=",
-            #       "Value": "{\\"index_id\\":\\"egZPBQAAAHg=-YwIAAAAAJKc=\\",
-            #       \\"object_layout_id\\":1,
-            #        \\"object_metadata_path\\":\\"object1\\"}\\n"}
-            probable_delete_records = json.loads(msg)
+            if probable_delete_records is None:
+                raise ValueError("Message is not valid JSON")
 
             if probable_delete_records:
+                objectapi, kvapi, indexapi = self._get_apis()
                 validator = ObjectRecoveryValidator(
-                    self._config, probable_delete_records)
+                    self._config, probable_delete_records,
+                    objectapi=objectapi, kvapi=kvapi, indexapi=indexapi,
+                    record_log=record_log, leak_info=leak_info)
                 validator.process_results()
+                if validator.leak_entry_deleted:
+                    self._metrics.inc("s3bgd_records_deleted_total")
+                    if fingerprint is not None:
+                        self._journal.record(fingerprint, JOURNAL_DONE)
+                elif fingerprint is not None:
+                    # Validation or a delete failed, or record was skipped for
+                    # now. Leak entry is enqueued again, redeliveries meanwhile
+                    # are skipped until retry ttl passed.
+                    self._journal.record(fingerprint, JOURNAL_RETRY)
+                leak_info = getattr(validator, "object_leak_info", None)
+                if leak_info and "create_timestamp" in leak_info:
+                    # Time from leak record creation until a consumer picked it up.
+                    self._metrics.observe("s3bgd_record_age_seconds",
+                        received_at - parse_timestamp(leak_info["create_timestamp"]))
 
         except (KeyError, ValueError) as ex:    # Bad formatted message. Will discard it
             Log.error("Failed to parse JSON data due to: " + str(ex))
+            self._metrics.inc("s3bgd_records_failed_total", 1, {"reason": "bad_format"})
+            if fingerprint is not None:
+                self._journal.record(fingerprint, JOURNAL_FAILED)
             return True
         except Exception as ex:
             Log.error(str(ex))
+            self._metrics.inc("s3bgd_records_failed_total", 1, {"reason": "error"})
+            if fingerprint is not None:
+                self._journal.record(fingerprint, JOURNAL_RETRY)
             return False
         return True
 
+    def _collect_consumer_metrics(self, executor):
+        """Return poll and worker queue gauges of consumer."""
+        metrics = [("s3bgd_consumer_poll_" + name, None, value)
+                   for name, value in self._backoff.get_metrics().items()]
+        if executor is not None:
+            metrics.extend(("s3bgd_consumer_worker_queue_length", {"worker": index}, length)
+                           for index, length in enumerate(executor.queue_lengths()))
+            metrics.append(("s3bgd_consumer_worker_steals", None, executor.steals))
+        return metrics
+
+    @staticmethod
+    def _decode_msg(msg):
+        """
+        Return (record, leak info decoded from its Value) of json message, record
+        None if msg is not json, leak info None if Value is not a json object.
+        """
+        # msg: {"Key": "egZPBQAAAAA=-ZQIAAAAAJKc=",
+        #       "Value": "{\\"index_id\\":\\"egZPBQAAAHg=-YwIAAAAAJKc=\\",
+        #       \\"object_layout_id\\":1,
+        #        \\"object_metadata_path\\":\\"object1\\"}\\n"}
+        try:
+            probable_delete_records = json.loads(msg)
+        except ValueError:
+            return None, None
+        try:
+            leak_info = json.loads(probable_delete_records["Value"])
+        except (KeyError, ValueError, TypeError):
+            return probable_delete_records, None
+        if not isinstance(leak_info, dict):
+            return probable_delete_records, None
+        return probable_delete_records, leak_info
+
+    @staticmethod
+    def _partition_key(probable_delete_records, leak_info):
+        """Return object version list index oid of record, records of one object are processed in order."""
+        if leak_info is not None and leak_info.get("objects_version_list_index_oid"):
+            return leak_info["objects_version_list_index_oid"]
+        if isinstance(probable_delete_records, dict):
+            return probable_delete_records.get("Key")
+        # Bad formatted message is discarded by processing, order does not matter.
+        return None
+
     def __setup_consumer(self,
         consumer_id = None,
         consumer_group = None,
@@ -102,10 +230,24 @@ class ObjectRecoveryMsgbus(object):
             else:
                 Log.debug("setup message bus for consumer success")
                 self.__isconsumersetupcomplete = True
+                # Keep active instance ids warm so that validators never list them inline.
+                ObjectRecoveryInstanceCache.get_instance(
+                    self._config.get_instance_cache_ttl()).start_background_refresh(self._config)
         except Exception as exception:
             Log.error("Exception:{}".format(exception))
             self.__isconsumersetupcomplete = False
 
+    def __drain_and_ack(self, inflight):
+        """Wait for every in-flight record to finish and then acknowledge them."""
+        if not inflight:
+            return
+        log_debug("Waiting for {} in-flight records", len(inflight))
+        wait(inflight)
+        # Message bus acknowledges everything received so far in one go, so
+        # ack is only sent once no earlier record is still being processed.
+        self.__msgbuslib.ack()
+        inflight.clear()
+
     def receive_data(self,
         term_signal,
         consumer_id = None,
@@ -113,6 +255,37 @@ class ObjectRecoveryMsgbus(object):
         msg_topic = None,
         offset = None):
         """Initializes consumer, connects and receives messages from message bus."""
+        self._open_journal(consumer_id)
+        executor = None
+        if self._workers > 1:
+            Log.info("Processing records with " + str(self._workers) + " workers, max in-flight " +
+                     str(self._max_inflight))
+            executor = ObjectRecoveryPartitionedExecutor(self._workers)
+        self._metrics.add_collector(lambda: self._collect_consumer_metrics(executor))
+        # Futures of records received but not yet acknowledged, in receive order.
+        inflight = []
+        try:
+            self.__receive_loop(term_signal, executor, inflight,
+                consumer_id, consumer_group, msg_topic, offset)
+        finally:
+            if executor is not None:
+                Log.info("Draining " + str(len(inflight)) + " in-flight records")
+                try:
+                    self.__drain_and_ack(inflight)
+                except Exception as exception:
+                    Log.error("Drain Exception : {}".format(exception))
+                executor.shutdown(wait=True)
+                Log.info("Idle workers took over " + str(executor.steals) + " records of busy partitions")
+
+    def __receive_loop(self,
+        term_signal,
+        executor,
+        inflight,
+        consumer_id,
+        consumer_group,
+        msg_topic,
+        offset):
+        """Receives messages and processes them inline or on executor."""
         while True:
             if term_signal.shutdown_signal:
                 Log.info("Shutting down s3backgroundconsumer")
@@ -125,7 +298,7 @@ class ObjectRecoveryMsgbus(object):
                         if not self._daemon_mode:
                             Log.debug("Not launched in daemon mode, so exitting.")
                             break
-                        time.sleep(self._sleep_time)
+                        time.sleep(self._backoff.failure())
                         continue
                 #Over here we can assume consumer is set up.
                 while True:
@@ -137,30 +310,49 @@ class ObjectRecoveryMsgbus(object):
                     if term_signal.shutdown_signal:
                         Log.info("Shutting down s3backgroundconsumer")
                         break
-                    Log.debug("Receiving msg from S3MessageBus")
-                    ret,message = self.__msgbuslib.receive(False)
+                    log_debug("Receiving msg from S3MessageBus")
+                    poll_start = time.monotonic()
+                    ret,message = self.__msgbuslib.receive(False, self._receive_timeout)
+                    poll_latency = time.monotonic() - poll_start
                     if ret and message is not None:
+                        # Messages are flowing, poll again right away.
+                        self._backoff.message_received(poll_latency)
                         # Process message can fail, but we still acknowledge the message
                         # The last step in process message is to delete the entry from
                         # probable delete index. Even if we acknowledge a message that
                         # has failed being processed it would eventually come back as
                         # the entry has not been deleted from probable delete index.
-                        Log.debug("Msg {}".format(str(message)))
-                        self.__process_msg(message.decode('utf-8'))
-                        self.__msgbuslib.ack()
+                        log_debug("Msg {}", message)
+                        msg = message.decode('utf-8')
+                        # Decoded once, for partitioning and for processing.
+                        probable_delete_records, leak_info = self._decode_msg(msg)
+                        if executor is None:
+                            self.__process_msg(msg, probable_delete_records, leak_info)
+                            self.__msgbuslib.ack()
+                        else:
+                            inflight.append(executor.submit(
+                                self._partition_key(probable_delete_records, leak_info),
+                                self.__process_msg, msg, probable_delete_records, leak_info))
+                            if len(inflight) >= self._max_inflight:
+                                self.__drain_and_ack(inflight)
                     else:
-                        Log.debug("Failed to receive msg from message bus : " + str(message))
+                        log_debug("Failed to receive msg from message bus : {}", message)
+                        # Queue is empty for now, finish and ack what is in flight.
+                        self.__drain_and_ack(inflight)
                         if not self._daemon_mode:
                             break
-                        #It works with/without sleep time but
-                        #In case of multiple exceptions, cpu utilization will be very high
-                        time.sleep(self._sleep_time)
+                        # Idle queue, back off exponentially up to consumer_sleep.
+                        time.sleep(self._backoff.empty_poll(poll_latency))
             except Exception as exception:
                 Log.error("Receive Data Exception : {} {}".format(exception, traceback.format_exc()))
-                self.__isconsumersetupcomplete = False                
-            finally:
-                time.sleep(self._sleep_time)
-            
+                # Records received on the failed consumer are redelivered, finish
+                # the ones in flight before setting up the consumer again.
+                wait(inflight)
+                inflight.clear()
+                self.__isconsumersetupcomplete = False
+                #In case of repeated exceptions, cpu utilization will be very high without sleep
+                time.sleep(self._backoff.failure())
+
             if not self._daemon_mode:
                 break
 
@@ -201,7 +393,7 @@ class ObjectRecoveryMsgbus(object):
         msg_type = None,
         delivery_mechanism = None):
         """Send message data."""
-        Log.debug("In send_data")
+        log_debug("In send_data")
 
         try:
             if not self.__isproducersetupcomplete:
@@ -213,7 +405,7 @@ class ObjectRecoveryMsgbus(object):
                     return False
 
             msgbody = json.dumps(data)
-            Log.debug("MsgBody : {}".format(msgbody))
+            log_debug("MsgBody : {}", msgbody)
             return self.__msgbuslib.send([msgbody])
 
         except Exception as exception:
@@ -221,6 +413,37 @@ class ObjectRecoveryMsgbus(object):
             self.__isproducersetupcomplete = False
             return False
 
+    def send_batch(self, records,
+        producer_id = None,
+        msg_type = None,
+        delivery_mechanism = None):
+        """Send records in one multi-message send, return records which need a retry."""
+        log_debug("In send_batch")
+        if not records:
+            return []
+
+        try:
+            if not self.__isproducersetupcomplete:
+                self.__setup_producer(producer_id,
+                                      msg_type,
+                                      delivery_mechanism)
+                if not self.__isproducersetupcomplete:
+                    Log.debug("send_batch producer connection issues")
+                    return list(records)
+
+            msgbodies = [json.dumps(record) for record in records]
+            ret, msg = self.__msgbuslib.send(msgbodies)
+            if not ret:
+                # Message bus send is all or nothing, whole batch is to be retried.
+                Log.error("send_batch of " + str(len(records)) + " records failed: " + str(msg))
+                return list(records)
+            return []
+
+        except Exception as exception:
+            Log.error("Exception:{}".format(exception))
+            self.__isproducersetupcomplete = False
+            return list(records)
+
     def purge(self):
         """Purge the messages."""
         Log.debug("In Purge")
@@ -261,3 +484,96 @@ class ObjectRecoveryMsgbus(object):
 #            self._logger.error("Exception:{}".format(exception))
 #            return 0
 
+
+class ObjectRecoveryMsgbusBatcher(object):
+
+    """Coalesces records into multi-message sends bounded by size and linger time."""
+
+    def __init__(self, msgbus, batch_size, linger_ms, producer_id = None):
+        """Initialize batcher on top of ObjectRecoveryMsgbus."""
+        self._msgbus = msgbus
+        self._batch_size = max(1, batch_size)
+        self._linger_sec = linger_ms / 1000.0
+        self._producer_id = producer_id
+        self._records = []
+        self._first_added = None
+
+    def add(self, record):
+        """Buffer record, send batch once it is full or lingered long enough.
+
+        Returns records of a flushed batch which failed and need a retry.
+        """
+        if not self._records:
+            self._first_added = time.monotonic()
+        self._records.append(record)
+        if (len(self._records) >= self._batch_size or
+                time.monotonic() - self._first_added >= self._linger_sec):
+            return self.flush()
+        return []
+
+    def flush(self):
+        """Send buffered records, return the ones which need a retry."""
+        if not self._records:
+            return []
+        records = self._records
+        self._records = []
+        self._first_added = None
+        return self._msgbus.send_batch(records, producer_id = self._producer_id)
+
+
+class ObjectRecoveryPollBackoff(object):
+
+    """Exponential backoff with jitter for polling an idle message bus."""
+
+    def __init__(self, min_sleep, max_sleep):
+        """Initialize backoff between min_sleep and max_sleep seconds."""
+        self._min_sleep = max(0.001, min(min_sleep, max_sleep))
+        self._max_sleep = max_sleep
+        self._delay = 0
+        self._idle_since = None
+        self._metrics = {"polls": 0, "messages": 0, "empty_polls": 0, "failures": 0,
+                         "slept_sec": 0.0, "receive_latency_sec_total": 0.0,
+                         "receive_latency_sec_max": 0.0,
+                         "idle_to_message_sec_total": 0.0, "idle_to_message_sec_max": 0.0}
+
+    def _sleep(self):
+        """Double delay and return jittered sleep from its upper half."""
+        self._delay = min(self._max_sleep, max(self._min_sleep, self._delay * 2))
+        sleep = random.uniform(self._delay / 2, self._delay)
+        self._metrics["slept_sec"] += sleep
+        return sleep
+
+    def message_received(self, receive_latency):
+        """Record poll which returned a message and reset backoff."""
+        self._metrics["polls"] += 1
+        self._metrics["messages"] += 1
+        self._metrics["receive_latency_sec_total"] += receive_latency
+        self._metrics["receive_latency_sec_max"] = max(
+            self._metrics["receive_latency_sec_max"], receive_latency)
+        if self._idle_since is not None:
+            # Time from queue going idle to next message, includes backoff sleeps.
+            idle_to_message = time.monotonic() - self._idle_since
+            self._metrics["idle_to_message_sec_total"] += idle_to_message
+            self._metrics["idle_to_message_sec_max"] = max(
+                self._metrics["idle_to_message_sec_max"], idle_to_message)
+            self._idle_since = None
+        self._delay = 0
+
+    def empty_poll(self, receive_latency):
+        """Record poll which returned no message, return seconds to sleep."""
+        self._metrics["polls"] += 1
+        self._metrics["empty_polls"] += 1
+        if self._idle_since is None:
+            self._idle_since = time.monotonic() - receive_latency
+        return self._sleep()
+
+    def failure(self):
+        """Record failed setup or receive, return seconds to sleep."""
+        self._metrics["failures"] += 1
+        return self._sleep()
+
+    def get_metrics(self):
+        """Return copy of poll metrics."""
+        metrics = dict(self._metrics)
+        metrics["current_delay_sec"] = self._delay
+        return metrics
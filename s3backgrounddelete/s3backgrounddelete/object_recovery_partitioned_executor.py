@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+ObjectRecoveryPartitionedExecutor runs leak records on worker threads,
+records of one object are processed one after another in receive order.
+"""
+import collections
+import itertools
+import threading
+from concurrent.futures import Future
+
+
+class ObjectRecoveryPartitionedExecutor(object):
+    """
+    Executor with one task queue (partition) per worker, tasks are placed by
+    hash of their key. A worker with an empty queue steals the newest task of
+    the longest other queue, provided no other task of the same key is queued
+    or running, so per key ordering is never broken.
+    """
+
+    def __init__(self, workers):
+        """Start workers."""
+        self._queues = [collections.deque() for _ in range(max(1, workers))]
+        # key -> number of queued and running tasks of key
+        self._pending = {}
+        self._running = set()
+        self._cond = threading.Condition()
+        self._shutdown = False
+        self._round_robin = itertools.count()
+        self.steals = 0
+        self._threads = [threading.Thread(target=self._work, args=(index,),
+                                          name="leak-worker-" + str(index), daemon=True)
+                         for index in range(len(self._queues))]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key, fn, *args):
+        """Queue fn(*args) in partition of key, return its Future."""
+        future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            if key is None:
+                # Unordered task, spread evenly.
+                key = object()
+                partition = next(self._round_robin) % len(self._queues)
+            else:
+                partition = hash(key) % len(self._queues)
+            self._queues[partition].append((key, future, fn, args))
+            self._pending[key] = self._pending.get(key, 0) + 1
+            self._cond.notify_all()
+        return future
+
+    def queue_lengths(self):
+        """Return number of queued tasks per partition."""
+        with self._cond:
+            return [len(queue) for queue in self._queues]
+
+    def _take(self, index):
+        """Return next task for worker, called with lock held."""
+        queue = self._queues[index]
+        if queue and queue[0][0] not in self._running:
+            return queue.popleft()
+        if queue:
+            # Head task waits for its key to finish on a stealing worker.
+            return None
+        victim = max(self._queues, key=len)
+        if len(victim) > 1:
+            task = victim[-1]
+            if self._pending[task[0]] == 1:
+                victim.pop()
+                self.steals += 1
+                return task
+        return None
+
+    def _work(self, index):
+        """Worker thread body."""
+        while True:
+            with self._cond:
+                task = self._take(index)
+                while task is None:
+                    if self._shutdown and not any(self._queues):
+                        return
+                    self._cond.wait()
+                    task = self._take(index)
+                self._running.add(task[0])
+            key, future, fn, args = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args)
+                except BaseException as exception:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+            with self._cond:
+                self._running.discard(key)
+                self._pending[key] -= 1
+                if self._pending[key] == 0:
+                    del self._pending[key]
+                self._cond.notify_all()
+
+    def shutdown(self, wait=True):
+        """Finish queued tasks and stop workers."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
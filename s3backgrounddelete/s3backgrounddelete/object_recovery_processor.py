@@ -25,6 +25,9 @@ the cortx message_bus message queue.
 
 import os
 import errno
+import socket
+import time
+import multiprocessing
 from s3backgrounddelete.cortx_s3_constants import MESSAGE_BUS
 import traceback
 import logging
@@ -35,6 +38,7 @@ from logging import handlers
 from s3backgrounddelete.cortx_s3_config import CORTXS3Config
 from s3backgrounddelete.cortx_s3_signal import DynamicConfigHandler
 from s3backgrounddelete.cortx_s3_signal import SigTermHandler
+from s3backgrounddelete.cortx_s3_metrics import start_metrics_exporters
 from cortx.utils.log import Log
 
 class ObjectRecoveryProcessor(object):
@@ -58,7 +62,55 @@ class ObjectRecoveryProcessor(object):
 
     def consume(self):
         """Consume the objects from object recovery queue."""
+        consumer_processes = self.config.get_msgbus_consumer_processes()
+        if consumer_processes > 1:
+            self.consume_with_processes(consumer_processes)
+        else:
+            self.consume_as_member()
+
+    def consume_with_processes(self, consumer_processes):
+        """Run consumer_processes consumer group members on this node and supervise them."""
+        Log.info("Starting " + str(consumer_processes) + " consumer processes")
+        context = multiprocessing.get_context("fork")
+        members = {}
+        daemon_mode = self.config.get_daemon_mode()
+        while not self.term_signal.shutdown_signal:
+            if members and not daemon_mode:
+                # Members exit once the queue is empty, wait for all of them.
+                if not any(member.is_alive() for member in members.values()):
+                    break
+                time.sleep(1)
+                continue
+            for member_index in range(consumer_processes):
+                member = members.get(member_index)
+                if member is None or not member.is_alive():
+                    if member is not None:
+                        Log.error("Consumer process " + str(member_index) + " exited with " +
+                                  str(member.exitcode) + ", restarting it")
+                    # Forked member inherits SIGTERM handler and sets its own copy of the flag.
+                    member = context.Process(target=self.consume_as_member, args=(member_index,),
+                                             name="s3backgroundconsumer-" + str(member_index))
+                    member.start()
+                    members[member_index] = member
+            time.sleep(1)
+        Log.info("Stopping consumer processes")
+        for member in members.values():
+            if member.is_alive():
+                member.terminate()
+        for member in members.values():
+            member.join()
+
+    def consume_as_member(self, member_index = None):
+        """Consume the objects as one consumer group member."""
+        consumer_id = None
+        if member_index is not None:
+            consumer_id = self.config.get_msgbus_consumer_id_prefix() + \
+                str(socket.gethostname()) + "_" + str(member_index)
         self.server = None
+        metrics_port = self.config.get_metrics_consumer_port()
+        if metrics_port and member_index is not None:
+            metrics_port += member_index
+        start_metrics_exporters(self.config, metrics_port)
         try:
             #Conditionally importing ObjectRecoveryMsgbusConsumer when config setting says so.
             if self.config.get_messaging_platform() == MESSAGE_BUS:
@@ -73,7 +125,7 @@ class ObjectRecoveryProcessor(object):
 
             Log.info("Consumer started at " +
                             str(datetime.datetime.now()))
-            self.server.receive_data(self.term_signal)
+            self.server.receive_data(self.term_signal, consumer_id)
         except BaseException:
             if self.server:
                 self.server.close()
@@ -31,8 +31,6 @@ import time
 import logging
 from logging import handlers
 import datetime
-import math
-import json
 import signal
 import sys
 
@@ -42,9 +40,16 @@ from s3backgrounddelete.cortx_s3_signal import DynamicConfigHandler
 from s3backgrounddelete.cortx_s3_constants import MESSAGE_BUS
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_PRODUCER
 from s3backgrounddelete.cortx_s3_signal import SigTermHandler
+from s3backgrounddelete.object_recovery_enqueue_tracker import ObjectRecoveryEnqueueTracker
+from s3backgrounddelete.cortx_s3_timestamp import is_older_than, now_timestamp, select_older_than
+from s3backgrounddelete.cortx_s3_metrics import get_metrics_registry, start_metrics_exporters
+from s3backgrounddelete.cortx_s3_log import CORTXS3LogSampler, log_debug, log_info
 from cortx.utils.log import Log
 #from s3backgrounddelete.IEMutil import IEMutil
 
+# Enqueue only new or changed records instead of purge and reload of the topic
+INCREMENTAL_ENQUEUE_MODE = "incremental"
+
 class ObjectRecoveryScheduler(object):
     """Scheduler which will add key value to message_bus queue."""
 
@@ -63,27 +68,38 @@ class ObjectRecoveryScheduler(object):
         self.signal = DynamicConfigHandler(self)
         Log.info("Initialising the Object Recovery Scheduler")
         self.producer = None
+        self.batcher = None
+        self.enqueue_tracker = None
+        if self.config.get_msgbus_producer_enqueue_mode() == INCREMENTAL_ENQUEUE_MODE:
+            Log.info("Producer enqueues new or changed records only")
+            self.enqueue_tracker = ObjectRecoveryEnqueueTracker(
+                self.config.get_msgbus_incremental_resend_interval())
         self.producer_name = producer_name
         self.term_signal = SigTermHandler()
+        self.metrics = get_metrics_registry()
+        self.record_sampler = CORTXS3LogSampler(self.config.get_record_log_sample_rate())
+        start_metrics_exporters(self.config, self.config.get_metrics_producer_port())
 
     @staticmethod
-    def isObjectLeakEntryOlderThan(leakRecord, OlderInMins = 15):
-        object_leak_time = leakRecord["create_timestamp"]
-        now = datetime.datetime.utcnow()
-        date_time_obj = datetime.datetime.strptime(object_leak_time, "%Y-%m-%dT%H:%M:%S.000Z")
-        timeDelta = now - date_time_obj
-        timeDeltaInMns = math.floor(timeDelta.total_seconds()/60)
-        return (timeDeltaInMns >= OlderInMins)
+    def isObjectLeakEntryOlderThan(leakRecord, OlderInMins = 15, now = None):
+        return is_older_than(leakRecord["create_timestamp"], OlderInMins, now)
 
     def add_kv_to_msgbus(self, marker = None):
         """Add object key value to msgbus topic."""
         Log.info("Inside add_kv_to_msgbus.")
+        cycle_start = time.monotonic()
         try:
             from s3backgrounddelete.object_recovery_msgbus import ObjectRecoveryMsgbus
+            from s3backgrounddelete.object_recovery_msgbus import ObjectRecoveryMsgbusBatcher
 
             if not self.producer:
                 self.producer = ObjectRecoveryMsgbus(
                     self.config)
+                self.batcher = ObjectRecoveryMsgbusBatcher(
+                    self.producer,
+                    self.config.get_msgbus_producer_batch_size(),
+                    self.config.get_msgbus_producer_batch_linger_ms(),
+                    producer_id = self.producer_name)
 #            threshold = self.config.get_threshold()
 #            self.logger.debug("Threshold is : " + str(threshold))
             if self.term_signal.shutdown_signal == True:
@@ -103,61 +119,151 @@ class ObjectRecoveryScheduler(object):
 #            if self.term_signal.shutdown_signal == True:
 #                self.logger.info("Shutting down s3backgroundproducer service.")
 #                sys.exit(0)
-            self.producer.purge()
-            result, index_response = CORTXS3IndexApi(
-                self.config, connectionType=CONNECTION_TYPE_PRODUCER).list(
-                    self.config.get_probable_delete_index_id(), self.config.get_max_keys(), marker)
-            if result and not self.term_signal.shutdown_signal:
-                Log.info("Index listing result :" +
-                                 str(index_response.get_index_content()))
-                probable_delete_json = index_response.get_index_content()
-                probable_delete_oid_list = probable_delete_json["Keys"]
-                is_truncated = probable_delete_json["IsTruncated"]
-                if (probable_delete_oid_list is not None and not self.term_signal.shutdown_signal):
-                    for record in probable_delete_oid_list:
-                        # Check if record is older than the pre-configured 'time to process' delay
-                        leak_processing_delay = self.config.get_leak_processing_delay_in_mins()
-                        try:
-                            objLeakVal = json.loads(record["Value"])
-                        except ValueError as error:
-                            Log.error(
-                            "Failed to parse JSON data for: " + str(record) + " due to: " + error)
-                            continue
-
-                        if (objLeakVal is None):
-                            Log.error("No value associated with " + str(record) + ". Skipping entry")
-                            continue
-
-                        # Check if object leak entry is older than 15mins or a preconfigured duration
-                        if (not ObjectRecoveryScheduler.isObjectLeakEntryOlderThan(objLeakVal, leak_processing_delay)):
-                            Log.info("Object leak entry " + record["Key"] +
-                                            " is NOT older than " + str(leak_processing_delay) +
-                                            "mins. Skipping entry")
-                            continue
-
-                        Log.info(
-                            "Object recovery queue sending data :" +
-                            str(record))
-                        ret = self.producer.send_data(record, producer_id = self.producer_name)
-                        if not ret:
-                            # TODO - Do Audit logging
-                            Log.error(
-                                "Object recovery queue send data "+ str(record) +
-                                " failed :")
-                        else:
-                            Log.info(
-                                "Object recovery queue send data successfully :" +
-                                str(record))
-                else:
+            if self.enqueue_tracker is None:
+                self.producer.purge()
+            if marker is None:
+                marker = self.load_resume_marker()
+            if marker is not None:
+                Log.info("Resuming probable delete index listing after marker " + str(marker))
+            # Only a walk over the whole index tells which tracked keys are gone.
+            full_walk = marker is None
+            if self.enqueue_tracker is not None:
+                self.enqueue_tracker.start_walk()
+            index_api = CORTXS3IndexApi(self.config, connectionType=CONNECTION_TYPE_PRODUCER)
+            for result, index_response in index_api.list_pages(
+                    self.config.get_probable_delete_index_id(), self.config.get_max_keys(), marker):
+                if self.term_signal.shutdown_signal:
+                    break
+                if not result:
+                    Log.error("Failed to retrive Index listing:")
+                    break
+                # Records are decoded one by one from the listing page.
+                record_count = self.add_records_to_msgbus(index_response.iter_records())
+                if (record_count == 0):
                     Log.info(
                         "Index listing result empty. Ignoring adding entry to object recovery queue")
-            else:
-                Log.error("Failed to retrive Index listing:")
+                # Page is enqueued, a restart continues from the next one.
+                listing_header = index_response.get_listing_header()
+                if CORTXS3IndexApi.is_truncated(listing_header):
+                    self.save_resume_marker(listing_header["NextMarker"])
+                else:
+                    self.save_resume_marker(None)
+                    if self.enqueue_tracker is not None and full_walk:
+                        self.enqueue_tracker.finish_walk()
+                        Log.info("Tracking " + str(len(self.enqueue_tracker)) + " enqueued records")
         except Exception as exception:
             Log.error(
                 "add_kv_to_msgbus send data exception: {}".format(exception))
             Log.debug(
                 "traceback : {}".format(traceback.format_exc()))
+        finally:
+            cycle_duration = time.monotonic() - cycle_start
+            self.metrics.observe("s3bgd_producer_cycle_seconds", cycle_duration)
+            self.metrics.set("s3bgd_producer_last_cycle_seconds", cycle_duration)
+
+    def add_records_to_msgbus(self, probable_delete_records):
+        """
+        Send CORTXS3IndexRecord's of one listing page which are old enough
+        to msgbus topic, return number of records in the page.
+        """
+        leak_records = []
+        record_count = 0
+        for record in probable_delete_records:
+            record_count += 1
+            try:
+                objLeakVal = record.get_json_value()
+            except ValueError as error:
+                Log.error(
+                "Failed to parse JSON data for: " + str(record) + " due to: " + str(error))
+                continue
+
+            if (objLeakVal is None):
+                Log.error("No value associated with " + str(record) + ". Skipping entry")
+                continue
+            leak_records.append((record, objLeakVal))
+
+        # Check if object leak entries are older than 15mins or a preconfigured
+        # duration, all records of the page against one snapshot of now.
+        leak_processing_delay = self.config.get_leak_processing_delay_in_mins()
+        old_enough = select_older_than(
+            [objLeakVal["create_timestamp"] for _, objLeakVal in leak_records],
+            leak_processing_delay, now_timestamp())
+        skipped_young = 0
+        skipped_enqueued = 0
+        for (record, objLeakVal), is_old_enough in zip(leak_records, old_enough):
+            if (not is_old_enough):
+                self.record_sampler.info("Object leak entry {} is NOT older than {}mins. Skipping entry",
+                                         record["Key"], leak_processing_delay)
+                skipped_young += 1
+                continue
+
+            if (self.enqueue_tracker is not None and
+                    not self.enqueue_tracker.should_send(record["Key"], record["Value"])):
+                log_debug("Object leak entry {} is already enqueued. Skipping entry", record["Key"])
+                skipped_enqueued += 1
+                continue
+            self.record_sampler.info("Object recovery queue sending data :{}", record)
+            if self.enqueue_tracker is not None:
+                self.enqueue_tracker.mark_enqueued(record["Key"], record["Value"])
+            self.log_failed_records(self.batcher.add(record.to_dict()))
+        # Flush the page before its resume marker gets persisted.
+        self.log_failed_records(self.batcher.flush())
+        log_info("Index listing result : {} records, {} enqueued, {} not older than {}mins, "
+                 "{} already enqueued, {} without value", record_count,
+                 len(leak_records) - skipped_young - skipped_enqueued, skipped_young,
+                 leak_processing_delay, skipped_enqueued, record_count - len(leak_records))
+        self.metrics.inc("s3bgd_records_listed_total", record_count)
+        self.metrics.inc("s3bgd_records_enqueued_total",
+                         len(leak_records) - skipped_young - skipped_enqueued)
+        self.metrics.inc("s3bgd_records_skipped_total", skipped_young, {"reason": "not_old_enough"})
+        self.metrics.inc("s3bgd_records_skipped_total", skipped_enqueued, {"reason": "already_enqueued"})
+        self.metrics.inc("s3bgd_records_failed_total", record_count - len(leak_records), {"reason": "bad_format"})
+        return record_count
+
+    def log_failed_records(self, failed_records):
+        """Report records whose send to msgbus failed and need a retry."""
+        if self.enqueue_tracker is not None:
+            # Send them again on the next cycle.
+            for record in failed_records:
+                self.enqueue_tracker.forget(record["Key"])
+        if failed_records:
+            self.metrics.inc("s3bgd_records_send_failed_total", len(failed_records))
+            # TODO - Do Audit logging
+            Log.error(
+                "Object recovery queue send data failed, records to be retried : " +
+                str([record["Key"] for record in failed_records]))
+
+    def load_resume_marker(self):
+        """Return marker persisted by an interrupted listing or None."""
+        marker_file = self.config.get_resume_marker_file()
+        if not marker_file or not os.path.isfile(marker_file):
+            return None
+        try:
+            with open(marker_file, 'r') as fd:
+                marker = fd.read()
+        except OSError as e:
+            Log.error("Failed to read resume marker from " + marker_file + " : " + str(e))
+            return None
+        return marker if marker else None
+
+    def save_resume_marker(self, marker):
+        """Persist marker to resume listing from, None once listing is complete."""
+        marker_file = self.config.get_resume_marker_file()
+        if not marker_file:
+            return
+        try:
+            if marker is None:
+                if os.path.isfile(marker_file):
+                    os.remove(marker_file)
+                return
+            os.makedirs(os.path.dirname(marker_file), exist_ok=True)
+            tmp_marker_file = marker_file + ".tmp"
+            with open(tmp_marker_file, 'w') as fd:
+                fd.write(marker)
+            # Replace in one step so that a crash never leaves a partial marker.
+            os.replace(tmp_marker_file, marker_file)
+        except OSError as e:
+            Log.error("Failed to save resume marker to " + marker_file + " : " + str(e))
 
     def schedule_periodically(self):
         """Schedule producer to add key value to message_bus queue on hourly basis."""
@@ -22,15 +22,16 @@ ObjectRecoveryValidator acts as object validator which performs necessary action
 """
 import logging
 import json
-from datetime import datetime
 
 from s3backgrounddelete.cortx_s3_kv_api import CORTXS3KVApi
 from s3backgrounddelete.cortx_s3_object_api import CORTXS3ObjectApi
 from s3backgrounddelete.cortx_s3_index_api import CORTXS3IndexApi
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_PRODUCER
+from s3backgrounddelete.object_recovery_instance_cache import ObjectRecoveryInstanceCache
+from s3backgrounddelete.cortx_s3_timestamp import is_older_than
+from s3backgrounddelete.cortx_s3_log import CORTXS3RecordLog
 from cortx.utils.log import Log
-import math
 
 #zero/null object oid in base64 encoded format
 NULL_OBJ_OID = "AAAAAAAAAAA=-AAAAAAAAAAA="
@@ -39,11 +40,20 @@ class ObjectRecoveryValidator:
     """This class is implementation of Validator for object recovery."""
 
     def __init__(self, config, probable_delete_records,
-                 objectapi=None, kvapi=None, indexapi=None):
-        """Initialise Validator"""
+                 objectapi=None, kvapi=None, indexapi=None, instance_cache=None,
+                 record_log=None, leak_info=None):
+        """Initialise Validator, leak_info is Value of record if it is already decoded."""
         self.config = config
+        # Errors are always logged, INFO trace of a record only if it is sampled.
+        if(record_log is None):
+            self._log = CORTXS3RecordLog()
+        else:
+            self._log = record_log
         self.current_obj_in_VersionList = None
         self.probable_delete_records = probable_delete_records
+        self._leak_info = leak_info
+        # Set once leak entry is removed from probable delete index.
+        self.leak_entry_deleted = False
         if(objectapi is None):
             self._objectapi = CORTXS3ObjectApi(self.config, connectionType=CONNECTION_TYPE_CONSUMER)
         else:
@@ -56,70 +66,73 @@ class ObjectRecoveryValidator:
             self._indexapi = CORTXS3IndexApi(self.config, connectionType=CONNECTION_TYPE_CONSUMER)
         else:
             self._indexapi = indexapi
+        if(instance_cache is None):
+            self._instance_cache = ObjectRecoveryInstanceCache.get_instance(
+                self.config.get_instance_cache_ttl())
+        else:
+            self._instance_cache = instance_cache
 
-    def isVersionEntryOlderThan(self, versionInfo, older_in_mins = 15):
+    def isVersionEntryOlderThan(self, versionInfo, older_in_mins = 15, now = None):
         if (versionInfo is None):
             return False
 
-        object_version_time = versionInfo["create_timestamp"]
-        now = datetime.utcnow()
-        date_time_obj = datetime.strptime(object_version_time, "%Y-%m-%dT%H:%M:%S.000Z")
-        timedelta = now - date_time_obj
-        timedelta_mns = math.floor(timedelta.total_seconds()/60)
-        return (timedelta_mns >= older_in_mins)
+        return is_older_than(versionInfo["create_timestamp"], older_in_mins, now)
 
     def delete_object_from_storage(self, obj_oid, layout_id, pvid_str):
         status = False
-        Log.info("pvid_str : " + pvid_str)
+        self._log.info("pvid_str : {}", pvid_str)
         ret, response = self._objectapi.delete(obj_oid, layout_id, pvid_str)
         if (ret):
             status = ret
-            Log.info("Deleted obj " + obj_oid + " from motr store")
+            self._log.info("Deleted obj {} from motr store", obj_oid)
         elif (response.get_error_status() == 404):
-            Log.info("The specified object " + obj_oid + " does not exist")
+            self._log.info("The specified object {} does not exist", obj_oid)
             status = True
         else:
-            Log.info("Failed to delete obj " + obj_oid + " from motr store")
+            self._log.info("Failed to delete obj {} from motr store", obj_oid)
             self.logAPIResponse("VERSION DEL", "", obj_oid, response)
         return status
 
     def delete_index(self, index_id):
         ret, response = self._indexapi.delete(index_id)
         if (ret):
-            Log.info("Deleted index: " + index_id)
+            self._log.info("Deleted index: {}", index_id)
         elif (response.get_error_status() == 404):
             # Index not found
-            Log.info("Index " + index_id + " does not exist")
+            self._log.info("Index {} does not exist", index_id)
             ret = True
         else:
-            Log.info("Failed to delete index " + index_id)
+            self._log.info("Failed to delete index {}", index_id)
             self.logAPIResponse("DEL INDEX", index_id, "", response)
         return ret
 
     def delete_key_from_index(self, index_id, key_id, api_prefix):
         ret, response = self._kvapi.delete(index_id, key_id)
         if (ret):
-            Log.info("Deleted Key " + key_id + " from index " + index_id)
+            self._log.info("Deleted Key {} from index {}", key_id, index_id)
         elif (response.get_error_status() == 404):
             # Item not found
-            Log.info("key " + key_id + " does not exist in index " + index_id)
+            self._log.info("key {} does not exist in index {}", key_id, index_id)
             ret = True
         else:
-            Log.info("Failed to delete key " + key_id + " from index " + index_id)
+            self._log.info("Failed to delete key {} from index {}", key_id, index_id)
             self.logAPIResponse(api_prefix, index_id, key_id, response)
+        if (ret and index_id == self.config.get_probable_delete_index_id() and
+                key_id == self.probable_delete_records["Key"]):
+            self.leak_entry_deleted = True
         return ret
 
     def get_key_from_index(self, index_id, key):
         ret, response_data = self._kvapi.get(index_id, key)
         if (ret):
             # Found key in index
-            Log.info("Key "+ str(key) + " exists in index " + str(index_id))
+            self._log.info("Key {} exists in index {}", key, index_id)
             return ret, response_data
         elif (response_data.get_error_status() == 404):
-            Log.info("Key "+ str(key) + " does not exist in index " + str(index_id))
+            self._log.info("Key {} does not exist in index {}", key, index_id)
             return True, None
         else:
-            Log.info("Failed to retrieve key " + str(key) + " from index " + str(index_id))
+            self._log.info("Failed to retrieve key {} from index {}", key, index_id)
             self.logAPIResponse("GET INDEX", index_id, key, response_data)
             return ret, None
 
@@ -132,13 +145,13 @@ class ObjectRecoveryValidator:
             status = ret
             if (response_data is not None):
                 # Found key in index
-                Log.info("Key: " + str(key_in_index) + " exists in index " + str(indx_id))
-                Log.info("Version details: " + str(response_data.get_value()))
+                self._log.info("Key: {} exists in index {}", key_in_index, indx_id)
+                self._log.info("Version details: {}", response_data.get_value())
                 objInfo = json.loads(response_data.get_value())
             else:
-                Log.info("Key: " + str(key_in_index) + " does not exist in index " + str(indx_id))
+                self._log.info("Key: {} does not exist in index {}", key_in_index, indx_id)
         else:
-            Log.info("Key: " + str(key_in_index) + " does not exist in index " + str(indx_id))
+            self._log.info("Key: {} does not exist in index {}", key_in_index, indx_id)
 
         return status, objInfo
 
@@ -151,12 +164,11 @@ class ObjectRecoveryValidator:
 
     def logAPIResponse(self, resAPI, oid, key, response):
         if (response.get_error_status() != 200):
-            Log.info("Failed API " + resAPI + " on Oid= " + str(oid) + ", Key= " + str(key) +
-                              " Response: " + str(response.get_error_status()) + " " +
-                              str(response.get_error_message()))
+            self._log.info("Failed API {} on Oid= {}, Key= {} Response: {} {}",
+                resAPI, oid, key, response.get_error_status(), response.get_error_message())
 
     def process_probable_delete_record(self, delete_entry = False, delete_obj_from_store = False):
-        Log.info("process_probable_delete_record Entry")
+        self._log.info("process_probable_delete_record Entry")
         object_version_list_index_id = self.object_leak_info["objects_version_list_index_oid"]
         object_extended_md_index_id = None
         status = False
@@ -192,8 +204,8 @@ class ObjectRecoveryValidator:
         if "fno" in self.object_leak_info :
             frag_no = self.object_leak_info["fno"]
 
-        Log.info("frag_no : " + str(frag_no))
-        Log.info("part_no : " + str(part_no))
+        self._log.info("frag_no : {}", frag_no)
+        self._log.info("part_no : {}", part_no)
 
         if (parent_oid != NULL_OBJ_OID and part_no != 0):
             # This is part of a multipart object
@@ -211,7 +223,7 @@ class ObjectRecoveryValidator:
                             ext_ver_id + "|" + "P" + \
                             str(part_no) + "|" + "F" + \
                             str(frag_no)
-                Log.info("obj_ext_key : " + obj_ext_key)
+                self._log.info("obj_ext_key : {}", obj_ext_key)
 
 
         if (delete_obj_from_store):
@@ -220,26 +232,24 @@ class ObjectRecoveryValidator:
 
             if object_extended_md_index_id is not None and \
                     object_extended_md_index_id != NULL_OBJ_OID:
-                Log.info("Extended Metadata Index is present.")
+                self._log.info("Extended Metadata Index is present.")
                 index_key_list.clear()
                 index_key_list.append((object_extended_md_index_id, obj_ext_key, \
                                 ext_motr_oid_key, ext_layout_id_key, ext_api_prefix))
 
             for (index, key_in_index, oid_key, layout_id_key, api_prefix) in index_key_list:
                 if ((index is None) or (key_in_index is None) or (len(key_in_index) == 0)):
-                    Log.info("Either key: " + str(key_in_index) +
-                                      " or index: " + str(index) + " is Empty")
+                    self._log.info("Either key: {} or index: {} is Empty", key_in_index, index)
                     continue
 
-                Log.info("key: " + key_in_index +
-                                      " index: " + index )
+                self._log.info("key: {} index: {}", key_in_index, index)
                 if api_prefix == ext_api_prefix:
                     # Leak entry is probably the extended object of multipart
                     status = self.del_obj_from_extended_index(index, key_in_index, \
                                                 oid_key, layout_id_key, pvid_key, api_prefix)
                     if (not status):
-                        Log.info("Failed to delete object using " + key_in_index +
-                                        " from extended index " + index)
+                        self._log.info("Failed to delete object using {} from extended index {}",
+                            key_in_index, index)
                     # Break from here: Single version entry for all extended objects
                     # will be removed separately using multipart parent leak entry
                     break
@@ -248,8 +258,8 @@ class ObjectRecoveryValidator:
                     status = self.del_obj_from_ver_index(index, key_in_index, \
                                                 oid_key, layout_id_key, pvid_key, api_prefix)
                 if (not status):
-                    Log.info("Failed to delete object using " + key_in_index +
-                                      " from version index " + index)
+                    self._log.info("Failed to delete object using {} from version index {}",
+                        key_in_index, index)
         else:
              status = True
   
@@ -258,8 +268,8 @@ class ObjectRecoveryValidator:
         # previous status is True
         if (status and delete_entry):
             probable_index_id = self.config.get_probable_delete_index_id()
-            Log.info("Deleting Entry from PDI with Key : " + leak_rec_key + \
-                                "from index : " + probable_index_id)
+            self._log.info("Deleting Entry from PDI with Key : {}from index : {}",
+                leak_rec_key, probable_index_id)
             if (delete_entry and leak_rec_key is not None):
                 status = self.delete_key_from_index(probable_index_id, leak_rec_key, "PROBABALE INDEX DEL")
 
@@ -273,8 +283,8 @@ class ObjectRecoveryValidator:
             # Fetch entry from extended index list
             status, keyInfo = self.get_object_Entry(index_id, key_in_index)
             if (not status):
-                Log.info("Error! Failed to get object with key " + key_in_index +
-                    " from index" + index_id)
+                self._log.info("Error! Failed to get object with key {} from index{}",
+                    key_in_index, index_id)
                 return status
 
             if (keyInfo is not None):
@@ -284,18 +294,62 @@ class ObjectRecoveryValidator:
                 # Delete extended object from motr store
                 status = self.delete_object_from_storage(obj_oid, layout_id, pvid)
                 if (status):
-                    Log.info("Deleted object with oid " + obj_oid + " from motr store")
+                    self._log.info("Deleted object with oid {} from motr store", obj_oid)
                 else:
-                    Log.info("Failed to delete object with oid [" + obj_oid + "] from motr store")
+                    self._log.info("Failed to delete object with oid [{}] from motr store", obj_oid)
             else:
-                Log.info("The key: " + key_in_index + " does not exist.")
+                self._log.info("The key: {} does not exist.", key_in_index)
                 # status = self.delete_object_from_storage(self.object_leak_id, self.object_leak_layout_id, self.pvid_str)
 
             if (status):
                 #EXTENDED LIST ENTRY DEL
                 status = self.delete_key_from_index(index_id, key_in_index, api_prefix)
                 if (status):
-                    Log.info("Deleted key " + key_in_index + " from index " + index_id)
+                    self._log.info("Deleted key {} from index {}", key_in_index, index_id)
+        return status
+
+    def del_objs_from_extended_index(self, index_id, keys_in_index, \
+                            obj_oid_key_in_value, layout_id_key_in_value, \
+                            pvid_key_in_value, api_prefix):
+        """Bulk variant of del_obj_from_extended_index, return True if all keys are processed."""
+        status = True
+        object_keys = []
+        objects = []
+        for key_in_index, (ret, response_data) in zip(keys_in_index,
+                self._kvapi.get_many(index_id, keys_in_index)):
+            if (ret):
+                keyInfo = json.loads(response_data.get_value())
+                object_keys.append(key_in_index)
+                objects.append((keyInfo[obj_oid_key_in_value], keyInfo[layout_id_key_in_value],
+                                keyInfo[pvid_key_in_value]))
+            elif (response_data is not None and response_data.get_error_status() == 404):
+                self._log.info("The key: {} does not exist.", key_in_index)
+            else:
+                self._log.info("Error! Failed to get object with key {} from index{}",
+                    key_in_index, index_id)
+                status = False
+
+        keys_to_delete = []
+        for key_in_index, obj, (ret, response) in zip(object_keys, objects,
+                self._objectapi.delete_many(objects)):
+            obj_oid = obj[0]
+            if (ret or (response is not None and response.get_error_status() == 404)):
+                self._log.info("Deleted object with oid {} from motr store", obj_oid)
+                keys_to_delete.append(key_in_index)
+            else:
+                self._log.info("Failed to delete object with oid [{}] from motr store", obj_oid)
+                status = False
+
+        #EXTENDED LIST ENTRY DEL
+        for key_in_index, (ret, response) in zip(keys_to_delete,
+                self._kvapi.delete_many(index_id, keys_to_delete)):
+            if (ret or (response is not None and response.get_error_status() == 404)):
+                self._log.info("Deleted key {} from index {}", key_in_index, index_id)
+            else:
+                self._log.info("Failed to delete key {} from index {}", key_in_index, index_id)
+                if (response is not None):
+                    self.logAPIResponse(api_prefix, index_id, key_in_index, response)
+                status = False
         return status
 
     def del_obj_from_ver_index(self, index_id, key_in_index, \
@@ -306,8 +360,8 @@ class ObjectRecoveryValidator:
             # Fetch version from version list
             status, keyInfo = self.get_object_Entry(index_id, key_in_index)
             if (not status):
-                Log.info("Error! Failed to get object with key " + key_in_index +
-                    " from index" + index_id)
+                self._log.info("Error! Failed to get object with key {} from index{}",
+                    key_in_index, index_id)
                 return status
 
             if (keyInfo is not None):
@@ -321,62 +375,50 @@ class ObjectRecoveryValidator:
                 # or needs to be passed to this function. 
                 status = self.delete_object_from_storage(obj_oid, layout_id, pvid)
                 if (status):
-                    Log.info("Deleted object with oid " + obj_oid + " from motr store")
+                    self._log.info("Deleted object with oid {} from motr store", obj_oid)
                 else:
-                    Log.info("Failed to delete object with oid [" + obj_oid + "] from motr store")
+                    self._log.info("Failed to delete object with oid [{}] from motr store", obj_oid)
             else:
-                Log.info("The key: " + key_in_index + " does not exist. Delete motr object")
+                self._log.info("The key: {} does not exist. Delete motr object", key_in_index)
                 status = self.delete_object_from_storage(self.object_leak_id, self.object_leak_layout_id, self.pvid_str)
 
             if (status):
                 #"VERSION LIST DEL"
                 status = self.delete_key_from_index(index_id, key_in_index, api_prefix)
                 if (status):
-                    Log.info("Deleted key " + key_in_index + " from index " + index_id)
+                    self._log.info("Deleted key {} from index {}", key_in_index, index_id)
 
         return status
 
     def check_instance_is_nonactive(self, instance_id, marker=None):
         """Checks for existence of instance_id inside global instance index"""
 
-        result, instance_response = self._indexapi.list(
-                    self.config.get_global_instance_index_id(), self.config.get_max_keys(), marker)
-        if(result):
-            # List global instance index is success.
-            Log.info("Index listing result :" +
-                             str(instance_response.get_index_content()))
-            global_instance_json = instance_response.get_index_content()
-            global_instance_list = global_instance_json["Keys"]
-            is_truncated = global_instance_json["IsTruncated"]
-
-            if(global_instance_list is not None):
-                for record in global_instance_list:
-                    if(record["Value"] == instance_id):
-                        # instance_id found. Skip entry and retry for delete oid again.
-                        Log.info("S3 Instance is still active. Skipping delete operation")
-                        return False
-
-                if(is_truncated == "true"):
-                    self.check_instance_is_nonactive(instance_id, global_instance_json["NextMarker"])
-
-            # List global instance index results is empty hence instance_id not found.
-            return True
-
-        else:
+        active_instances = self._instance_cache.get_active_instances(self._indexapi,
+            self.config.get_global_instance_index_id(), self.config.get_max_keys())
+        if (active_instances is None):
             # List global instance index is failed.
             Log.error("Failed to list global instance index")
             return False
 
+        if (instance_id in active_instances):
+            # instance_id found. Skip entry and retry for delete oid again.
+            self._log.info("S3 Instance is still active. Skipping delete operation")
+            return False
+
+        # instance_id not found in global instance index.
+        return True
+
     def process_results(self):
         # Execute object leak algorithm by processing each of the entries from message_bus
         probable_delete_oid = self.probable_delete_records["Key"]
         probable_delete_value = self.probable_delete_records["Value"]
         
-        Log.info(
-            "Probable object id to be deleted : " +
-            probable_delete_oid)
+        self._log.info("Probable object id to be deleted : {}", probable_delete_oid)
         try:
-            self.object_leak_info = json.loads(probable_delete_value)
+            if (self._leak_info is None):
+                self.object_leak_info = json.loads(probable_delete_value)
+            else:
+                self.object_leak_info = self._leak_info
             # Object size based prefix
             self.oid_prefix = probable_delete_oid[:1]
             self.object_leak_id = probable_delete_oid[1:]
@@ -441,7 +483,7 @@ class ObjectRecoveryValidator:
         if "part" in self.object_leak_info:
             part_no = self.object_leak_info["part"]
 
-        Log.info("Processing extended list with total parts = " + str(part_no))
+        self._log.info("Processing extended list with total parts = {}", part_no)
         extended_key_prefix = self.object_leak_info["object_key_in_index"] + "|" + \
             self.object_leak_info["ext_version_id"] + "|" + "P"
 
@@ -450,16 +492,16 @@ class ObjectRecoveryValidator:
             parent_oid = self.object_leak_info["parent_oid"]
 
         if (parent_oid == NULL_OBJ_OID and part_no != 0):
-            # This is parent multipart object. Process extended entries
-            for part in range(1, part_no + 1):
-                extended_key = extended_key_prefix + str(part) + "|" + "F1"
-                Log.info("Processing extended entry with key " + extended_key)
-                status = self.del_obj_from_extended_index(object_extended_list_index, extended_key, \
+            # This is parent multipart object. Process extended entries in
+            # chunks, each with bulk get, object delete and key delete.
+            bStatus = True
+            chunk_size = self.config.get_max_keys()
+            for first_part in range(1, part_no + 1, chunk_size):
+                extended_keys = [extended_key_prefix + str(part) + "|" + "F1"
+                                 for part in range(first_part, min(first_part + chunk_size, part_no + 1))]
+                status = self.del_objs_from_extended_index(object_extended_list_index, extended_keys, \
                                     ext_motr_oid_key, ext_layout_id_key, ext_pvid_key, ext_api_prefix)
-                bStatus = status
-                if (not status):
-                    Log.info("Failed to delete object using key [" + extended_key + \
-                                    "] from extended index ")
+                bStatus = bStatus and status
 
         return bStatus
 
@@ -468,75 +510,105 @@ class ObjectRecoveryValidator:
         """
         Identify object leak due to parallel PUT using the version list.
         Initial marker should be: object key name + "/"
+        Next listing page is fetched while leaked versions of current page are deleted.
         """
         bStatus = False
         if (object_version_list_index is None or callback is None or current_oid is None):
             return bStatus
-        Log.info("Processing version list for object leak oid " + self.object_leak_id)
+        self._log.info("Processing version list for object leak oid {}", self.object_leak_id)
         object_key = self.object_leak_info["object_key_in_index"]
-        if (object_version_list_index is not None):
-            extra_qparam = {'Prefix':object_key}
-            ret, response_data = self._indexapi.list(object_version_list_index,
-                self.config.get_max_keys(), marker, extra_qparam)
-            if (ret):
-                Log.info("Version listing result for object " + object_key + ": " +
-                                str(response_data.get_index_content()))
-
-                object_versions = response_data.get_index_content()
-                object_version_list = object_versions["Keys"]
-                is_truncated = object_versions["IsTruncated"]
-                bStatus = ret
-                if (object_version_list is not None):
-                    Log.info("Processing " + str(len(object_version_list)) +
-                        " objects in version list = " + str(object_version_list))
-
-                    for object_version in object_version_list:
-                        Log.info(
-                            "Fetched object version: " +
-                            str(object_version))
-                        obj_ver_key = object_version["Key"]
-                        obj_ver_md = json.loads(object_version["Value"])
-                        # Call the callback to process version entry
-                        cb_status = callback(obj_ver_md, current_oid, timeVersionEntry)
-
-                        if (cb_status == True):
-                            Log.info("Leak detected: Delete version object and version entry for key: " + obj_ver_key)
-                            # Delete object from store and delete the version entry from the version list
-                            status = self.del_obj_from_ver_index(object_version_list_index, obj_ver_key, \
-                                                            "motr_oid", "layout_id", "PVID", "VERSION LIST DEL")
-                            if (status):
-                                Log.info("Deleted leaked object at key: " + obj_ver_key)
-                                # Delete entry from probbale delete list as well, if any
-                                indx = self.config.get_probable_delete_index_id()
-                                indx_key = obj_ver_md["motr_oid"]
-                                Log.info("Deleting entry: " + indx_key + " from probbale list")
-                                status = self.delete_key_from_index(indx, indx_key, "PROBABLE INDEX DEL")
-                                if (status):
-                                    Log.info("Deleted entry: " + indx_key + " from probbale list")
-                            else:
-                                Log.info("Error! Failed to delete leaked object at key: " + obj_ver_key)
-                                return False
-                else:
-                    Log.info("Error: Failed to list object versions")
+        version_prefix = object_key + "/"
+        extra_qparam = {'prefix':version_prefix}
+        pages = self._indexapi.list_pages(object_version_list_index,
+            self.config.get_max_keys(), marker, extra_qparam)
+        try:
+            for ret, response_data in pages:
+                if (not ret):
+                    self._log.info("Failed to get Object version listing for object: {} Error: {}",
+                        object_key, response_data)
+                    if (response_data.get_error_status() == 404):
+                        self._log.info("Object {} is Not found(404) in the version list",
+                            object_key)
                     return False
 
-                last_key = object_versions["NextMarker"]
-                if (is_truncated and last_key.startswith(object_key)):
-                    bStatus = self.process_objects_in_versionlist(object_version_list_index,
-                        obj_ver_key, callback, timeVersionEntry, last_key)
-
-                return bStatus
-
-            if (ret is False):
-                Log.info("Failed to get Object version listing for object: " + self.object_key +
-                    " Error: " + str(response_data))
-                if (response_data.get_error_status() == 404):
-                    Log.info("Object " + object_key + " is Not found(404) in the version list")
+                leaked_versions = []
+                version_count = 0
+                past_versions = False
+                for object_version in response_data.iter_records():
+                    if (not object_version.get_key().startswith(version_prefix)):
+                        # Key of another object, listing is sorted so the
+                        # versions of object_key end at the first key above them.
+                        past_versions = past_versions or object_version.get_key() > version_prefix
+                        continue
+                    version_count += 1
+                    obj_ver_md = object_version.get_json_value()
+                    # Call the callback to process version entry
+                    if (callback(obj_ver_md, current_oid, timeVersionEntry) == True):
+                        self._log.info("Leak detected: Delete version object and version entry for key: {}",
+                            object_version.get_key())
+                        leaked_versions.append((object_version.get_key(), obj_ver_md))
+                self._log.info("Processed {} objects in version list of {}, {} leaked",
+                    version_count, object_key, len(leaked_versions))
+
+                if (leaked_versions and
+                        not self.del_leaked_versions(object_version_list_index, leaked_versions)):
+                    return False
+                bStatus = True
 
+                if (past_versions):
+                    break
+                next_marker = response_data.get_listing_header().get("NextMarker")
+                if (next_marker is not None and not next_marker.startswith(version_prefix)):
+                    break
+        finally:
+            pages.close()
         return bStatus
 
+    def del_leaked_versions(self, object_version_list_index, leaked_versions):
+        """
+        Delete objects of leaked versions, their version entries and probable delete
+        entries with bulk requests, return True if objects and version entries are deleted.
+        """
+        status = True
+        objects = [(obj_ver_md["motr_oid"], obj_ver_md["layout_id"], obj_ver_md["PVID"])
+                   for _, obj_ver_md in leaked_versions]
+        deleted_versions = []
+        for (obj_ver_key, obj_ver_md), (ret, response) in zip(leaked_versions,
+                self._objectapi.delete_many(objects)):
+            if (ret or (response is not None and response.get_error_status() == 404)):
+                self._log.info("Deleted object with oid {} from motr store", obj_ver_md["motr_oid"])
+                deleted_versions.append((obj_ver_key, obj_ver_md))
+            else:
+                self._log.info("Failed to delete object with oid [{}] from motr store",
+                    obj_ver_md["motr_oid"])
+                status = False
+
+        #"VERSION LIST DEL"
+        probable_keys = []
+        for (obj_ver_key, obj_ver_md), (ret, response) in zip(deleted_versions,
+                self._kvapi.delete_many(object_version_list_index,
+                                        [obj_ver_key for obj_ver_key, _ in deleted_versions])):
+            if (ret or (response is not None and response.get_error_status() == 404)):
+                self._log.info("Deleted leaked object at key: {}", obj_ver_key)
+                probable_keys.append(obj_ver_md["motr_oid"])
+            else:
+                self._log.info("Error! Failed to delete leaked object at key: {}", obj_ver_key)
+                if (response is not None):
+                    self.logAPIResponse("VERSION LIST DEL", object_version_list_index, obj_ver_key, response)
+                status = False
+
+        # Delete entries from probable delete list as well, if any
+        probable_index_id = self.config.get_probable_delete_index_id()
+        for indx_key, (ret, response) in zip(probable_keys,
+                self._kvapi.delete_many(probable_index_id, probable_keys)):
+            if (ret or (response is not None and response.get_error_status() == 404)):
+                self._log.info("Deleted entry: {} from probbale list", indx_key)
+            else:
+                self._log.info("Failed to delete entry: {} from probbale list", indx_key)
+        return status
+
     def process_object_leak(self):
-        Log.info("Processing object leak for oid: " + self.object_leak_id)
+        self._log.info("Processing object leak for oid: {}", self.object_leak_id)
 
         # Object leak detection algo: Step #2
         # Check if 'forceDelete' is set on leak entry. If yes, delete object and record from probable leak table
@@ -558,18 +630,19 @@ class ObjectRecoveryValidator:
                 version_key = self.object_leak_info["version_key_in_index"]
                 status = self.delete_key_from_index(version_index, version_key, "VERSION INDEX KEY DEL")
                 if (not status):
-                    Log.info("Multipart parent: Failed to delete version entry " + version_key +
-                                      " from version index")
+                    self._log.info("Multipart parent: Failed to delete version entry {} from version index",
+                        version_key)
                 else:
                     # After deleting version entry, delete extended entries of multipart dummy object
                     # from extended index
                     # Note: Below call deletes motr objects associated with extended entries and then
                     # removes extended entries of multipart object.
                     status = self.del_objects_in_extendedlist(self.object_leak_info["extended_md_idx_oid"])
-                    Log.info("Deleted version entry associated with multipart object oid =" + self.object_leak_id)
+                    self._log.info("Deleted version entry associated with multipart object oid ={}",
+                        self.object_leak_id)
                     probable_index_id = self.config.get_probable_delete_index_id()
                     probable_rec_key = self.probable_delete_records["Key"]
-                    Log.info("Deleting Entry from PDI with Key : " + probable_rec_key)
+                    self._log.info("Deleting Entry from PDI with Key : {}", probable_rec_key)
                     status = self.delete_key_from_index(probable_index_id, probable_rec_key, "PROBABALE INDEX DEL")
                 return
 
@@ -577,7 +650,8 @@ class ObjectRecoveryValidator:
                 # This is not a multipart request
                 status = self.process_probable_delete_record(True, True)
                 if (status):
-                    Log.info("Leak entry " + self.object_leak_id + " processed successfully and deleted")
+                    self._log.info("Leak entry {} processed successfully and deleted",
+                        self.object_leak_id)
                 else:
                     Log.error("Failed to process leak oid " + self.object_leak_id)
             else:
@@ -585,14 +659,16 @@ class ObjectRecoveryValidator:
                 # Delete only object(no versions, as version does not exist yet) and then
                 # delete entry from probable delete index.
                 oid = self.object_leak_id
-                Log.info("Object " + self.object_leak_id + " is for multipart request")
+                self._log.info("Object {} is for multipart request", self.object_leak_id)
                 layout = self.object_leak_info["object_layout_id"]
                 status = self.delete_object_from_storage(oid, layout, self.pvid_str)
                 if (status):
-                    Log.info("Object for Leak entry " + self.object_leak_id + " deleted from store")
+                    self._log.info("Object for Leak entry {} deleted from store",
+                        self.object_leak_id)
                     status = self.process_probable_delete_record(True, False)
                     if (status):
-                        Log.info("Leak entry " + self.object_leak_id + " processed successfully and deleted")
+                        self._log.info("Leak entry {} processed successfully and deleted",
+                            self.object_leak_id)
                     else:
                         Log.error("Failed to process leak oid " + self.object_leak_id + " Failed to delete entry from leak index")
                 else:
@@ -609,12 +685,13 @@ class ObjectRecoveryValidator:
             # Either object exists or object does not exist.
             if (current_object_md is None):
                 # Object does not exist.
-                Log.info("Object key " + obj_key + " does not exist in object list index.")
+                self._log.info("Object key {} does not exist in object list index.", obj_key)
                 # If this is multipart operation, there could be no object existing in object list index
                 if not self.is_multipart:
                     status = self.process_probable_delete_record(True, True)
                     if (status):
-                        Log.info("Leak oid " + self.object_leak_id + " processed successfully and deleted")
+                        self._log.info("Leak oid {} processed successfully and deleted",
+                            self.object_leak_id)
                     else:
                         Log.error("Failed to process leak oid " + self.object_leak_id)
                     return
@@ -639,26 +716,29 @@ class ObjectRecoveryValidator:
                     # and then the version entry.
                     if (self.object_leak_id != current_oid):
                         # This is stale/leak multipart oid. Delete version entry associated with it.
-                        Log.info("Multipart leak for multipart oid " + self.object_leak_id)
+                        self._log.info("Multipart leak for multipart oid {}", self.object_leak_id)
                         version_index = self.object_leak_info["objects_version_list_index_oid"]
                         version_key = self.object_leak_info["version_key_in_index"]
                         status = self.delete_key_from_index(version_index, version_key, "VERSION INDEX KEY DEL")
                         if (not status):
-                            Log.info("Multipart parent: Failed to delete version entry " + version_key +
-                                            " from version index")
+                            self._log.info("Multipart parent: Failed to delete version entry {} from version index",
+                                version_key)
                         # Delete all objects associated with this multipart.
                         status = self.del_objects_in_extendedlist(self.object_leak_info["extended_md_idx_oid"])
                         if status:
                             # Remove leak entry from probable delete list index
                             status = self.process_probable_delete_record(True, False)
                             if status:
-                                Log.info("Processed possible multipart leak for multipart oid " + self.object_leak_id)
+                                self._log.info("Processed possible multipart leak for multipart oid {}",
+                                    self.object_leak_id)
                         else:
-                            Log.info("Failed to process possible multipart leak for multipart oid " + self.object_leak_id)
+                            self._log.info("Failed to process possible multipart leak for multipart oid {}",
+                                self.object_leak_id)
                     else:
                         # No leak. Remove leak entry from probable delete list index
                         status = self.process_probable_delete_record(True, False)
-                        Log.info("No leak detected for multipart oid " + self.object_leak_id + " . Removed leak entry")
+                        self._log.info("No leak detected for multipart oid {} . Removed leak entry",
+                            self.object_leak_id)
                 else:
                     # This condition indicates successful Multipart PUT request API.
                     # - Check for parallel S3 Multipart PUT calls by checking this oid with current/live object oid
@@ -671,59 +751,67 @@ class ObjectRecoveryValidator:
                     if part_index_oid != NULL_OBJ_OID:
                         status, part_info = self.get_object_Entry(part_index_oid, str(part_no))
                         if (not status):
-                            Log.info("Error! Failed to get part info for part no:  " + str(part_no) +
-                                " from part list index: " + part_index_oid)
+                            self._log.info("Error! Failed to get part info for part no:  {} from part list index: {}",
+                                part_no, part_index_oid)
                             return status
 
                         if (part_info is not None):
                             obj_oid = part_info["motr_oid"]
                             if (obj_oid != self.object_leak_id):
                                 # Possible part leak. Delete part object from motr store
-                                Log.info("PART leak for multipart part with oid " + self.object_leak_id)
+                                self._log.info("PART leak for multipart part with oid {}",
+                                    self.object_leak_id)
                                 status = self.delete_object_from_storage(self.object_leak_id, \
                                     self.object_leak_layout_id, self.pvid_str)
                                 if (status):
-                                    Log.info("Deleted part object with oid " + self.object_leak_id + " from motr store")
+                                    self._log.info("Deleted part object with oid {} from motr store",
+                                        self.object_leak_id)
                                     # Remove leak entry from probable delete list index
                                     status = self.process_probable_delete_record(True, False)
                                 else:
-                                    Log.info("Failed to delete part with oid [" + self.object_leak_id + "] from motr store")
+                                    self._log.info("Failed to delete part with oid [{}] from motr store",
+                                        self.object_leak_id)
                             else:
                                 # No leak. Remove leak entry from probable delete list index
                                 status = self.process_probable_delete_record(True, False)
-                                Log.info("No leak detected for part " + str(part_no) + ". Removed leak entry")
+                                self._log.info("No leak detected for part {}. Removed leak entry",
+                                    part_no)
                         else:
                             # Remove leak entry from probable delete list index
                             status = self.process_probable_delete_record(True, False)
-                            Log.info("The part: " + str(part_no) + " does not exist in part index. Removed leak entry")
+                            self._log.info("The part: {} does not exist in part index. Removed leak entry",
+                                part_no)
                 return status
             else:
                 # This is leak check for simple PUT due to parallel PUT
                 # Check if object is live/current
                 if (self.object_leak_id != current_oid):
                     # This is stale/leak simple PUT; delete object from motr and remove version entry
-                    Log.info("Simple PUT leak for oid " + self.object_leak_id)
+                    self._log.info("Simple PUT leak for oid {}", self.object_leak_id)
                     status = self.process_probable_delete_record(True, True)
                     if status:
-                        Log.info("Processed leak entry " + self.object_leak_id + " successfully")
+                        self._log.info("Processed leak entry {} successfully", self.object_leak_id)
                     else:
-                        Log.info("Failed to process leak for oid " + self.object_leak_id)
+                        self._log.info("Failed to process leak for oid {}", self.object_leak_id)
                 else:
                     # No leak. Remove leak entry from probable delete list index
                     status = self.process_probable_delete_record(True, False)
-                    Log.info("No leak detected for simple object " + self.object_leak_id + ". Removed leak entry")
+                    self._log.info("No leak detected for simple object {}. Removed leak entry",
+                        self.object_leak_id)
                 return status
 
             # For multipart new object request, check if entry exists in multipart metadata
             # If entry does not exist, delete the object and associated leak entry from probabale delete list
             if ("true" == self.object_leak_info["is_multipart"]):
                 multipart_indx = obj_list_id
-                Log.info("Object " + self.object_leak_id + " is for multipart request with force_delete=False")
+                self._log.info("Object {} is for multipart request with force_delete=False",
+                    self.object_leak_id)
                 #Check object exists in multipart metadata index
                 status, response = self.get_key_from_index(multipart_indx, obj_key)
                 if (status):
                     if (response is None):
-                        Log.info("Leak entry " + self.object_leak_id + " does not exist in multipart index")
+                        self._log.info("Leak entry {} does not exist in multipart index",
+                            self.object_leak_id)
                         # This is a multipart request(Post complete OR Multipart Abort).
                         # Delete only object(no versions, as version does not exist yet) and then
                         # delete entry from probable delete index.
@@ -731,10 +819,12 @@ class ObjectRecoveryValidator:
                         layout = self.object_leak_info["object_layout_id"]
                         status = self.delete_object_from_storage(oid, layout, self.pvid_str)
                         if (status):
-                            Log.info("Object for Leak entry " + self.object_leak_id + " deleted from store")
+                            self._log.info("Object for Leak entry {} deleted from store",
+                                self.object_leak_id)
                             status = self.process_probable_delete_record(True, True)
                             if (status):
-                                Log.info("Leak entry " + self.object_leak_id + " processed successfully and deleted")
+                                self._log.info("Leak entry {} processed successfully and deleted",
+                                    self.object_leak_id)
                             else:
                                 Log.error("Failed to process leak oid " + self.object_leak_id +
                                     " Failed to delete entry from leak index")
@@ -742,7 +832,8 @@ class ObjectRecoveryValidator:
                             Log.error("Failed to process leak oid, failed to delete object " +
                                 self.object_leak_id + " Skipping entry for next run")
                     else:
-                        Log.info("Skipping leak entry " + self.object_leak_id + " as it exists in multipart index")
+                        self._log.info("Skipping leak entry {} as it exists in multipart index",
+                            self.object_leak_id)
                 else:
                     Log.error("Failed to process leak oid " + self.object_leak_id +
                         "Skipping entry. Failed to search multipart index")
@@ -754,36 +845,42 @@ class ObjectRecoveryValidator:
             # If old object is different than current object in metadata
             if (self.object_leak_id != current_oid):
                 # This means old object is no more current/live, delete it
-                Log.info("Leak oid: " + self.object_leak_id + " does not match the current. "
-                    + "Attempting to delete it")
+                self._log.info("Leak oid: {} does not match the current. Attempting to delete it",
+                    self.object_leak_id)
                 status = self.process_probable_delete_record(True, True)
                 if (status):
-                    Log.info("Leak oid {Old} " + self.object_leak_id + " processed successfully and deleted")
+                    self._log.info("Leak oid {{Old}} {} processed successfully and deleted",
+                        self.object_leak_id)
                 else:
-                    Log.info("Error!Failed to delete Leak oid {Old} " + self.object_leak_id)
+                    self._log.info("Error!Failed to delete Leak oid {{Old}} {}",
+                        self.object_leak_id)
                 return
             else:
                 # old object is still current/live as per metadata
                 # Check if there was any server crash
                 instance_id = self.object_leak_info["global_instance_id"]
-                Log.info("Oid " + self.object_leak_id + " exists in metadata. Check if S3 instance is active")
+                self._log.info("Oid {} exists in metadata. Check if S3 instance is active",
+                    self.object_leak_id)
 
                 if(self.check_instance_is_nonactive(instance_id) and self.config.get_cleanup_enabled()):
-                    Log.info("Old object leak oid " + str(self.object_leak_id) +
-                                      " is not associated with active S3 instance. Deleting it...")
+                    self._log.info("Old object leak oid {} is not associated with active S3 instance. Deleting it...",
+                        self.object_leak_id)
                     status = self.process_probable_delete_record(True, True)
                     if (status):
-                        Log.info("Leak oid " + self.object_leak_id + " processed successfully and deleted")
+                        self._log.info("Leak oid {} processed successfully and deleted",
+                            self.object_leak_id)
                     else:
                         Log.error("Failed to discard leak oid " + self.object_leak_id)
                 else:
                     # Ignore and process leak record in next cycle
-                    Log.info("S3 instance is active or flag to cleanup_enabled is disabled")
-                    Log.info("Skip deletion for object leak oid " + str(self.object_leak_id))
-                    Log.info("Remove entry from probable delete index for :" + str(self.object_leak_id))
+                    self._log.info("S3 instance is active or flag to cleanup_enabled is disabled")
+                    self._log.info("Skip deletion for object leak oid {}", self.object_leak_id)
+                    self._log.info("Remove entry from probable delete index for :{}",
+                        self.object_leak_id)
                     status = self.process_probable_delete_record(True, False)
                     if (status):
-                        Log.info("Leak oid " + self.object_leak_id + " processed successfully and skipped")
+                        self._log.info("Leak oid {} processed successfully and skipped",
+                            self.object_leak_id)
                     else:
                         Log.error("Failed to skip" + self.object_leak_id)
 
@@ -798,24 +895,24 @@ class ObjectRecoveryValidator:
                 timeDelayVersionProcessing = self.config.get_version_processing_delay_in_mins()
                 object_version_list_index_id = self.object_leak_info["objects_version_list_index_oid"]
                 obj_ver_key = self.object_leak_info["version_key_in_index"]
-                Log.info("Processing version list for new object oid " + self.object_leak_id)
+                self._log.info("Processing version list for new object oid {}", self.object_leak_id)
                 self.process_objects_in_versionlist(object_version_list_index_id, current_oid,
                     self.version_entry_cb, timeDelayVersionProcessing, obj_key + "/")
                 # After processing leak due to parallel PUT, delete probable record as new object is current/live object
                 status = self.process_probable_delete_record(True, False)
                 if (status):
-                    Log.info("New object oid " + self.object_leak_id +
-                        " is discarded from probable delete list")
+                    self._log.info("New object oid {} is discarded from probable delete list",
+                        self.object_leak_id)
                 else:
-                    Log.info("Failed to process new object oid " + self.object_leak_id)
+                    self._log.info("Failed to process new object oid {}", self.object_leak_id)
             else:
                 # Check if the request is in progress.
                 # For this, check if new object oid is present in version table
                 status, versioninfo = self.get_object_Entry(ovli_oid, ovli_key)
 
                 if (status and versioninfo is not None):
-                    Log.info("New obj oid: " + self.object_leak_id + " with version key:" +
-                        ovli_key + " exists in version table")
+                    self._log.info("New obj oid: {} with version key:{} exists in version table",
+                        self.object_leak_id, ovli_key)
                     # new object is in the version table
                     # This indicates object write was complete. Check if version metadata update is in-progress
                     # Is object in version list older than 5mins
@@ -828,12 +925,12 @@ class ObjectRecoveryValidator:
                     else:
                         # version metadata update is likely in progress, give it some time, ignore the
                         # record and process it in next cycle
-                        Log.info("Skipping processing of new obj oid: " + self.object_leak_id +
-                            " to a later time")
+                        self._log.info("Skipping processing of new obj oid: {} to a later time",
+                            self.object_leak_id)
                         pass
                 elif (status and versioninfo is None):
-                    Log.info("New obj oid: " + self.object_leak_id + " with version key:" +
-                        ovli_key + " does not exist in version table. Check S3 instance exist")
+                    self._log.info("New obj oid: {} with version key:{} does not exist in version table. Check S3 instance exist",
+                        self.object_leak_id, ovli_key)
                     # new object is not in the version table
                     # Check if LC of the record has changed, indicating server crash
                     instance_id = self.object_leak_info["global_instance_id"]
@@ -842,14 +939,16 @@ class ObjectRecoveryValidator:
                         # new-oid can be safely deleted, delete probable record.
                         status = self.process_probable_delete_record(True, True)
                         if (status):
-                            Log.info("New obj oid " + self.object_leak_id + " is deleted and discarded")
+                            self._log.info("New obj oid {} is deleted and discarded",
+                                self.object_leak_id)
                     else:
                         # S3 process is working on new-oid. Ignore the record to be processed
                         # in next schedule cycle
-                        Log.info("Skipping processing of new obj oid: " + self.object_leak_id)
+                        self._log.info("Skipping processing of new obj oid: {}",
+                            self.object_leak_id)
                         pass
                 else:
-                    Log.info("Failed to process new obj oid: " + self.object_leak_id +
-                        "Skipping to next cycle...")
+                    self._log.info("Failed to process new obj oid: {}Skipping to next cycle...",
+                        self.object_leak_id)
                     pass
         return
@@ -0,0 +1,61 @@
+#!/usr/bin/python3.6
+
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+
+""" To compare v4 signatures per second of the per request signing path and
+    the cached signing context you need to execute this file as:
+
+    python36 signing_bench.py [count] """
+
+import sys
+import time
+import datetime
+import urllib.parse
+from s3backgrounddelete.cortx_s3_config import CORTXS3Config
+from s3backgrounddelete.cortx_s3_util import CORTXS3Util
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+REQUEST_URI = '/indexes/AAAAAAAAAHg%3D-AwAQAAAAAAA%3D/testobject'
+QUERY_PARAMS = 'max-keys=1000'
+BODY = ''
+
+CONFIG = CORTXS3Config()
+s3_util = CORTXS3Util(CONFIG, CONNECTION_TYPE_CONSUMER)
+
+
+def sign_per_request():
+    """Signing as done before the signing context was introduced."""
+    url_parse_result = urllib.parse.urlparse(CONFIG.get_cortx_s3_endpoint_for_consumer())
+    epoch_t = datetime.datetime.utcnow()
+    s3_util.sign_request_v4('GET', REQUEST_URI, QUERY_PARAMS, BODY, epoch_t,
+        url_parse_result.netloc, CONFIG.get_cortx_s3_service(), CONFIG.get_cortx_s3_region())
+
+
+def sign_with_context():
+    """Signing through the cached signing context."""
+    s3_util.prepare_signed_header('GET', REQUEST_URI, QUERY_PARAMS, BODY)
+
+
+for name, sign in (("per request", sign_per_request), ("signing context", sign_with_context)):
+    start = time.perf_counter()
+    for _ in range(COUNT):
+        sign()
+    elapsed = time.perf_counter() - start
+    print("%-16s %10.0f signatures/sec" % (name, COUNT / elapsed))
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for CORTXS3ListIndexResponse.
+"""
+import json
+import pytest
+
+from s3backgrounddelete.cortx_list_index_response import CORTXS3ListIndexResponse
+from s3backgrounddelete.cortx_list_index_response import read_index_listing_header
+
+INDEX_CONTENT = {"Delimiter": "", "Index-Id": "AAAAAAAAAHg=-AwAQAAAAAAA=",
+                 "IsTruncated": "true",
+                 "Keys": [{"Key": "key1", "Value": '{"old_oid": "oid1"}'},
+                          {"Key": "key2", "Value": '{"old_oid": "oid2"}'}],
+                 "Marker": "", "MaxKeys": "2", "NextMarker": "key2", "Prefix": ""}
+
+
+def test_iter_records_streams_keys():
+    """Test records are yielded with lazily decoded values."""
+    response = CORTXS3ListIndexResponse(json.dumps(INDEX_CONTENT, indent=2).encode())
+    records = list(response.iter_records())
+    assert [record.get_key() for record in records] == ["key1", "key2"]
+    assert records[1].get_json_value() == {"old_oid": "oid2"}
+    assert records[0]["Value"] == '{"old_oid": "oid1"}'
+    assert response.get_listing_header()["NextMarker"] == "key2"
+
+
+def test_listing_header_without_keys():
+    """Test listing header has all fields other than Keys."""
+    response = CORTXS3ListIndexResponse(json.dumps(INDEX_CONTENT).encode())
+    header = response.get_listing_header()
+    assert "Keys" not in header
+    assert header["IsTruncated"] == "true"
+
+
+def test_index_content_still_available():
+    """Test full index content is decoded on request."""
+    response = CORTXS3ListIndexResponse(json.dumps(INDEX_CONTENT).encode())
+    assert response.get_index_content() == INDEX_CONTENT
+    assert len(list(response.iter_records())) == 2
+
+
+def test_truncated_listing():
+    """Test truncated listing JSON should throw ValueError."""
+    response = CORTXS3ListIndexResponse(json.dumps(INDEX_CONTENT).encode()[:80])
+    with pytest.raises(ValueError):
+        list(response.iter_records())
+
+
+def test_listing_header_does_not_decode_page():
+    """Test listing header is read without decoding the listed entries."""
+    response = CORTXS3ListIndexResponse(json.dumps(INDEX_CONTENT).encode())
+    header = response.get_listing_header()
+    assert header == {name: value for name, value in INDEX_CONTENT.items() if name != "Keys"}
+    assert response._index_content is None
+    assert [record.get_key() for record in response.iter_records()] == \
+        [entry["Key"] for entry in INDEX_CONTENT["Keys"]]
+    assert response._index_content is None
+
+
+def test_listing_header_with_brackets_in_strings():
+    """Test "]" inside markers and values does not end Keys early."""
+    index_content = dict(INDEX_CONTENT, Marker="a],", NextMarker='x],"Q":"', Prefix="p]")
+    index_content["Keys"] = [{"Key": "k]", "Value": '["v"],'}]
+    header = read_index_listing_header(json.dumps(index_content).encode())
+    assert header["NextMarker"] == 'x],"Q":"'
+    assert header["Marker"] == "a],"
+    assert header["Prefix"] == "p]"
+    assert "Q" not in header
+
+
+def test_listing_header_keys_last_or_empty():
+    """Test listing header when Keys is last or has no entries."""
+    assert read_index_listing_header(
+        b'{"IsTruncated": "false", "Keys": [{"Key": "k", "Value": "v"}]}') == \
+        {"IsTruncated": "false"}
+    assert read_index_listing_header(b'{"Keys": [], "NextMarker": ""}') == \
+        {"NextMarker": ""}
@@ -0,0 +1,170 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for CORTXS3AsyncIndexApi, CORTXS3AsyncKVApi and CORTXS3AsyncObjectApi.
+"""
+import asyncio
+from unittest.mock import Mock
+
+from s3backgrounddelete.cortx_s3_async_api import CORTXS3AsyncIndexApi
+from s3backgrounddelete.cortx_s3_async_api import CORTXS3AsyncKVApi
+from s3backgrounddelete.cortx_s3_async_api import CORTXS3AsyncObjectApi
+from s3backgrounddelete.cortx_list_index_response import CORTXS3ListIndexResponse
+from s3backgrounddelete.cortx_get_kv_response import CORTXS3GetKVResponse
+from s3backgrounddelete.cortx_s3_error_respose import CORTXS3ErrorResponse
+from s3backgrounddelete.cortx_s3_config import CORTXS3Config
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _api(api_class, status=200, body=b'{}', reason='OK', error=None):
+    """Return api whose requests are recorded and answered with status."""
+    api = api_class(CORTXS3Config(), CONNECTION_TYPE_CONSUMER)
+    api.requests = []
+
+    async def request(method, request_uri, body_sent=None, headers=None):
+        api.requests.append((method, request_uri, body_sent))
+        if error is not None:
+            raise error
+        return {'status': status, 'headers': {}, 'body': body, 'reason': reason}
+
+    api._request = request
+    return api
+
+
+def test_index_list_success():
+    """Test LIST should send sorted query params and return listing response."""
+    api = _api(CORTXS3AsyncIndexApi, body=b'{"Keys": []}')
+    response = _run(api.list("test_index1", 10, "key1", {"prefix": "obj/"}))
+    assert response[0] is True
+    assert isinstance(response[1], CORTXS3ListIndexResponse)
+    assert api.requests == [
+        ('GET', '/indexes/test_index1?marker=key1&max-keys=10&prefix=obj%2F', None)]
+
+
+def test_index_list_failure():
+    """Test LIST of missing index should return error response."""
+    api = _api(CORTXS3AsyncIndexApi, status=404, reason='NOT FOUND')
+    response = _run(api.list("test_index2"))
+    assert response[0] is False
+    assert isinstance(response[1], CORTXS3ErrorResponse)
+    assert response[1].get_error_status() == 404
+
+
+def test_index_put_delete_head():
+    """Test PUT, DELETE and HEAD of index should check their own status."""
+    assert _run(_api(CORTXS3AsyncIndexApi, status=201).put("test_index1"))[0] is True
+    assert _run(_api(CORTXS3AsyncIndexApi, status=200).put("test_index1"))[0] is False
+    assert _run(_api(CORTXS3AsyncIndexApi, status=204).delete("test_index1"))[0] is True
+    assert _run(_api(CORTXS3AsyncIndexApi, status=200).delete("test_index1"))[0] is False
+    api = _api(CORTXS3AsyncIndexApi, status=200)
+    assert _run(api.head("test_index=1"))[0] is True
+    assert api.requests == [('HEAD', '/indexes/test_index%3D1', "")]
+
+
+def test_index_no_index_id():
+    """Test requests without index_id should not be sent."""
+    api = _api(CORTXS3AsyncIndexApi)
+    for request in (api.list(None), api.put(None), api.delete(None), api.head(None)):
+        assert _run(request) == (False, None)
+    assert api.requests == []
+
+
+def test_kv_get_success():
+    """Test GET of key should return kv response of key."""
+    api = _api(CORTXS3AsyncKVApi, body=b'{"Key": "test_key1"}')
+    response = _run(api.get("test_index1", "test_key+1"))
+    assert response[0] is True
+    assert isinstance(response[1], CORTXS3GetKVResponse)
+    assert response[1].get_key() == "test_key+1"
+    assert api.requests == [('GET', '/indexes/test_index1/test_key%2B1', None)]
+
+
+def test_kv_put_and_delete():
+    """Test PUT sends value and DELETE expects 204."""
+    api = _api(CORTXS3AsyncKVApi)
+    assert _run(api.put("test_index1", "test_key1", "testValue1"))[0] is True
+    assert api.requests == [('PUT', '/indexes/test_index1/test_key1', "testValue1")]
+    assert _run(_api(CORTXS3AsyncKVApi, status=204).delete("test_index1", "test_key1"))[0] is True
+    response = _run(_api(CORTXS3AsyncKVApi, status=404).delete("test_index1", "test_key1"))
+    assert response[0] is False
+    assert response[1].get_error_status() == 404
+
+
+def test_kv_missing_arguments():
+    """Test requests without index_id or key should not be sent."""
+    api = _api(CORTXS3AsyncKVApi)
+    assert _run(api.get(None, "test_key1")) == (False, None)
+    assert _run(api.put("test_index1", None, "value")) == (False, None)
+    assert _run(api.delete("test_index1", None)) == (False, None)
+    assert api.requests == []
+
+
+def test_object_delete_and_head_query():
+    """Test DELETE and HEAD of object should send layout-id and pvid query."""
+    api = _api(CORTXS3AsyncObjectApi, status=204)
+    assert _run(api.delete("oid=", 1, "pvid=="))[0] is True
+    api_head = _api(CORTXS3AsyncObjectApi)
+    assert _run(api_head.head("oid=", 1))[0] is True
+    assert api.requests == [('DELETE', '/objects/oid%3D?layout-id=1&pvid=pvid%3D%3D', '')]
+    assert api_head.requests == [('HEAD', '/objects/oid%3D?layout-id=1', '')]
+
+
+def test_object_put_get_and_missing_arguments():
+    """Test PUT expects 201 and requests without ids should not be sent."""
+    assert _run(_api(CORTXS3AsyncObjectApi, status=201).put("oid1", "value"))[0] is True
+    assert _run(_api(CORTXS3AsyncObjectApi, status=404).get("oid1"))[0] is False
+    api = _api(CORTXS3AsyncObjectApi)
+    assert _run(api.delete("oid1", 1, None)) == (False, None)
+    assert _run(api.head("oid1", None)) == (False, None)
+    assert _run(api.get(None)) == (False, None)
+    assert api.requests == []
+
+
+def test_connection_refused():
+    """Test refused connection should return 502 error response."""
+    api = _api(CORTXS3AsyncKVApi, error=ConnectionRefusedError())
+    response = _run(api.get("test_index1", "test_key1"))
+    assert response[0] is False
+    assert response[1].get_error_status() == 502
+
+
+def test_request_exception():
+    """Test any other request exception should return 500 error response."""
+    api = _api(CORTXS3AsyncObjectApi, error=TypeError("Failed to create connection instance"))
+    response = _run(api.get("oid1"))
+    assert response[0] is False
+    assert response[1].get_error_status() == 500
+
+
+def test_signature_failure():
+    """Test request should not be sent if it could not be signed."""
+    api = _api(CORTXS3AsyncIndexApi)
+    api.s3_util = Mock()
+    api.s3_util.prepare_signed_header.return_value = {'Authorization': None}
+    assert _run(api.list("test_index1")) == (False, None)
+    assert api.requests == []
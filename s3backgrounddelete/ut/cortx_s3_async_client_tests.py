@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for CORTXS3AsyncClient.
+"""
+import asyncio
+import re
+from unittest.mock import Mock
+import pytest
+
+from s3backgrounddelete import cortx_s3_rate_limiter
+from s3backgrounddelete.cortx_s3_async_client import CORTXS3AsyncClient
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
+from s3backgrounddelete.cortx_s3_metrics import get_metrics_registry
+
+CANNED_RESPONSES = {
+    'GET': b'HTTP/1.1 200 OK\r\nContent-Length: 15\r\n\r\n{"Key": "key1"}',
+    'DELETE': b'HTTP/1.1 204 No Content\r\n\r\n',
+    'PUT': b'HTTP/1.1 201 Created\r\nTransfer-Encoding: chunked\r\n\r\n'
+           b'4\r\n{}{}\r\n0\r\n\r\n',
+}
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _config(port=None, requests_per_sec=0, idle_timeout=60):
+    """Return config of consumer endpoint on port."""
+    config = Mock()
+    if port is None:
+        config.get_cortx_s3_endpoint_for_consumer.side_effect = KeyError()
+    else:
+        config.get_cortx_s3_endpoint_for_consumer.return_value = \
+            'http://127.0.0.1:' + str(port)
+    config.get_connection_idle_timeout.return_value = idle_timeout
+    config.get_consumer_requests_per_sec.return_value = requests_per_sec
+    config.get_consumer_deletes_per_sec.return_value = 0
+    for api in ("index", "object"):
+        getattr(config, "get_consumer_" + api + "_requests_per_sec").return_value = 0
+        getattr(config, "get_consumer_" + api + "_deletes_per_sec").return_value = 0
+    config.get_adaptive_throttling.return_value = False
+    config.get_throttle_latency_ms.return_value = 500
+    return config
+
+
+async def _with_server(test, **config_args):
+    """Start a keep-alive HTTP stand-in server and run test against it."""
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.IncompleteReadError:
+                break
+            method = head.split(b' ', 1)[0].decode()
+            for line in head.split(b'\r\n'):
+                if line.lower().startswith(b'content-length:'):
+                    await reader.readexactly(int(line.split(b':')[1]))
+            writer.write(CANNED_RESPONSES[method])
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    client = CORTXS3AsyncClient(_config(port, **config_args), CONNECTION_TYPE_CONSUMER)
+    try:
+        return await test(client), len(connections)
+    finally:
+        client.close()
+        # Let handlers see the closed connections before the loop stops.
+        await asyncio.sleep(0.01)
+        server.close()
+        await server.wait_closed()
+
+
+def test_get_success():
+    """Test GET request should return success response."""
+    async def test(client):
+        return await client.get('/indexes/test_index1/key1')
+
+    response, _ = _run(_with_server(test))
+    assert response['status'] == 200
+    assert response['body'] == b'{"Key": "key1"}'
+
+
+def test_delete_success_without_body():
+    """Test DELETE request returning 204 should have empty body."""
+    async def test(client):
+        return await client.delete('/indexes/test_index1/key1')
+
+    response, _ = _run(_with_server(test))
+    assert response['status'] == 204
+    assert response['body'] == b''
+
+
+def test_put_chunked_response():
+    """Test chunked response body is reassembled."""
+    async def test(client):
+        return await client.put('/indexes/test_index1', b'value')
+
+    response, _ = _run(_with_server(test))
+    assert response['status'] == 201
+    assert response['body'] == b'{}{}'
+
+
+def test_connection_reused():
+    """Test sequential requests share one keep-alive connection."""
+    async def test(client):
+        for _ in range(5):
+            await client.get('/indexes/test_index1/key1')
+
+    _, connection_count = _run(_with_server(test))
+    assert connection_count == 1
+
+
+def test_no_endpoint_failure():
+    """Test if endpoint is missing then request should throw TypeError."""
+    client = CORTXS3AsyncClient(_config(), CONNECTION_TYPE_CONSUMER)
+    with pytest.raises(TypeError):
+        _run(client.get('/indexes/test_index1'))
+
+
+def test_expired_idle_connection_not_reused():
+    """Test connection idle for longer than idle timeout is closed, not reused."""
+    async def test(client):
+        await client.get('/indexes/test_index1/key1')
+        await asyncio.sleep(0.05)
+        await client.get('/indexes/test_index1/key1')
+
+    _, connection_count = _run(_with_server(test, idle_timeout=0.01))
+    assert connection_count == 2
+
+
+def _responses_total(api):
+    """Return s3bgd_http_responses_total of api with 2xx status."""
+    text = get_metrics_registry().render_prometheus()
+    match = re.search(r'^s3bgd_http_responses_total\{api="' + api +
+                      r'",status="2xx"\} (\d+)', text, re.M)
+    return int(match.group(1)) if match else 0
+
+
+def test_request_rate_limited_and_recorded(monkeypatch):
+    """Test request takes a token of the shared limiter and is recorded in metrics."""
+    monkeypatch.setattr(cortx_s3_rate_limiter, "_limiters", {})
+    responses_before = _responses_total("kv_get")
+
+    async def test(client):
+        await client.get('/indexes/test_index1/key1')
+        await client.get('/indexes/test_index1/key1')
+        return client._limiters["index"]
+
+    limiter, _ = _run(_with_server(test, requests_per_sec=1000))
+    assert limiter is cortx_s3_rate_limiter._limiters["consumer"]
+    assert limiter.get_metrics()['requests'] == 2
+    assert _responses_total("kv_get") == responses_before + 2
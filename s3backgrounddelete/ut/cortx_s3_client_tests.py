@@ -25,8 +25,10 @@ from http.client import HTTPResponse
 from unittest.mock import Mock
 import pytest
 
+from s3backgrounddelete import cortx_s3_rate_limiter
 from s3backgrounddelete.cortx_s3_client import CORTXS3Client
 from s3backgrounddelete.cortx_s3_config import CORTXS3Config
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
 from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_PRODUCER
 
 def test_get_connection_success():
@@ -153,3 +155,85 @@ def test_head_success():
         '/indexes/test_index1')
     assert response['status'] == 200
 
+
+
+def _rate_config(connection, requests_per_sec, object_requests_per_sec=0, adaptive=False):
+    """Return config of connection with its rates."""
+    config = Mock(spec=CORTXS3Config)
+    config.get_cortx_s3_endpoint_for_consumer = Mock(side_effect=KeyError())
+    config.get_cortx_s3_endpoint_for_producer = Mock(side_effect=KeyError())
+    getattr(config, "get_" + connection + "_requests_per_sec").return_value = requests_per_sec
+    getattr(config, "get_" + connection + "_deletes_per_sec").return_value = 0
+    for api in ("index", "object"):
+        getattr(config, "get_" + connection + "_" + api + "_requests_per_sec").return_value = 0
+        getattr(config, "get_" + connection + "_" + api + "_deletes_per_sec").return_value = 0
+    getattr(config, "get_" + connection + "_object_requests_per_sec").return_value = \
+        object_requests_per_sec
+    config.get_adaptive_throttling.return_value = adaptive
+    config.get_throttle_latency_ms.return_value = 500
+    return config
+
+
+def _pooled_client(config, connection_type):
+    """Return client whose pooled requests all succeed."""
+    client = CORTXS3Client(config, connection_type)
+    client._pool = Mock()
+    client._pool.request.return_value = {'status': 200, 'headers': [], 'body': b'',
+                                         'reason': 'OK'}
+    return client
+
+
+def test_rate_limiter_not_built_without_rates():
+    """Test no rate limiter is looked up when no rate is configured."""
+    config = _rate_config("producer", 0)
+    client = CORTXS3Client(config, CONNECTION_TYPE_PRODUCER)
+    assert client._get_rate_limiter("producer", "index") is None
+    config.get_throttle_latency_ms.assert_not_called()
+
+
+def test_rate_limiter_built_on_first_request():
+    """Test configured rate limiter is looked up on first request only."""
+    config = _rate_config("consumer", 1000)
+    client = _pooled_client(config, CONNECTION_TYPE_CONSUMER)
+    config.get_consumer_requests_per_sec.assert_not_called()
+    client.get('/indexes/test_index1')
+    client.get('/indexes/test_index1')
+    assert client._limiters["index"] is not None
+    assert client._limiters["index"].get_metrics()['requests'] >= 2
+    config.get_consumer_requests_per_sec.assert_called_once()
+
+
+def test_rate_limiter_looked_up_again_after_reload():
+    """Test rate limiter is looked up again once config settings are reloaded."""
+    config = _rate_config("consumer", 1000)
+    client = _pooled_client(config, CONNECTION_TYPE_CONSUMER)
+    client.get('/indexes/test_index1')
+    assert client._limiters["index"] is not None
+    config.get_settings.return_value = object()
+    config.get_consumer_requests_per_sec.return_value = 0
+    client.get('/indexes/test_index1')
+    assert client._limiters["index"] is None
+    assert config.get_consumer_requests_per_sec.call_count == 2
+
+
+def test_rate_limiter_per_api(monkeypatch):
+    """Test API with a rate of its own gets its own limiter, others share the connection one."""
+    monkeypatch.setattr(cortx_s3_rate_limiter, "_limiters", {})
+    config = _rate_config("consumer", 1000, object_requests_per_sec=50)
+    client = _pooled_client(config, CONNECTION_TYPE_CONSUMER)
+    client.get('/indexes/test_index1')
+    client.delete('/objects/oid1?layout-id=1')
+    client.delete('/objects/oid2?layout-id=1')
+    assert client._limiters["index"] is cortx_s3_rate_limiter._limiters["consumer"]
+    assert client._limiters["object"] is cortx_s3_rate_limiter._limiters["consumer_object"]
+    assert client._limiters["index"].get_metrics()['requests'] == 1
+    assert client._limiters["object"].get_metrics()['requests'] == 2
+
+
+def test_rate_limiter_built_for_adaptive_throttling_without_rates(monkeypatch):
+    """Test adaptive throttling gets a limiter even when no rate is configured."""
+    monkeypatch.setattr(cortx_s3_rate_limiter, "_limiters", {})
+    config = _rate_config("producer", 0, adaptive=True)
+    client = _pooled_client(config, CONNECTION_TYPE_PRODUCER)
+    client.get('/indexes/test_index1')
+    assert client._limiters["index"] is cortx_s3_rate_limiter._limiters["producer"]
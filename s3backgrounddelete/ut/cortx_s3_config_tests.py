@@ -205,3 +205,56 @@ def test_get_threshold_failure():
         config = CORTXS3Config()
         del config._config['indexid']['threshold']
         assert config.s3confstore.get_config('indexid>threshold') == ''
+
+
+def test_getters_read_settings_snapshot():
+    """Test if getters keep returning loaded value until config is reloaded."""
+    config = CORTXS3Config()
+    threshold = config.get_threshold()
+    config.s3confstore.set_config('indexid>threshold', threshold + 1, False)
+    assert config.get_threshold() == threshold
+
+
+def test_reload_swaps_settings_snapshot():
+    """Test if reload replaces settings snapshot as a whole."""
+    config = CORTXS3Config()
+    settings = config._settings
+    config.reload()
+    assert config.get_settings() is not settings
+    assert config.get_threshold() == settings.threshold
+
+
+def test_reload_keeps_settings_of_malformed_config(monkeypatch):
+    """Test if reload keeps current settings when config file can not be parsed."""
+    config = CORTXS3Config()
+    settings = config.get_settings()
+
+    def load_settings(s3confstore):
+        raise ValueError("Could not parse indexid>threshold from config file")
+
+    monkeypatch.setattr(config, "_load_settings", load_settings)
+    config.reload()
+    assert config.get_settings() is settings
+
+
+def test_settings_converted_once_at_load():
+    """Test if settings are converted at load and defaults filled in."""
+    config = CORTXS3Config()
+    config.s3confstore.set_config('indexid>threshold', "600", False)
+    config.s3confstore.set_config('cortx_s3>adaptive_throttling', "True", False)
+    config.s3confstore.set_config('message_bus>consumer_workers', "3", False)
+    config.s3confstore.delete_key('message_bus>consumer_max_inflight', False)
+    settings = CORTXS3Config._load_settings(config.s3confstore)
+    assert settings.threshold == 600
+    assert settings.adaptive_throttling is True
+    assert settings.msgbus_consumer_max_inflight == 6
+    with pytest.raises(AttributeError):
+        settings.threshold = 700
+
+
+def test_load_settings_malformed_value():
+    """Test if malformed value fails load with ValueError naming its key."""
+    config = CORTXS3Config()
+    config.s3confstore.set_config('indexid>max_keys', "many", False)
+    with pytest.raises(ValueError, match="indexid>max_keys"):
+        CORTXS3Config._load_settings(config.s3confstore)
@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for CORTXS3ConnectionPool.
+"""
+from http.client import HTTPConnection
+from http.client import HTTPResponse
+from unittest.mock import Mock
+
+from s3backgrounddelete.cortx_s3_connection_pool import CORTXS3ConnectionPool
+from s3backgrounddelete.cortx_s3_connection_pool import get_connection_pool
+
+
+def _mock_connection(status=200, will_close=False):
+    httpconnection = Mock(spec=HTTPConnection)
+    httpresponse = Mock(spec=HTTPResponse)
+    httpresponse.status = status
+    httpresponse.getheaders.return_value = \
+        'Content-Type:text/html;Content-Length:14'
+    httpresponse.read.return_value = b'{}'
+    httpresponse.reason = 'OK'
+    httpresponse.will_close = will_close
+    httpconnection.getresponse.return_value = httpresponse
+    return httpconnection
+
+
+def test_connection_reused():
+    """Test keep-alive connection is reused for next request."""
+    httpconnection = _mock_connection()
+    factory = Mock(return_value=httpconnection)
+    pool = CORTXS3ConnectionPool("127.0.0.1:28049", connection_factory=factory)
+
+    assert pool.request('GET', '/indexes/test_index1')['status'] == 200
+    assert pool.request('GET', '/indexes/test_index1')['status'] == 200
+
+    assert factory.call_count == 1
+    httpconnection.close.assert_not_called()
+    metrics = pool.get_metrics()
+    assert metrics['created'] == 1
+    assert metrics['reused'] == 1
+    assert metrics['idle'] == 1
+    assert metrics['in_use'] == 0
+
+
+def test_connection_closed_by_server_not_reused():
+    """Test connection is discarded when server asks to close it."""
+    httpconnection = _mock_connection(will_close=True)
+    factory = Mock(return_value=httpconnection)
+    pool = CORTXS3ConnectionPool("127.0.0.1:28049", connection_factory=factory)
+
+    pool.request('GET', '/indexes/test_index1')
+    pool.request('GET', '/indexes/test_index1')
+
+    assert factory.call_count == 2
+    assert pool.get_metrics()['discarded'] == 2
+
+
+def test_reconnect_on_broken_pipe():
+    """Test request is retried on a new connection if the old one is broken."""
+    broken = _mock_connection()
+    broken.request.side_effect = BrokenPipeError()
+    healthy = _mock_connection(status=204)
+    factory = Mock(side_effect=[broken, healthy])
+    pool = CORTXS3ConnectionPool("127.0.0.1:28049", connection_factory=factory)
+
+    response = pool.request('DELETE', '/indexes/test_index1/key1')
+
+    assert response['status'] == 204
+    broken.close.assert_called_once()
+    assert pool.get_metrics()['reconnects'] == 1
+
+
+def test_idle_connection_evicted():
+    """Test connection idle for longer than timeout is closed and not reused."""
+    first = _mock_connection()
+    second = _mock_connection()
+    factory = Mock(side_effect=[first, second])
+    pool = CORTXS3ConnectionPool("127.0.0.1:28049", idle_timeout=-1,
+                                 connection_factory=factory)
+
+    pool.request('GET', '/indexes/test_index1')
+    pool.request('GET', '/indexes/test_index1')
+
+    first.close.assert_called_once()
+    assert pool.get_metrics()['evicted_idle'] == 1
+
+
+def test_get_connection_pool_shared_per_endpoint():
+    """Test same pool is returned for same endpoint."""
+    assert get_connection_pool("127.0.0.1:28049") is \
+        get_connection_pool("127.0.0.1:28049")
+    assert get_connection_pool("127.0.0.1:28049") is not \
+        get_connection_pool("127.0.0.1:28050")
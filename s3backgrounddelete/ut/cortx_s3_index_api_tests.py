@@ -115,3 +115,81 @@ def test_put_no_index_id():
     response = CORTXS3IndexApi(config, CONNECTION_TYPE_PRODUCER).put(None)
     if (response is not None):
         assert response[0] is False
+
+
+def test_list_pages_follows_next_marker():
+    """Test list_pages walks all pages of index using NextMarker."""
+    first_page = b'{"IsTruncated": "true", "NextMarker": "key2", ' \
+        b'"Keys": [{"Key": "key1", "Value": "value1"}]}'
+    last_page = b'{"IsTruncated": "false", "NextMarker": "", ' \
+        b'"Keys": [{"Key": "key2", "Value": "value2"}]}'
+
+    httpconnection = Mock(spec=HTTPConnection)
+    httpresponse = Mock(spec=HTTPResponse)
+    httpresponse.status = 200
+    httpresponse.getheaders.return_value = \
+        'Content-Type:text/html;Content-Length:14'
+    httpresponse.read.side_effect = [first_page, last_page]
+    httpresponse.reason = 'OK'
+    httpconnection.getresponse.return_value = httpresponse
+
+    config = CORTXS3Config()
+    pages = list(CORTXS3IndexApi(config, CONNECTION_TYPE_PRODUCER,
+        connection=httpconnection).list_pages("test_index1", 1))
+
+    assert len(pages) == 2
+    assert all(result for result, _ in pages)
+    keys = [record["Key"] for _, page in pages
+            for record in page.get_index_content()["Keys"]]
+    assert keys == ["key1", "key2"]
+    second_request_uri = httpconnection.request.call_args_list[1][0][1]
+    assert "marker=key2" in second_request_uri
+
+
+def test_list_pages_streams_records():
+    """Test list_pages follows NextMarker without decoding whole pages."""
+    first_page = b'{"IsTruncated": "true", "Keys": [{"Key": "key1", "Value": "value1"}], ' \
+        b'"NextMarker": "key1"}'
+    last_page = b'{"IsTruncated": "false", "Keys": [{"Key": "key2", "Value": "value2"}], ' \
+        b'"NextMarker": ""}'
+
+    httpconnection = Mock(spec=HTTPConnection)
+    httpresponse = Mock(spec=HTTPResponse)
+    httpresponse.status = 200
+    httpresponse.getheaders.return_value = \
+        'Content-Type:text/html;Content-Length:14'
+    httpresponse.read.side_effect = [first_page, last_page]
+    httpresponse.reason = 'OK'
+    httpconnection.getresponse.return_value = httpresponse
+
+    config = CORTXS3Config()
+    keys = []
+    pages = []
+    for result, page in CORTXS3IndexApi(config, CONNECTION_TYPE_PRODUCER,
+            connection=httpconnection).list_pages("test_index1", 1):
+        assert result is True
+        keys.extend(record.get_key() for record in page.iter_records())
+        pages.append(page)
+
+    assert keys == ["key1", "key2"]
+    assert all(page._index_content is None for page in pages)
+    assert "marker=key1" in httpconnection.request.call_args_list[1][0][1]
+
+
+def test_list_pages_stops_on_failure():
+    """Test list_pages yields failure response and stops if listing fails."""
+    httpconnection = Mock(spec=HTTPConnection)
+    httpresponse = Mock(spec=HTTPResponse)
+    httpresponse.status = 404
+    httpresponse.getheaders.return_value = \
+        'Content-Type:text/html;Content-Length:14'
+    httpresponse.read.return_value = b'{}'
+    httpresponse.reason = 'NOT FOUND'
+    httpconnection.getresponse.return_value = httpresponse
+
+    config = CORTXS3Config()
+    pages = list(CORTXS3IndexApi(config, CONNECTION_TYPE_PRODUCER,
+        connection=httpconnection).list_pages("test_index2"))
+
+    assert len(pages) == 1
+    assert pages[0][0] is False
@@ -190,3 +190,37 @@ def test_put_failure():
     response = CORTXS3KVApi(config, CONNECTION_TYPE_PRODUCER, connection=httpconnection).put("test_index2", "test_key2")
     if (response is not None):
         assert response[0] is False
+
+
+def test_get_many_success():
+    """Test GET of many keys, it should return response for every key in order."""
+    httpconnection = Mock(spec=HTTPConnection)
+    httpresponse = Mock(spec=HTTPResponse)
+    httpresponse.status = 200
+    httpresponse.getheaders.return_value = \
+        'Content-Type:text/html;Content-Length:14'
+    httpresponse.read.return_value = b'{"Key": "test_key1", "Value": "testValue1"}'
+    httpresponse.reason = 'OK'
+    httpconnection.getresponse.return_value = httpresponse
+
+    config = CORTXS3Config()
+    response = CORTXS3KVApi(config, CONNECTION_TYPE_PRODUCER, connection=httpconnection).get_many(
+        "test_index1", ["test_key1", "test_key2"])
+    assert [status for status, _ in response] == [True, True]
+    assert response[1][1].get_key() == "test_key2"
+    assert httpconnection.request.call_count == 2
+
+
+def test_delete_many_partial_failure():
+    """Test DELETE of many keys, it should return status of every key."""
+    httpconnection = Mock(spec=HTTPConnection)
+    deleted = Mock(spec=HTTPResponse, status=204, reason='NO CONTENT')
+    deleted.read.return_value = b'{}'
+    not_found = Mock(spec=HTTPResponse, status=404, reason='NOT FOUND')
+    not_found.read.return_value = b'{}'
+    httpconnection.getresponse.side_effect = [deleted, not_found]
+
+    config = CORTXS3Config()
+    response = CORTXS3KVApi(config, CONNECTION_TYPE_PRODUCER, connection=httpconnection).delete_many(
+        "test_index1", ["test_key1", "test_key2"])
+    assert [status for status, _ in response] == [True, False]
@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for level guarded and sampled logging.
+"""
+import logging
+
+from s3backgrounddelete import cortx_s3_log
+from s3backgrounddelete.cortx_s3_log import CORTXS3LogSampler, CORTXS3RecordLog, log_debug
+
+
+class FakeLog(object):
+    """Log collecting messages of a logger at given level."""
+    logger = logging.getLogger("cortx_s3_log_tests")
+    messages = []
+
+    @staticmethod
+    def info(msg):
+        FakeLog.messages.append(msg)
+
+    @staticmethod
+    def debug(msg):
+        FakeLog.messages.append(msg)
+
+
+class Unprintable(object):
+    """Argument which must never be formatted."""
+
+    def __str__(self):
+        raise AssertionError("formatted although not logged")
+
+
+def _use_fake_log(monkeypatch, level):
+    FakeLog.logger.setLevel(level)
+    FakeLog.messages = []
+    monkeypatch.setattr(cortx_s3_log, "Log", FakeLog)
+
+
+def test_debug_not_formatted_at_info_level(monkeypatch):
+    """Test arguments of disabled messages are never formatted."""
+    _use_fake_log(monkeypatch, logging.INFO)
+    log_debug("Msg {}", Unprintable())
+    CORTXS3RecordLog(False).info("Record {}", Unprintable())
+    assert FakeLog.messages == []
+
+
+def test_sampler_logs_one_of_rate(monkeypatch):
+    """Test sampler lets one of every rate messages through."""
+    _use_fake_log(monkeypatch, logging.INFO)
+    sampler = CORTXS3LogSampler(10)
+    for index in range(25):
+        sampler.info("record {}", index)
+    assert FakeLog.messages == ["record 0", "record 10", "record 20"]
+
+
+def test_sampler_logs_all_at_debug_level(monkeypatch):
+    """Test every message is logged at DEBUG level."""
+    _use_fake_log(monkeypatch, logging.DEBUG)
+    sampler = CORTXS3LogSampler(10)
+    for index in range(5):
+        sampler.info("record {}", index)
+    assert len(FakeLog.messages) == 5
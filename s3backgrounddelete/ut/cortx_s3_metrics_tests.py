@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for CORTXS3MetricsRegistry and its exporters.
+"""
+import http.client
+
+from s3backgrounddelete.cortx_s3_metrics import CORTXS3MetricsRegistry, CORTXS3StatsdExporter
+from s3backgrounddelete.cortx_s3_metrics import start_metrics_server, _api_label
+
+
+def test_render_prometheus():
+    """Test counters, gauges and histograms are rendered in text format."""
+    registry = CORTXS3MetricsRegistry()
+    registry.inc("s3bgd_records_skipped_total", 2, {"reason": "journal"})
+    registry.set("s3bgd_producer_last_cycle_seconds", 1.5)
+    registry.observe("s3bgd_http_request_seconds", 0.02, {"api": "kv_get"})
+    registry.observe("s3bgd_http_request_seconds", 7, {"api": "kv_get"})
+    registry.add_collector(lambda: [("s3bgd_connection_pool_idle", {"endpoint": "host:80"}, 3)])
+    text = registry.render_prometheus()
+    assert 's3bgd_records_skipped_total{reason="journal"} 2' in text
+    assert "s3bgd_producer_last_cycle_seconds 1.5" in text
+    assert 's3bgd_connection_pool_idle{endpoint="host:80"} 3' in text
+    assert 's3bgd_http_request_seconds_bucket{api="kv_get",le="0.025"} 1' in text
+    assert 's3bgd_http_request_seconds_bucket{api="kv_get",le="+Inf"} 2' in text
+    assert 's3bgd_http_request_seconds_count{api="kv_get"} 2' in text
+
+
+def test_statsd_lines_send_deltas():
+    """Test statsd exporter sends counter deltas and interval mean of histograms."""
+    registry = CORTXS3MetricsRegistry()
+    exporter = CORTXS3StatsdExporter(registry, "127.0.0.1", 8125, "s3bgd", 10)
+    registry.inc("records_deleted_total", 5)
+    registry.observe("http_request_seconds", 0.1, {"api": "object_delete"})
+    registry.observe("http_request_seconds", 0.3, {"api": "object_delete"})
+    lines = exporter.lines()
+    assert "s3bgd.records_deleted_total:5|c" in lines
+    assert "s3bgd.http_request_seconds.object_delete:200.000|ms|@0.5" in lines
+    registry.inc("records_deleted_total", 1)
+    assert exporter.lines() == ["s3bgd.records_deleted_total:1|c"]
+
+
+def test_metrics_endpoint():
+    """Test /metrics is served over HTTP."""
+    registry = CORTXS3MetricsRegistry()
+    registry.inc("s3bgd_records_received_total")
+    server = start_metrics_server(registry, 0)
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        conn.request("GET", "/metrics")
+        response = conn.getresponse()
+        assert response.status == 200
+        assert b"s3bgd_records_received_total 1" in response.read()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_api_label():
+    """Test requests are labelled by API."""
+    assert _api_label("GET", "/indexes/AAAA%3D?max-keys=10") == "index_list"
+    assert _api_label("DELETE", "/indexes/AAAA%3D/key1") == "kv_delete"
+    assert _api_label("DELETE", "/objects/AAAA%3D?layout-id=9") == "object_delete"
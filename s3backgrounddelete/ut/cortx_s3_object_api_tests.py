@@ -213,3 +213,21 @@ def test_head_no_layout_id():
         assert response[0] is False
         assert response[1] is None
 
+
+
+def test_delete_many_success():
+    """Test DELETE of many objects, it should return response for every object."""
+    httpconnection = Mock(spec=HTTPConnection)
+    httpresponse = Mock(spec=HTTPResponse)
+    httpresponse.status = 204
+    httpresponse.getheaders.return_value = \
+        'Content-Type:text/html;Content-Length:14'
+    httpresponse.read.return_value = b'{}'
+    httpresponse.reason = 'NO CONTENT'
+    httpconnection.getresponse.return_value = httpresponse
+
+    config = CORTXS3Config()
+    response = CORTXS3ObjectApi(config, CONNECTION_TYPE_PRODUCER, connection=httpconnection).delete_many(
+        [("test_oid1", "test_layout_id1", "test_pvid_str"),
+         ("test_oid2", "test_layout_id2", "test_pvid_str")])
+    assert [status for status, _ in response] == [True, True]
@@ -0,0 +1,170 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for CORTXS3RateLimiter.
+"""
+from s3backgrounddelete.cortx_s3_rate_limiter import CORTXS3TokenBucket, CORTXS3RateLimiter
+
+
+class FakeClock(object):
+    """Clock advanced by sleeps only."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_limits_rate():
+    """Test bucket allows one burst and then rate tokens per second."""
+    clock = FakeClock()
+    bucket = CORTXS3TokenBucket(10, clock, clock.sleep)
+    for _ in range(30):
+        bucket.acquire()
+    # 10 tokens of the initial burst, 20 more take two seconds.
+    assert abs(clock.now - 2.0) < 1e-9
+
+
+def test_unlimited_bucket_never_sleeps():
+    """Test rate 0 does not limit."""
+    clock = FakeClock()
+    bucket = CORTXS3TokenBucket(0, clock, clock.sleep)
+    for _ in range(100):
+        assert bucket.acquire() == 0
+    assert clock.now == 0
+
+
+def test_deletes_limited_separately():
+    """Test deletes use their own rate on top of the request rate."""
+    clock = FakeClock()
+    limiter = CORTXS3RateLimiter(100, 5, clock=clock, sleep=clock.sleep)
+    for _ in range(15):
+        limiter.acquire('DELETE')
+    assert abs(clock.now - 2.0) < 1e-9
+    metrics = limiter.get_metrics()
+    assert metrics['deletes'] == 15
+    assert metrics['throttled_sec'] > 0
+
+
+def test_adaptive_throttling_backs_off_and_recovers():
+    """Test rates are halved on mostly 503 intervals and raised back while server keeps up."""
+    clock = FakeClock()
+    limiter = CORTXS3RateLimiter(100, 10, adaptive=True, latency_target=0.5,
+                                 clock=clock, sleep=clock.sleep)
+    clock.sleep(1)
+    for _ in range(10):
+        limiter.record_response(503, 0.01)
+    assert limiter.get_metrics()['rate_factor'] == 0.5
+    # Next decrease needs one adjust interval to pass.
+    for _ in range(10):
+        limiter.record_response(200, 2.0)
+    assert limiter.get_metrics()['rate_factor'] == 0.5
+    clock.sleep(1)
+    limiter.record_response(200, 2.0)
+    assert limiter.get_metrics()['rate_factor'] == 0.25
+    for _ in range(10):
+        clock.sleep(1)
+        for _ in range(10):
+            limiter.record_response(200, 0.01)
+    assert limiter.get_metrics()['rate_factor'] == 1.0
+    assert limiter.get_metrics()['congested_responses'] == 21
+
+
+def test_adaptive_throttling_ignores_single_slow_response():
+    """Test one slow or 5xx response among fast ones does not lower rates."""
+    clock = FakeClock()
+    limiter = CORTXS3RateLimiter(100, 10, adaptive=True, latency_target=0.5,
+                                 clock=clock, sleep=clock.sleep)
+    for congested in ((503, 0.01), (200, 2.0)):
+        clock.sleep(1)
+        limiter.record_response(*congested)
+        for _ in range(9):
+            limiter.record_response(200, 0.01)
+    metrics = limiter.get_metrics()
+    assert metrics['rate_factor'] == 1.0
+    assert metrics['rate_decreases'] == 0
+
+
+def test_adaptive_throttling_waits_for_enough_responses():
+    """Test rates are not adjusted on fewer responses than MIN_SAMPLES."""
+    clock = FakeClock()
+    limiter = CORTXS3RateLimiter(100, 10, adaptive=True, latency_target=0.5,
+                                 clock=clock, sleep=clock.sleep)
+    for _ in range(5):
+        clock.sleep(1)
+        limiter.record_response(503, 0.01)
+    assert limiter.get_metrics()['rate_factor'] == 1.0
+    for _ in range(5):
+        limiter.record_response(503, 0.01)
+    assert limiter.get_metrics()['rate_factor'] == 0.5
+
+
+def test_reserve_returns_wait_without_sleeping():
+    """Test reserve takes tokens and returns wait for callers which sleep themselves."""
+    clock = FakeClock()
+    limiter = CORTXS3RateLimiter(10, 0, clock=clock, sleep=clock.sleep)
+    waits = [limiter.reserve('GET') for _ in range(12)]
+    assert waits[:10] == [0] * 10
+    assert abs(waits[11] - 0.2) < 1e-9
+    assert clock.now == 0
+    assert limiter.get_metrics()['requests'] == 12
+
+
+def test_configure_changes_rates():
+    """Test reconfigured limiter sends at new rate, e.g. after config reload."""
+    clock = FakeClock()
+    limiter = CORTXS3RateLimiter(10, 0, clock=clock, sleep=clock.sleep)
+    for _ in range(10):
+        limiter.acquire('GET')
+    limiter.configure(100, 0, False, 0.5)
+    for _ in range(100):
+        limiter.acquire('GET')
+    assert abs(clock.now - 1.0) < 1e-9
+    limiter.configure(0, 0, False, 0.5)
+    assert not limiter.is_limited()
+
+
+def test_adaptive_throttling_without_rates_backs_off_from_observed_rate():
+    """Test uncapped limiter backs off from observed rate and is lifted once server keeps up."""
+    clock = FakeClock()
+    limiter = CORTXS3RateLimiter(0, 0, adaptive=True, latency_target=0.5,
+                                 clock=clock, sleep=clock.sleep)
+    assert limiter.is_limited()
+    assert limiter.reserve('GET') == 0
+    # Interval of 10 503 responses in one second.
+    clock.sleep(1)
+    for _ in range(10):
+        limiter.record_response(503, 0.01)
+    metrics = limiter.get_metrics()
+    assert metrics['rate_factor'] == 0.5
+    assert metrics['requests_per_sec'] == 5
+    waits = [limiter.reserve('GET') for _ in range(12)]
+    assert waits[-1] > 0
+    while limiter.get_metrics()['rate_factor'] < 1.0:
+        clock.sleep(1)
+        for _ in range(10):
+            limiter.record_response(200, 0.01)
+    assert limiter.get_metrics()['requests_per_sec'] == 0
+    clock.sleep(10)
+    assert [limiter.reserve('GET') for _ in range(100)] == [0] * 100
@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for create_timestamp parsing.
+"""
+import calendar
+from datetime import datetime
+import pytest
+
+from s3backgrounddelete.cortx_s3_timestamp import is_older_than, parse_timestamp, select_older_than
+
+
+def test_parse_timestamp_matches_strptime():
+    """Test parsed epoch seconds match strptime result."""
+    for timestamp in ["2020-03-16T16:24:04.000Z", "2020-02-29T00:00:00.000Z",
+                      "1999-12-31T23:59:59.000Z"]:
+        expected = calendar.timegm(
+            datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.000Z").timetuple())
+        assert parse_timestamp(timestamp) == expected
+
+
+def test_parse_invalid_timestamp():
+    """Test invalid timestamp should throw ValueError."""
+    with pytest.raises(ValueError):
+        parse_timestamp("2020-03-16 16:24:04")
+
+
+def test_is_older_than():
+    """Test age check uses whole minutes."""
+    now = parse_timestamp("2020-03-16T16:39:04.000Z") + 0.5
+    assert is_older_than("2020-03-16T16:24:04.000Z", 15, now)
+    assert not is_older_than("2020-03-16T16:24:05.000Z", 15, now)
+
+
+def test_select_older_than():
+    """Test page filter flags every timestamp against one now."""
+    now = parse_timestamp("2020-03-16T16:39:04.000Z")
+    flags = select_older_than(["2020-03-16T16:00:00.000Z", "2020-03-16T16:30:00.000Z",
+                               "2020-03-15T16:30:00.000Z"], 15, now)
+    assert flags == [True, False, True]
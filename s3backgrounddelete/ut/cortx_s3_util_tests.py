@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for CORTXS3Util.
+"""
+import datetime
+from unittest.mock import Mock
+
+from s3backgrounddelete import cortx_s3_util
+from s3backgrounddelete.cortx_s3_util import CORTXS3Util
+from s3backgrounddelete.cortx_s3_constants import CONNECTION_TYPE_CONSUMER
+
+
+def _config():
+    config = Mock()
+    config.get_cortx_s3_endpoint_for_consumer.return_value = "http://127.0.0.1:28049"
+    config.get_cortx_s3_access_key.return_value = "test_access_key"
+    config.get_cortx_s3_secret_key.return_value = "test_secret_key"
+    config.get_cortx_s3_service.return_value = "s3"
+    config.get_cortx_s3_region.return_value = "us-west2"
+    return config
+
+
+def test_signing_context_matches_sign_request_v4():
+    """Test signing context generates same authorization as sign_request_v4."""
+    s3_util = CORTXS3Util(_config(), CONNECTION_TYPE_CONSUMER)
+    epoch_t = datetime.datetime(2020, 3, 16, 16, 24, 4)
+    expected = s3_util.sign_request_v4('GET', '/indexes/test_index1', 'max-keys=1000', 'body',
+                                       epoch_t, '127.0.0.1:28049', 's3', 'us-west2')
+
+    signing_context = s3_util.get_signing_context()
+    authorization = signing_context.authorization(
+        'GET', '/indexes/test_index1', 'max-keys=1000',
+        signing_context.body_hash('body'), s3_util.get_amz_timestamp(epoch_t))
+    assert authorization == expected
+
+
+def test_signing_context_built_once():
+    """Test credentials and endpoint are read from config only once."""
+    config = _config()
+    s3_util = CORTXS3Util(config, CONNECTION_TYPE_CONSUMER)
+    for _ in range(3):
+        headers = s3_util.prepare_signed_header('GET', '/indexes/test_index1', '', '')
+    assert headers['Authorization'] is not None
+    assert config.get_cortx_s3_secret_key.call_count == 1
+    assert config.get_cortx_s3_endpoint_for_consumer.call_count == 1
+
+
+def test_signing_key_cached_per_date():
+    """Test signing key is derived again only when date changes."""
+    signing_context = CORTXS3Util(_config(), CONNECTION_TYPE_CONSUMER).get_signing_context()
+    key = signing_context.get_signing_key('20200316')
+    assert signing_context.get_signing_key('20200316') is key
+    assert signing_context.get_signing_key('20200317') != key
+
+
+def test_signing_context_rebuilt_after_reload():
+    """Test credentials are read again once config settings are reloaded."""
+    config = _config()
+    s3_util = CORTXS3Util(config, CONNECTION_TYPE_CONSUMER)
+    signing_context = s3_util.get_signing_context()
+    assert s3_util.get_signing_context() is signing_context
+    config.get_settings.return_value = object()
+    config.get_cortx_s3_secret_key.return_value = "new_secret_key"
+    reloaded = s3_util.get_signing_context()
+    assert reloaded is not signing_context
+    assert reloaded.get_signing_key('20200316') != signing_context.get_signing_key('20200316')
+    # Host is kept, pooled connections keep their endpoint until restart.
+    assert config.get_cortx_s3_endpoint_for_consumer.call_count == 1
+
+
+def test_authorization_without_method(monkeypatch):
+    """Test authorization of request without method is logged as error and not generated."""
+    errors = []
+    monkeypatch.setattr(cortx_s3_util.Log, "error", errors.append)
+    signing_context = CORTXS3Util(_config(), CONNECTION_TYPE_CONSUMER).get_signing_context()
+    assert signing_context.authorization(None, '/indexes/test_index1', '',
+                                         signing_context.body_hash(''), '20200316T162404Z') is None
+    assert errors == ["method can not be null"]
@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for ObjectRecoveryEnqueueTracker.
+"""
+from s3backgrounddelete.object_recovery_enqueue_tracker import ObjectRecoveryEnqueueTracker
+
+
+def test_new_record_is_sent_once():
+    """Test record is sent when new and skipped once enqueued."""
+    tracker = ObjectRecoveryEnqueueTracker(3600)
+    tracker.start_walk()
+    assert tracker.should_send("key1", '{"old_oid": "a"}', now=0)
+    tracker.mark_enqueued("key1", '{"old_oid": "a"}', now=0)
+    assert not tracker.should_send("key1", '{"old_oid": "a"}', now=10)
+
+
+def test_changed_record_is_sent_again():
+    """Test record is sent again if its value changed."""
+    tracker = ObjectRecoveryEnqueueTracker(3600)
+    tracker.mark_enqueued("key1", '{"old_oid": "a"}', now=0)
+    assert tracker.should_send("key1", '{"old_oid": "b"}', now=10)
+
+
+def test_record_resent_after_interval():
+    """Test record still in index is sent again after resend interval."""
+    tracker = ObjectRecoveryEnqueueTracker(60)
+    tracker.mark_enqueued("key1", "value", now=0)
+    assert not tracker.should_send("key1", "value", now=59)
+    assert tracker.should_send("key1", "value", now=60)
+
+
+def test_finish_walk_forgets_unlisted_keys():
+    """Test keys not listed during a complete walk are forgotten."""
+    tracker = ObjectRecoveryEnqueueTracker(3600)
+    tracker.mark_enqueued("key1", "value", now=0)
+    tracker.mark_enqueued("key2", "value", now=0)
+    tracker.start_walk()
+    tracker.should_send("key2", "value", now=1)
+    tracker.finish_walk()
+    assert len(tracker) == 1
+    assert tracker.should_send("key1", "value", now=2)
+
+
+def test_forget_failed_record():
+    """Test forgotten record is sent again."""
+    tracker = ObjectRecoveryEnqueueTracker(3600)
+    tracker.mark_enqueued("key1", "value", now=0)
+    tracker.forget("key1")
+    assert tracker.should_send("key1", "value", now=1)
@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for ObjectRecoveryInstanceCache.
+"""
+import json
+from unittest.mock import Mock
+
+from s3backgrounddelete.cortx_s3_index_api import CORTXS3IndexApi
+from s3backgrounddelete.cortx_list_index_response import CORTXS3ListIndexResponse
+from s3backgrounddelete.object_recovery_instance_cache import ObjectRecoveryInstanceCache
+
+
+def _list_response(values, next_marker=None):
+    index_content = {"Delimiter": "", "Index-Id": "AAAAAAAAAHg=-BAAQAAAAAAA=",
+                     "IsTruncated": "true" if next_marker else "false",
+                     "Keys": [{"Key": str(i), "Value": value} for i, value in enumerate(values)],
+                     "Marker": "", "MaxKeys": "1000", "NextMarker": next_marker or "",
+                     "Prefix": ""}
+    return True, CORTXS3ListIndexResponse(json.dumps(index_content).encode())
+
+
+def test_lookup_served_from_cache():
+    """Test index is listed once while cached instance ids are fresh."""
+    index_api_mock = Mock(spec=CORTXS3IndexApi)
+    index_api_mock.list.return_value = _list_response(["inst1", "inst2"])
+    cache = ObjectRecoveryInstanceCache(60)
+
+    for _ in range(3):
+        active = cache.get_active_instances(index_api_mock, "index", 1000)
+    assert active == {"inst1", "inst2"}
+    assert index_api_mock.list.call_count == 1
+
+
+def test_all_pages_listed():
+    """Test instance ids from truncated listing pages are all cached."""
+    index_api_mock = Mock(spec=CORTXS3IndexApi)
+    index_api_mock.list.side_effect = [_list_response(["inst1"], "1"),
+                                       _list_response(["inst2"])]
+    cache = ObjectRecoveryInstanceCache(60)
+
+    assert cache.get_active_instances(index_api_mock, "index", 1) == {"inst1", "inst2"}
+
+
+def test_list_failure_invalidates_cache():
+    """Test failed listing drops cached ids and reports None."""
+    index_api_mock = Mock(spec=CORTXS3IndexApi)
+    index_api_mock.list.side_effect = [_list_response(["inst1"]), (False, None)]
+    cache = ObjectRecoveryInstanceCache(0)
+
+    assert cache.get_active_instances(index_api_mock, "index", 1000) == {"inst1"}
+    assert cache.get_active_instances(index_api_mock, "index", 1000) is None
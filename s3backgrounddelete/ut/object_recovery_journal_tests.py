@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for ObjectRecoveryJournal.
+"""
+import os
+import tempfile
+
+from s3backgrounddelete.object_recovery_journal import ObjectRecoveryJournal, JOURNAL_DONE, JOURNAL_FAILED, JOURNAL_RETRY
+
+
+def test_outcome_expires_after_ttl():
+    """Test recorded outcome is returned only within ttl."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        journal = ObjectRecoveryJournal(os.path.join(tmpdir, "journal"), 60, 128)
+        fingerprint = journal.fingerprint('{"Key": "key1", "Value": "value"}')
+        assert journal.lookup(fingerprint, now=0) is None
+        journal.record(fingerprint, JOURNAL_DONE, now=0)
+        assert journal.lookup(fingerprint, now=59) == JOURNAL_DONE
+        assert journal.lookup(fingerprint, now=60) is None
+        journal.close()
+
+
+def test_journal_survives_reopen():
+    """Test outcomes are read back after journal is opened again."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "journal")
+        journal = ObjectRecoveryJournal(path, 60, 128)
+        journal.record(journal.fingerprint("msg1"), JOURNAL_FAILED, now=0)
+        journal.close()
+        journal = ObjectRecoveryJournal(path, 60, 128)
+        assert journal.lookup(journal.fingerprint("msg1"), now=1) == JOURNAL_FAILED
+        journal.close()
+        # Another slot count starts an empty journal.
+        journal = ObjectRecoveryJournal(path, 60, 256)
+        assert journal.lookup(journal.fingerprint("msg1"), now=1) is None
+        journal.close()
+
+
+def test_full_journal_evicts_oldest():
+    """Test recording into a full journal keeps the newest outcomes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        journal = ObjectRecoveryJournal(os.path.join(tmpdir, "journal"), 3600, 8)
+        for index in range(20):
+            journal.record(journal.fingerprint("msg" + str(index)), JOURNAL_DONE, now=index)
+        found = [index for index in range(20)
+                 if journal.lookup(journal.fingerprint("msg" + str(index)), now=20) is not None]
+        assert found == list(range(12, 20))
+        journal.close()
+
+
+def test_retry_outcome_expires_after_retry_ttl():
+    """Test retry outcome is kept for retry ttl and evicted before other outcomes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        journal = ObjectRecoveryJournal(os.path.join(tmpdir, "journal"), 3600, 8, 60)
+        journal.record(journal.fingerprint("msg1"), JOURNAL_RETRY, now=0)
+        assert journal.lookup(journal.fingerprint("msg1"), now=59) == JOURNAL_RETRY
+        assert journal.lookup(journal.fingerprint("msg1"), now=60) is None
+        journal.record(journal.fingerprint("msg1"), JOURNAL_DONE, now=70)
+        assert journal.lookup(journal.fingerprint("msg1"), now=200) == JOURNAL_DONE
+        # Retry outcome recorded last still expires first in a full journal.
+        for index in range(2, 8):
+            journal.record(journal.fingerprint("msg" + str(index)), JOURNAL_DONE, now=100)
+        journal.record(journal.fingerprint("retry"), JOURNAL_RETRY, now=110)
+        journal.record(journal.fingerprint("new"), JOURNAL_DONE, now=120)
+        assert journal.lookup(journal.fingerprint("retry"), now=120) is None
+        assert journal.lookup(journal.fingerprint("msg1"), now=120) == JOURNAL_DONE
+        journal.close()
@@ -0,0 +1,318 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for ObjectRecoveryMsgbus and ObjectRecoveryMsgbusBatcher.
+"""
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+from s3backgrounddelete import object_recovery_msgbus
+from s3backgrounddelete.object_recovery_msgbus import ObjectRecoveryMsgbus
+from s3backgrounddelete.object_recovery_msgbus import ObjectRecoveryMsgbusBatcher
+
+RECORDS = [{"Key": "key" + str(i), "Value": "{}"} for i in range(3)]
+
+
+def _config():
+    """Return config of non daemon consumer."""
+    config = Mock()
+    config.get_daemon_mode.return_value = False
+    config.get_msgbus_consumer_sleep_time.return_value = 1
+    config.get_msgbus_consumer_min_sleep_ms.return_value = 10
+    config.get_msgbus_consumer_receive_timeout.return_value = 0
+    config.get_msgbus_consumer_workers.return_value = 1
+    config.get_msgbus_consumer_max_inflight.return_value = 1
+    config.get_record_log_sample_rate.return_value = 1
+    config.get_msgbus_consumer_journal_file.return_value = None
+    config.get_msgbus_consumer_id_prefix.return_value = "consumer_"
+    config.get_msgbus_consumer_group.return_value = "group1"
+    config.get_msgbus_topic.return_value = "topic1"
+    config.get_msgbus_producer_id.return_value = "producer1"
+    return config
+
+
+def _msgbus(monkeypatch, config=None):
+    """Return ObjectRecoveryMsgbus and the mocked message bus library it uses."""
+    msgbuslib = Mock()
+    msgbuslib.setup_producer.return_value = (True, None)
+    msgbuslib.send.return_value = (True, None)
+    monkeypatch.setattr(object_recovery_msgbus, "S3CortxMsgBus", lambda: msgbuslib)
+    return ObjectRecoveryMsgbus(config or _config()), msgbuslib
+
+
+def test_send_batch_sends_records_in_one_send(monkeypatch):
+    """Test records of a batch go out in one multi-message send."""
+    msgbus, msgbuslib = _msgbus(monkeypatch)
+    assert msgbus.send_batch(RECORDS) == []
+    assert msgbus.send_batch(RECORDS[:1]) == []
+    msgbuslib.setup_producer.assert_called_once()
+    assert msgbuslib.send.call_count == 2
+    assert msgbuslib.send.call_args_list[0][0][0] == [json.dumps(r) for r in RECORDS]
+
+
+def test_send_batch_retries_whole_batch_on_failed_send(monkeypatch):
+    """Test failed send returns every record of batch for a retry."""
+    msgbus, msgbuslib = _msgbus(monkeypatch)
+    msgbuslib.send.return_value = (False, "send failed")
+    assert msgbus.send_batch(RECORDS) == RECORDS
+    msgbuslib.send.assert_called_once()
+
+
+def test_send_batch_producer_setup_failure(monkeypatch):
+    """Test records are returned unsent when producer can not be set up."""
+    msgbus, msgbuslib = _msgbus(monkeypatch)
+    msgbuslib.setup_producer.return_value = (False, "no broker")
+    assert msgbus.send_batch(RECORDS) == RECORDS
+    msgbuslib.send.assert_not_called()
+
+
+def test_send_batch_producer_setup_exception(monkeypatch):
+    """Test exception while setting up producer is retried on next batch."""
+    msgbus, msgbuslib = _msgbus(monkeypatch)
+    msgbuslib.setup_producer.side_effect = [Exception("broker down"), (True, None)]
+    assert msgbus.send_batch(RECORDS) == RECORDS
+    msgbuslib.send.assert_not_called()
+    assert msgbus.send_batch(RECORDS) == []
+    assert msgbuslib.setup_producer.call_count == 2
+    msgbuslib.send.assert_called_once()
+
+
+def test_send_batch_exception_sets_up_producer_again(monkeypatch):
+    """Test exception in send returns batch and sets up producer again."""
+    msgbus, msgbuslib = _msgbus(monkeypatch)
+    msgbuslib.send.side_effect = [Exception("connection reset"), (True, None)]
+    assert msgbus.send_batch(RECORDS) == RECORDS
+    assert msgbus.send_batch(RECORDS) == []
+    assert msgbuslib.setup_producer.call_count == 2
+
+
+def test_batcher_flushes_when_batch_is_full():
+    """Test batch is sent once batch_size records are added."""
+    msgbus = Mock()
+    msgbus.send_batch.return_value = []
+    batcher = ObjectRecoveryMsgbusBatcher(msgbus, 3, 60000, producer_id="producer1")
+    assert batcher.add(RECORDS[0]) == []
+    assert batcher.add(RECORDS[1]) == []
+    msgbus.send_batch.assert_not_called()
+    assert batcher.add(RECORDS[2]) == []
+    msgbus.send_batch.assert_called_once_with(RECORDS, producer_id="producer1")
+    assert batcher.flush() == []
+    msgbus.send_batch.assert_called_once()
+
+
+def test_batcher_flushes_after_linger():
+    """Test partial batch is sent once its first record lingered linger_ms."""
+    msgbus = Mock()
+    msgbus.send_batch.return_value = []
+    batcher = ObjectRecoveryMsgbusBatcher(msgbus, 100, 50)
+    batcher.add(RECORDS[0])
+    msgbus.send_batch.assert_not_called()
+    time.sleep(0.06)
+    batcher.add(RECORDS[1])
+    msgbus.send_batch.assert_called_once_with(RECORDS[:2], producer_id=None)
+    # Linger time starts again with the next batch.
+    batcher.add(RECORDS[2])
+    assert msgbus.send_batch.call_count == 1
+    batcher.flush()
+    msgbus.send_batch.assert_called_with(RECORDS[2:], producer_id=None)
+
+
+def test_batcher_returns_failed_batch(monkeypatch):
+    """Test records of a failed flush are handed back for a retry."""
+    msgbus, msgbuslib = _msgbus(monkeypatch)
+    msgbuslib.send.return_value = (False, "send failed")
+    batcher = ObjectRecoveryMsgbusBatcher(msgbus, 2, 60000)
+    assert batcher.add(RECORDS[0]) == []
+    assert batcher.add(RECORDS[1]) == RECORDS[:2]
+    assert batcher.flush() == []
+
+
+class _SlowValidator(object):
+    """Stand-in validator recording records in progress and finished."""
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    finished = []
+
+    def __init__(self, config, probable_delete_records, **kwargs):
+        self.key = probable_delete_records["Key"]
+        self.leak_entry_deleted = False
+
+    def process_results(self):
+        with _SlowValidator.lock:
+            _SlowValidator.active += 1
+            _SlowValidator.max_active = max(_SlowValidator.max_active, _SlowValidator.active)
+        time.sleep(0.02)
+        with _SlowValidator.lock:
+            _SlowValidator.active -= 1
+            _SlowValidator.finished.append(self.key)
+
+
+def _consume(monkeypatch, nr_records, workers, max_inflight):
+    """
+    Receive nr_records records on a concurrent consumer, return number of
+    records finished at every ack and most records received but unacked.
+    """
+    _SlowValidator.active = 0
+    _SlowValidator.max_active = 0
+    _SlowValidator.finished = []
+    monkeypatch.setattr(object_recovery_msgbus, "ObjectRecoveryValidator", _SlowValidator)
+    monkeypatch.setattr(object_recovery_msgbus, "ObjectRecoveryInstanceCache", Mock())
+    config = _config()
+    config.get_msgbus_consumer_workers.return_value = workers
+    config.get_msgbus_consumer_max_inflight.return_value = max_inflight
+    msgbus, msgbuslib = _msgbus(monkeypatch, config)
+    msgbus._get_apis = lambda: (None, None, None)
+    msgbuslib.setup_consumer.return_value = (True, None)
+
+    messages = [json.dumps({"Key": "key" + str(i),
+                            "Value": json.dumps({"objects_version_list_index_oid": "oid" + str(i)})})
+                for i in range(nr_records)]
+    acked = [0]
+    unacked = []
+    finished_at_ack = []
+
+    def receive(*args):
+        if not messages:
+            return False, None
+        # Records received so far and not yet acknowledged, this one included.
+        unacked.append(nr_records - len(messages) + 1 - acked[0])
+        return True, messages.pop(0).encode('utf-8')
+
+    def ack():
+        with _SlowValidator.lock:
+            finished_at_ack.append(len(_SlowValidator.finished))
+        acked[0] = nr_records - len(messages)
+
+    msgbuslib.receive.side_effect = receive
+    msgbuslib.ack.side_effect = ack
+    msgbus.receive_data(Mock(shutdown_signal=False))
+    return finished_at_ack, max(unacked)
+
+
+def test_consumer_acks_after_inflight_records_finish(monkeypatch):
+    """Test ack is sent only once every record received so far is processed."""
+    finished_at_ack, _ = _consume(monkeypatch, 6, workers=3, max_inflight=4)
+    # Drained once max in-flight is reached and again when queue is empty.
+    assert finished_at_ack == [4, 6]
+    assert _SlowValidator.max_active > 1
+
+
+def test_consumer_bounds_inflight_records(monkeypatch):
+    """Test no more than consumer_max_inflight records are unacknowledged."""
+    finished_at_ack, max_unacked = _consume(monkeypatch, 10, workers=4, max_inflight=3)
+    assert max_unacked == 3
+    assert _SlowValidator.max_active <= 3
+    assert finished_at_ack == [3, 6, 9, 10]
+
+
+class _CountingValidator(object):
+    """Stand-in validator counting records processed and deleting as told."""
+
+    processed = 0
+    delete = False
+
+    def __init__(self, config, probable_delete_records, **kwargs):
+        self.leak_entry_deleted = False
+
+    def process_results(self):
+        _CountingValidator.processed += 1
+        self.leak_entry_deleted = _CountingValidator.delete
+
+
+def _journaled_msgbus(monkeypatch, tmp_path, delete):
+    """Return msgbus with a journal whose records are deleted or left as per delete."""
+    _CountingValidator.processed = 0
+    _CountingValidator.delete = delete
+    monkeypatch.setattr(object_recovery_msgbus, "ObjectRecoveryValidator", _CountingValidator)
+    config = _config()
+    config.get_msgbus_consumer_journal_file.return_value = str(tmp_path / "journal")
+    config.get_msgbus_consumer_journal_ttl.return_value = 3600
+    config.get_msgbus_consumer_journal_retry_ttl.return_value = 300
+    config.get_msgbus_consumer_journal_slots.return_value = 128
+    msgbus, _ = _msgbus(monkeypatch, config)
+    msgbus._get_apis = lambda: (None, None, None)
+    msgbus._open_journal("consumer_1")
+    return msgbus
+
+
+def _process(msgbus, msg):
+    """Decode and process message as received by consumer."""
+    return msgbus._ObjectRecoveryMsgbus__process_msg(msg, *ObjectRecoveryMsgbus._decode_msg(msg))
+
+
+def test_redelivery_of_failed_record_skipped_within_retry_ttl(monkeypatch, tmp_path):
+    """Test record whose leak entry was not deleted is skipped until retry ttl passed."""
+    msgbus = _journaled_msgbus(monkeypatch, tmp_path, delete=False)
+    msg = json.dumps(RECORDS[0])
+    assert _process(msgbus, msg) is True
+    assert _process(msgbus, msg) is True
+    assert _CountingValidator.processed == 1
+    fingerprint = msgbus._journal.fingerprint(msg)
+    assert msgbus._journal.lookup(fingerprint, now=time.time() + 299) is not None
+    assert msgbus._journal.lookup(fingerprint, now=time.time() + 301) is None
+    msgbus.close()
+
+
+def test_redelivery_of_deleted_record_skipped_within_ttl(monkeypatch, tmp_path):
+    """Test record whose leak entry was deleted is skipped for the full journal ttl."""
+    msgbus = _journaled_msgbus(monkeypatch, tmp_path, delete=True)
+    msg = json.dumps(RECORDS[0])
+    _process(msgbus, msg)
+    _process(msgbus, msg)
+    assert _CountingValidator.processed == 1
+    fingerprint = msgbus._journal.fingerprint(msg)
+    assert msgbus._journal.lookup(fingerprint, now=time.time() + 301) is not None
+    msgbus.close()
+
+
+def test_consumer_decodes_message_once(monkeypatch):
+    """Test message and its Value are decoded once for partitioning and processing."""
+    decoded = []
+
+    class _CountingJson(object):
+        dumps = staticmethod(json.dumps)
+
+        @staticmethod
+        def loads(text):
+            decoded.append(text)
+            return json.loads(text)
+
+    monkeypatch.setattr(object_recovery_msgbus, "json", _CountingJson)
+    _consume(monkeypatch, 4, workers=2, max_inflight=4)
+    assert len(_SlowValidator.finished) == 4
+    # Message and its Value, once each.
+    assert len(decoded) == 8
+
+
+def test_decode_msg_and_partition_key():
+    """Test partition key is object version list index oid, else key of record."""
+    leak_info = {"objects_version_list_index_oid": "oid1"}
+    msg = json.dumps({"Key": "key1", "Value": json.dumps(leak_info)})
+    records, decoded_leak_info = ObjectRecoveryMsgbus._decode_msg(msg)
+    assert decoded_leak_info == leak_info
+    assert ObjectRecoveryMsgbus._partition_key(records, decoded_leak_info) == "oid1"
+    records, decoded_leak_info = ObjectRecoveryMsgbus._decode_msg(json.dumps(RECORDS[0]))
+    assert ObjectRecoveryMsgbus._partition_key(records, decoded_leak_info) == "key0"
+    assert ObjectRecoveryMsgbus._decode_msg("not json") == (None, None)
+    assert ObjectRecoveryMsgbus._partition_key(None, None) is None
@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for ObjectRecoveryPartitionedExecutor.
+"""
+import threading
+import time
+from concurrent.futures import wait
+
+from s3backgrounddelete.object_recovery_partitioned_executor import ObjectRecoveryPartitionedExecutor
+
+
+def _keys_in_partition(partition, workers, count):
+    """Return count keys which hash to partition."""
+    keys = []
+    index = 0
+    while len(keys) < count:
+        key = "oid" + str(index)
+        if hash(key) % workers == partition:
+            keys.append(key)
+        index += 1
+    return keys
+
+
+def test_same_key_processed_in_order():
+    """Test tasks of one key run one at a time in submit order."""
+    executor = ObjectRecoveryPartitionedExecutor(4)
+    processed = []
+    running = set()
+    lock = threading.Lock()
+
+    def task(key, seq):
+        with lock:
+            assert key not in running
+            running.add(key)
+        time.sleep(0.001)
+        with lock:
+            running.discard(key)
+            processed.append((key, seq))
+
+    futures = [executor.submit(key, task, key, seq)
+               for seq in range(20) for key in ("oid1", "oid2", "oid3")]
+    wait(futures)
+    executor.shutdown()
+    assert all(future.exception() is None for future in futures)
+    for key in ("oid1", "oid2", "oid3"):
+        assert [seq for k, seq in processed if k == key] == list(range(20))
+
+
+def test_idle_worker_steals_from_hot_partition():
+    """Test tasks of a hot partition are also run by idle workers."""
+    executor = ObjectRecoveryPartitionedExecutor(2)
+    threads = set()
+
+    def task():
+        threads.add(threading.current_thread().name)
+        time.sleep(0.005)
+
+    futures = [executor.submit(key, task) for key in _keys_in_partition(0, 2, 20)]
+    wait(futures)
+    executor.shutdown()
+    assert executor.steals > 0
+    assert len(threads) == 2
+
+
+def test_no_steal_of_key_with_queued_tasks():
+    """Test task is not stolen while an earlier task of its key is queued."""
+    executor = ObjectRecoveryPartitionedExecutor(2)
+    key = _keys_in_partition(0, 2, 1)[0]
+    futures = [executor.submit(key, time.sleep, 0.002) for _ in range(10)]
+    wait(futures)
+    executor.shutdown()
+    assert executor.steals == 0
+
+
+def test_exception_set_on_future():
+    """Test task exception is reported through its future."""
+    executor = ObjectRecoveryPartitionedExecutor(2)
+    future = executor.submit(None, int, "not a number")
+    wait([future])
+    executor.shutdown()
+    assert isinstance(future.exception(), ValueError)
@@ -0,0 +1,47 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+"""
+Unit Test for ObjectRecoveryPollBackoff.
+"""
+from s3backgrounddelete.object_recovery_msgbus import ObjectRecoveryPollBackoff
+
+
+def test_empty_polls_back_off_up_to_max():
+    """Test sleep grows exponentially on empty polls and is capped."""
+    backoff = ObjectRecoveryPollBackoff(0.05, 1)
+    sleeps = [backoff.empty_poll(0.01) for _ in range(10)]
+    assert 0.025 <= sleeps[0] <= 0.05
+    assert 0.05 <= sleeps[1] <= 0.1
+    assert all(0.5 <= sleep <= 1 for sleep in sleeps[5:])
+    assert backoff.get_metrics()["empty_polls"] == 10
+
+
+def test_message_resets_backoff():
+    """Test message resets backoff and records idle to message latency."""
+    backoff = ObjectRecoveryPollBackoff(0.05, 1)
+    for _ in range(5):
+        backoff.empty_poll(0.01)
+    backoff.message_received(0.002)
+    metrics = backoff.get_metrics()
+    assert metrics["current_delay_sec"] == 0
+    assert metrics["messages"] == 1
+    assert metrics["polls"] == 6
+    assert metrics["idle_to_message_sec_max"] >= 0.01
+    assert backoff.empty_poll(0.01) <= 0.05
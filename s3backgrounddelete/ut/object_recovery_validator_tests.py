@@ -191,4 +191,102 @@ def test_object_metadata_exists_mismatches():
 
     # Assert that object oid delete and leak index entry delete
     # is triggered if metadata doesn't exists.
-    validator.process_probable_delete_record.assert_called == True
\ No newline at end of file
+    validator.process_probable_delete_record.assert_called == True
+
+
+def test_versionlist_leaked_versions_deleted_across_pages():
+    """Test leaked versions of every version list page are deleted with bulk requests"""
+    index_api_mock = Mock(spec=CORTXS3IndexApi)
+    kv_api_mock = Mock(spec=CORTXS3KVApi)
+    object_api_mock = Mock(spec=CORTXS3ObjectApi)
+
+    def version(oid):
+        return json.dumps({'create_timestamp':'2020-03-17T11:02:13.000Z', 'layout_id':9,
+                           'motr_oid':oid, 'PVID':'AQAAAAAAAHYKAAAAAAAAAA=='})
+
+    pages = [{'IsTruncated': 'true', 'NextMarker': 'object_1/2',
+              'Keys': [{'Key': 'object_1/1', 'Value': version('current_oid')},
+                       {'Key': 'object_1/2', 'Value': version('leaked_oid_1')}]},
+             {'IsTruncated': 'false', 'NextMarker': '',
+              'Keys': [{'Key': 'object_1/3', 'Value': version('leaked_oid_2')}]}]
+    index_api_mock.list_pages.side_effect = lambda *args: (
+        (True, CORTXS3ListIndexResponse(json.dumps(page).encode())) for page in pages)
+    object_api_mock.delete_many.side_effect = lambda objects: [(True, None)] * len(objects)
+    kv_api_mock.delete_many.side_effect = lambda index_id, keys: [(True, None)] * len(keys)
+
+    config = CORTXS3Config()
+    probable_delete_records = {'Key': 'Tgj8AgAAAAA=-dQAAAAAABCY=', \
+        'Value':'{"object_key_in_index":"object_1","objects_version_list_index_oid":"TAifBwAAAHg=-AwAAAAAA2lk="}'}
+    validator = ObjectRecoveryValidator(
+                          config, probable_delete_records, objectapi = object_api_mock, kvapi = kv_api_mock, indexapi = index_api_mock)
+    validator.object_leak_id = 'current_oid'
+    validator.object_leak_info = json.loads(probable_delete_records['Value'])
+
+    ret = validator.process_objects_in_versionlist('TAifBwAAAHg=-AwAAAAAA2lk=', 'current_oid',
+        validator.version_entry_cb, 5, 'object_1/')
+
+    assert ret
+    assert object_api_mock.delete_many.call_count == 2
+    deleted_versions = [call[0][1] for call in kv_api_mock.delete_many.call_args_list]
+    assert deleted_versions == [['object_1/2'], ['leaked_oid_1'], ['object_1/3'], ['leaked_oid_2']]
+
+
+def test_versionlist_skips_versions_of_other_objects():
+    """Test only versions of the object itself are deleted when listing returns other keys"""
+    index_api_mock = Mock(spec=CORTXS3IndexApi)
+    kv_api_mock = Mock(spec=CORTXS3KVApi)
+    object_api_mock = Mock(spec=CORTXS3ObjectApi)
+
+    def version(oid):
+        return json.dumps({'create_timestamp':'2020-03-17T11:02:13.000Z', 'layout_id':9,
+                           'motr_oid':oid, 'PVID':'AQAAAAAAAHYKAAAAAAAAAA=='})
+
+    pages = [{'IsTruncated': 'true', 'NextMarker': 'object_10/1',
+              'Keys': [{'Key': 'object_1/1', 'Value': version('current_oid')},
+                       {'Key': 'object_1/2', 'Value': version('leaked_oid_1')},
+                       {'Key': 'object_10/0', 'Value': version('other_oid_1')},
+                       {'Key': 'object_10/1', 'Value': version('other_oid_2')}]},
+             {'IsTruncated': 'false', 'NextMarker': '',
+              'Keys': [{'Key': 'object_2/1', 'Value': version('other_oid_3')}]}]
+    index_api_mock.list_pages.side_effect = lambda *args: (
+        (True, CORTXS3ListIndexResponse(json.dumps(page).encode())) for page in pages)
+    object_api_mock.delete_many.side_effect = lambda objects: [(True, None)] * len(objects)
+    kv_api_mock.delete_many.side_effect = lambda index_id, keys: [(True, None)] * len(keys)
+
+    config = CORTXS3Config()
+    probable_delete_records = {'Key': 'Tgj8AgAAAAA=-dQAAAAAABCY=', \
+        'Value':'{"object_key_in_index":"object_1","objects_version_list_index_oid":"TAifBwAAAHg=-AwAAAAAA2lk="}'}
+    validator = ObjectRecoveryValidator(
+                          config, probable_delete_records, objectapi = object_api_mock, kvapi = kv_api_mock, indexapi = index_api_mock)
+    validator.object_leak_id = 'current_oid'
+    validator.object_leak_info = json.loads(probable_delete_records['Value'])
+
+    ret = validator.process_objects_in_versionlist('TAifBwAAAHg=-AwAAAAAA2lk=', 'current_oid',
+        validator.version_entry_cb, 5, 'object_1/')
+
+    assert ret
+    assert index_api_mock.list_pages.call_args[0][3] == {'prefix': 'object_1/'}
+    deleted_objects = [oid for call in object_api_mock.delete_many.call_args_list
+                       for oid, _, _ in call[0][0]]
+    assert deleted_objects == ['leaked_oid_1']
+    deleted_versions = [call[0][1] for call in kv_api_mock.delete_many.call_args_list]
+    assert deleted_versions == [['object_1/2'], ['leaked_oid_1']]
+
+
+def test_process_results_uses_decoded_leak_info():
+    """Test ObjectRecoveryValidator uses leak info decoded by consumer instead of decoding Value again"""
+    leak_info = {"force_delete": "true", "is_multipart": "false", "object_layout_id": 9,
+                 "pv_id": "AQAAAAAAAHYKAAAAAAAAAA==", "old_oid": "AAAAAAAAAAA=-AAAAAAAAAAA=",
+                 "objects_version_list_index_oid": "TAifBwAAAHg=-AwAAAAAA2lk=",
+                 "version_key_in_index": "object_1/18446742489333709430"}
+    # Value is not decoded, so it need not be valid JSON here.
+    probable_delete_records = {'Key': 'TAcGAQAAAAA=-AwAAAAAAhEs=', 'Value': 'not json'}
+
+    validator = ObjectRecoveryValidator(
+        CORTXS3Config(), probable_delete_records, objectapi=Mock(spec=CORTXS3ObjectApi),
+        kvapi=Mock(spec=CORTXS3KVApi), indexapi=Mock(spec=CORTXS3IndexApi), leak_info=leak_info)
+    validator.process_probable_delete_record = MagicMock(return_value=True)
+    validator.process_results()
+
+    assert validator.object_leak_info is leak_info
+    validator.process_probable_delete_record.assert_called_once_with(True, True)
@@ -70,10 +70,12 @@ class S3CortxMsgBus:
             return False, msg
         return True, None
 
-    def receive(self, daemon_mode):
-        """Receive the incoming message."""
+    def receive(self, daemon_mode, timeout = None):
+        """Receive the incoming message, waiting at most timeout seconds if given."""
         try:
-            if daemon_mode:
+            if timeout is not None:
+                message = self._consumer.receive(timeout=timeout)
+            elif daemon_mode:
                 #timeout=0 makes it as blocking indefinitely
                 message = self._consumer.receive(timeout=0)
             else:
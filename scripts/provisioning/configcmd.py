@@ -246,7 +246,7 @@ class ConfigCmd(SetupCmd):
       Log.info('Create topic started')
       self.create_topic(bgdeleteconfig.get_msgbus_admin_id,
                         bgdeleteconfig.get_msgbus_topic(),
-                        self.get_msgbus_partition_count())
+                        self.get_msgbus_partition_count(bgdeleteconfig.get_msgbus_consumer_processes()))
       Log.info('Create topic completed')
 
     Log.info("Backing up s3 bgdelete config sample file to temp dir started")
@@ -291,7 +291,7 @@ class ConfigCmd(SetupCmd):
       Log.info('Create topic started')
       self.create_topic(bgdeleteconfig.get_msgbus_admin_id,
                         bgdeleteconfig.get_msgbus_topic(),
-                        self.get_msgbus_partition_count())
+                        self.get_msgbus_partition_count(bgdeleteconfig.get_msgbus_consumer_processes()))
       Log.info('Create topic completed')
 
     # create background delete account
@@ -451,11 +451,12 @@ class ConfigCmd(SetupCmd):
     Log.info(f"Partition count : {partition_count}")
     return partition_count
 
-  def get_msgbus_partition_count(self):
+  def get_msgbus_partition_count(self, consumer_processes: int = 1):
     """get total consumers (* 2) which will act as partition count."""
     consumer_count = 0
     search_values = self.search_confvalue("node", "services", self.bg_delete_service)
-    consumer_count = len(search_values)
+    # Every node runs consumer_processes members of the consumer group.
+    consumer_count = len(search_values) * consumer_processes
     Log.info(f"consumer_count : {consumer_count}")
 
     # Partition count should be ( number of consumer * 2 )
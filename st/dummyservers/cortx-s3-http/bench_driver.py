@@ -0,0 +1,255 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+""" Benchmark of the background delete pipeline against cortxs3http.py.
+    Seeds the dummy server with synthetic leak records (see bench_seed.py),
+    runs ObjectRecoveryScheduler to list and enqueue them into an in memory
+    queue, then ObjectRecoveryValidator on every queued record and finally
+    walks the version lists of objects with extra versions.
+    You need to execute this file as:
+
+    python36 bench_driver.py [--records N] [--latency-ms MS] [--workers N] ...
+
+    Reports records/sec, requests per record, p50/p99 record latency and
+    peak RSS per phase, --json prints the same as one JSON document. """
+
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+from werkzeug.serving import make_server
+
+import cortxs3http
+from bench_seed import generate_leak_records, PROBABLE_DELETE_INDEX_ID, VERSION_LIST_INDEX_ID
+
+from s3backgrounddelete.cortx_s3_config import CORTXS3Config
+from s3backgrounddelete.cortx_s3_metrics import get_metrics_registry
+from s3backgrounddelete.object_recovery_scheduler import ObjectRecoveryScheduler
+from s3backgrounddelete.object_recovery_validator import ObjectRecoveryValidator
+
+
+class MemoryProducer(object):
+    """Stands in for ObjectRecoveryMsgbus of the scheduler."""
+
+    def purge(self):
+        return True
+
+
+class MemoryBatcher(object):
+    """Stands in for ObjectRecoveryMsgbusBatcher, queues messages in memory."""
+
+    def __init__(self):
+        self.messages = []
+
+    def add(self, record):
+        self.messages.append(json.dumps(record))
+        return []
+
+    def flush(self):
+        return []
+
+
+def write_config(base_dir, args):
+    """Write background delete config pointing to the dummy server, return base dir."""
+    with open(os.path.join(CORTXS3Config.get_conf_dir(),
+                           's3_background_delete_config.yaml.sample')) as sample:
+        config = yaml.safe_load(sample)
+    endpoint = "http://127.0.0.1:" + str(args.port)
+    config['cortx_s3'].update({'producer_endpoint': endpoint, 'consumer_endpoint': endpoint,
+                               'daemon_mode': False,
+                               'bulk_request_concurrency': args.bulk_concurrency})
+    config['indexid'].update({'max_keys': args.max_keys,
+                              'resume_marker_file': os.path.join(base_dir, 'marker')})
+    config['message_bus'].update({'consumer_journal_file': '',
+                                  'producer_enqueue_mode': 'purge'})
+    config['metrics'].update({'producer_http_port': 0, 'consumer_http_port': 0,
+                              'statsd_enabled': False})
+    config['logconfig'].update({'scheduler_logger_directory': base_dir,
+                                'processor_logger_directory': base_dir,
+                                'file_log_level': args.log_level})
+    config_dir = os.path.join(base_dir, 's3', 's3backgrounddelete')
+    os.makedirs(config_dir)
+    with open(os.path.join(config_dir, 'config.yaml'), 'w') as config_file:
+        yaml.safe_dump(config, config_file)
+    return base_dir
+
+
+def watch_version_deletes(kvapi):
+    """Record keys kvapi deletes from the version list index, return the list."""
+    deleted_keys = []
+    delete = kvapi.delete
+    delete_many = kvapi.delete_many
+
+    def watched_delete(index_id=None, object_key_name=None):
+        if index_id == VERSION_LIST_INDEX_ID:
+            deleted_keys.append(object_key_name)
+        return delete(index_id, object_key_name)
+
+    def watched_delete_many(index_id, keys, *args, **kwargs):
+        keys = list(keys)
+        if index_id == VERSION_LIST_INDEX_ID:
+            deleted_keys.extend(keys)
+        return delete_many(index_id, keys, *args, **kwargs)
+
+    kvapi.delete = watched_delete
+    kvapi.delete_many = watched_delete_many
+    return deleted_keys
+
+
+def request_count():
+    """Return number of requests sent to s3server so far."""
+    counters, _, _ = get_metrics_registry().snapshot()
+    return sum(value for (name, _), value in counters.items()
+               if name == "s3bgd_http_responses_total")
+
+
+def percentile(latencies, fraction):
+    """Return latency at fraction of sorted latencies."""
+    if not latencies:
+        return 0.0
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+
+
+def run_phase(name, items, process, workers, count=None):
+    """
+    Run process(item) for every item on workers threads, return phase report.
+    Rates are per count records if given, else per item.
+    """
+    latencies = []
+    lock = threading.Lock()
+
+    def timed(item):
+        start = time.perf_counter()
+        process(item)
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+
+    requests_before = request_count()
+    start = time.perf_counter()
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(timed, items))
+    else:
+        for item in items:
+            timed(item)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    if count is None:
+        count = len(items)
+    return {"phase": name, "records": count, "seconds": round(elapsed, 3),
+            "records_per_sec": round(count / elapsed, 1) if elapsed else 0.0,
+            "requests_per_record": round((request_count() - requests_before) / count, 2) if count else 0.0,
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark background delete against cortxs3http.py")
+    parser.add_argument("--records", type=int, default=1000, help="probable delete records to seed")
+    parser.add_argument("--versions", type=int, default=1, help="versions of each simple PUT object")
+    parser.add_argument("--parts", type=int, default=4, help="parts of each multipart upload")
+    parser.add_argument("--latency-ms", type=float, default=0, help="latency added to every request")
+    parser.add_argument("--workers", type=int, default=8, help="records validated concurrently")
+    parser.add_argument("--bulk-concurrency", type=int, default=8, help="bulk_request_concurrency")
+    parser.add_argument("--max-keys", type=int, default=1000, help="max_keys of index listings")
+    parser.add_argument("--port", type=int, default=28090, help="port of the dummy server")
+    parser.add_argument("--log-level", default="ERROR", help="file_log_level of background delete")
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    args = parser.parse_args()
+
+    entries, version_walks = generate_leak_records(args.records, args.versions, args.parts)
+    for index_id, key, value in entries:
+        cortxs3http.put_key(index_id, key, value)
+    cortxs3http.set_latency_ms(args.latency_ms)
+    # Per request access log of werkzeug would dominate the measurement.
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", args.port, cortxs3http.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    reports = []
+    with tempfile.TemporaryDirectory() as base_dir:
+        scheduler = ObjectRecoveryScheduler("bench_producer", write_config(base_dir, args))
+        scheduler.producer = MemoryProducer()
+        scheduler.batcher = MemoryBatcher()
+        # Producer: one listing walk of the probable delete index.
+        reports.append(run_phase("schedule", [None],
+                                 lambda _: scheduler.add_kv_to_msgbus(), 1, args.records))
+        config = scheduler.config
+
+        def validate(message):
+            ObjectRecoveryValidator(config, json.loads(message)).process_results()
+
+        reports.append(run_phase("validate", scheduler.batcher.messages, validate, args.workers))
+
+        stray_deletes = []
+
+        def walk_versions(version_walk):
+            object_key, current_oid = version_walk
+            validator = ObjectRecoveryValidator(config, {"Key": "T" + current_oid, "Value": "{}"})
+            validator.object_leak_id = current_oid
+            validator.object_leak_info = {"object_key_in_index": object_key}
+            deleted_keys = watch_version_deletes(validator._kvapi)
+            validator.process_objects_in_versionlist(
+                VERSION_LIST_INDEX_ID, current_oid, validator.version_entry_cb,
+                config.get_version_processing_delay_in_mins(), object_key + "/")
+            stray = [key for key in deleted_keys if not key.startswith(object_key + "/")]
+            if stray:
+                with stray_lock:
+                    stray_deletes.append((object_key, len(deleted_keys), stray))
+
+        stray_lock = threading.Lock()
+        if version_walks:
+            reports.append(run_phase("version_walk", version_walks, walk_versions, args.workers))
+    server.shutdown()
+
+    if stray_deletes:
+        # Numbers of a walk deleting other objects' versions are meaningless.
+        for object_key, deleted, stray in sorted(stray_deletes):
+            print("BUG: version walk of " + object_key + " deleted " + str(deleted) +
+                  " keys, " + str(len(stray)) + " of other objects, e.g. " + stray[0],
+                  file=sys.stderr)
+        sys.exit(1)
+
+    left = len(cortxs3http._index_store.get(PROBABLE_DELETE_INDEX_ID, {}))
+    if args.json:
+        print(json.dumps({"records": args.records, "latency_ms": args.latency_ms,
+                          "workers": args.workers, "phases": reports,
+                          "left_in_probable_delete_index": left}, indent=2))
+        return
+    print("%-13s %8s %9s %12s %9s %9s %9s %8s" % ("phase", "records", "seconds", "records/sec",
+                                                  "req/rec", "p50 ms", "p99 ms", "RSS MB"))
+    for report in reports:
+        print("%-13s %8d %9.3f %12.1f %9.2f %9.2f %9.2f %8.1f" % (
+            report["phase"], report["records"], report["seconds"], report["records_per_sec"],
+            report["requests_per_record"], report["p50_ms"], report["p99_ms"], report["peak_rss_mb"]))
+    print("Records left in probable delete index: " + str(left))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2020 Seagate Technology LLC and/or its Affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+""" Generates synthetic probable delete (leak) records and the metadata they
+    point to, for benchmarking background delete against cortxs3http.py.
+    To seed a running dummy server you need to execute this file as:
+
+    python36 bench_seed.py <url> [records] [versions] [parts] """
+
+import base64
+import http.client
+import json
+import struct
+import sys
+import urllib.parse
+
+NULL_OBJ_OID = "AAAAAAAAAAA=-AAAAAAAAAAA="
+PROBABLE_DELETE_INDEX_ID = "AAAAAAAAAHg=-AwAQAAAAAAA="
+GLOBAL_INSTANCE_INDEX_ID = "AAAAAAAAAHg=-BAAQAAAAAAA="
+PVID = "AQAAAAAAAHYKAAAAAAAAAA=="
+LAYOUT_ID = 9
+# Old enough for leak processing and version processing delays.
+CREATE_TIMESTAMP = "2020-03-16T16:24:04.000Z"
+INSTANCE_ID = "TAifBwAAAAA=-AAAAAAAA2lk="
+
+# simple: stale object of parallel PUT, leaked.
+# overwrite: new object of an overwrite which became current, not leaked.
+# multipart: parent of multipart upload with stale parts in extended index.
+# part: stale part of multipart upload in progress.
+RECORD_TYPES = ("simple", "overwrite", "multipart", "part")
+
+# Oid high part of each kind of oid, low part is a sequence number.
+_OBJECT_LIST, _VERSION_LIST, _EXTENDED, _PART_LIST = 1, 2, 3, 4
+_LEAKED, _CURRENT, _OLD, _PARENT, _EXTENDED_PART, _STALE_PART, _LIVE_PART, _VERSION = range(10, 18)
+
+
+def oid(kind, seq):
+    """Return oid in base64 encoded "high-low" format."""
+    return (base64.b64encode(struct.pack(">Q", kind)).decode() + "-" +
+            base64.b64encode(struct.pack(">Q", seq)).decode())
+
+
+OBJECT_LIST_INDEX_ID = oid(_OBJECT_LIST, 0)
+VERSION_LIST_INDEX_ID = oid(_VERSION_LIST, 0)
+EXTENDED_INDEX_ID = oid(_EXTENDED, 0)
+
+
+def _json(value):
+    return json.dumps(value)
+
+
+def generate_leak_records(count, versions=1, parts=4):
+    """
+    Return (entries, version_walks). entries is a list of (index_id, key, value)
+    holding count probable delete records and their metadata. version_walks
+    lists (object_key, current_oid) of objects having versions - 1 extra
+    leaked versions in VERSION_LIST_INDEX_ID.
+    """
+    object_list_index = OBJECT_LIST_INDEX_ID
+    version_list_index = VERSION_LIST_INDEX_ID
+    extended_index = EXTENDED_INDEX_ID
+    entries = [(GLOBAL_INSTANCE_INDEX_ID, "1", INSTANCE_ID)]
+    version_walks = []
+    for seq in range(count):
+        record_type = RECORD_TYPES[seq % len(RECORD_TYPES)]
+        object_key = "obj-%08d" % seq
+        version_key = object_key + "/%020d" % 0
+        leak_info = {"motr_process_fid": "<0x7200000000000000:0>",
+                     "create_timestamp": CREATE_TIMESTAMP,
+                     "force_delete": "false",
+                     "global_instance_id": INSTANCE_ID,
+                     "is_multipart": "false",
+                     "object_key_in_index": object_key,
+                     "object_layout_id": LAYOUT_ID,
+                     "pv_id": PVID,
+                     "object_list_index_oid": object_list_index,
+                     "objects_version_list_index_oid": version_list_index,
+                     "old_oid": NULL_OBJ_OID,
+                     "version_key_in_index": version_key}
+        if record_type in ("simple", "overwrite"):
+            current_oid = oid(_CURRENT, seq)
+            entries.append((object_list_index, object_key,
+                            _json({"motr_oid": current_oid, "layout_id": LAYOUT_ID,
+                                   "create_timestamp": CREATE_TIMESTAMP})))
+            if record_type == "simple":
+                leak_oid = oid(_LEAKED, seq)
+            else:
+                leak_oid = current_oid
+                leak_info["old_oid"] = oid(_OLD, seq)
+            entries.append((version_list_index, version_key,
+                            _json({"motr_oid": leak_oid, "layout_id": LAYOUT_ID, "PVID": PVID,
+                                   "create_timestamp": CREATE_TIMESTAMP})))
+            if record_type == "simple" and versions > 1:
+                # Current version and older leaked versions, for the version list walk.
+                entries.append((version_list_index, object_key + "/%020d" % versions,
+                                _json({"motr_oid": current_oid, "layout_id": LAYOUT_ID, "PVID": PVID,
+                                       "create_timestamp": CREATE_TIMESTAMP})))
+                for version in range(1, versions):
+                    entries.append((version_list_index, object_key + "/%020d" % version,
+                                    _json({"motr_oid": oid(_VERSION, seq * versions + version),
+                                           "layout_id": LAYOUT_ID, "PVID": PVID,
+                                           "create_timestamp": CREATE_TIMESTAMP})))
+                version_walks.append((object_key, current_oid))
+            entries.append((PROBABLE_DELETE_INDEX_ID, "T" + leak_oid, _json(leak_info)))
+        elif record_type == "multipart":
+            parent_oid = oid(_PARENT, seq)
+            leak_info.update({"force_delete": "true", "is_multipart": "true", "part": parts,
+                              "extended_md_idx_oid": extended_index, "ext_version_id": "v1"})
+            entries.append((version_list_index, version_key,
+                            _json({"motr_oid": parent_oid, "layout_id": LAYOUT_ID, "PVID": PVID,
+                                   "create_timestamp": CREATE_TIMESTAMP})))
+            for part in range(1, parts + 1):
+                entries.append((extended_index, object_key + "|v1|P" + str(part) + "|F1",
+                                _json({"OID": oid(_EXTENDED_PART, seq * parts + part),
+                                       "layout-id": LAYOUT_ID, "PVID": PVID})))
+            entries.append((PROBABLE_DELETE_INDEX_ID, "J" + parent_oid, _json(leak_info)))
+        else:
+            # Upload is in progress, object is not in object list index yet.
+            stale_part_oid = oid(_STALE_PART, seq)
+            part_list_index = oid(_PART_LIST, seq)
+            leak_info.update({"is_multipart": "true", "part": 1,
+                              "extended_md_idx_oid": NULL_OBJ_OID,
+                              "part_list_idx_oid": part_list_index})
+            entries.append((part_list_index, "1",
+                            _json({"motr_oid": oid(_LIVE_PART, seq), "layout_id": LAYOUT_ID,
+                                   "PVID": PVID})))
+            entries.append((PROBABLE_DELETE_INDEX_ID, "J" + stale_part_oid, _json(leak_info)))
+    return entries, version_walks
+
+
+def seed_over_http(url, entries):
+    """PUT indexes and their keys into the dummy server at url."""
+    netloc = urllib.parse.urlparse(url).netloc
+    conn = http.client.HTTPConnection(netloc)
+    created = set()
+    for index_id, key, value in entries:
+        index_uri = '/indexes/' + urllib.parse.quote(index_id, safe='')
+        if index_id not in created:
+            conn.request('PUT', index_uri)
+            conn.getresponse().read()
+            created.add(index_id)
+        conn.request('PUT', index_uri + '/' + urllib.parse.quote(key, safe=''), value)
+        conn.getresponse().read()
+    conn.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    ENTRIES, _ = generate_leak_records(int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+                                       int(sys.argv[3]) if len(sys.argv) > 3 else 1,
+                                       int(sys.argv[4]) if len(sys.argv) > 4 else 4)
+    seed_over_http(sys.argv[1], ENTRIES)
+    print("Seeded " + str(len(ENTRIES)) + " keys")
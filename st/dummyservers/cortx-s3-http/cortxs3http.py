@@ -22,10 +22,17 @@ from flask import request
 from flask import Response
 from flask import abort
 
+import bisect
 import json
+import os
+import sys
+import time
 
 app = Flask(__name__)
 
+# Latency (in ms) added to every request, to emulate a loaded s3server.
+_latency_ms = float(os.environ.get("CORTXS3HTTP_LATENCY_MS", 0))
+
 # Dummy server for testing purpose.
 # Globals:
 #       in memory KeyValue store
@@ -42,6 +49,27 @@ _index_store = {}
 #               }
 _object_store = {}
 
+# Sorted keys of index, rebuilt on first listing after a change.
+_sorted_keys = {}
+
+
+def set_latency_ms(latency_ms):
+    """Set latency added to every request."""
+    global _latency_ms
+    _latency_ms = latency_ms
+
+
+def put_key(index_id, key, value):
+    """Store key value in index, creating the index if needed."""
+    _index_store.setdefault(index_id, {})[key] = value
+    _sorted_keys.pop(index_id, None)
+
+
+@app.before_request
+def inject_latency():
+    if _latency_ms > 0:
+        time.sleep(_latency_ms / 1000.0)
+
 
 @app.route('/help')
 def help():
@@ -49,7 +77,7 @@ def help():
     <u>Supported APIs.</u>
 </br>
     <u>Index APIs:</u></br>
-      GET /indexes/idx1</br>
+      GET /indexes/idx1?max-keys=1000&marker=key1&prefix=key</br>
       PUT /indexes/idx1</br>
 </br>
     <u>Key Value APIs:</u></br>
@@ -70,11 +98,40 @@ def error_if_index_absent(index_id):
     if index_id not in _index_store:
         abort(Response("Index not found.", 404))
 
+def list_index(index_id):
+    """Return page of index in s3server listing format."""
+    max_keys = int(request.args.get('max-keys', 1000))
+    marker = request.args.get('marker', '')
+    prefix = request.args.get('prefix', '')
+    keys = _sorted_keys.get(index_id)
+    if keys is None:
+        keys = sorted(_index_store[index_id])
+        _sorted_keys[index_id] = keys
+    # Keys after marker, which itself is not listed.
+    start = bisect.bisect_right(keys, marker) if marker else 0
+    if prefix:
+        start = max(start, bisect.bisect_left(keys, prefix))
+    page = []
+    next_marker = ''
+    for key in keys[start:]:
+        if prefix and not key.startswith(prefix):
+            break
+        if key not in _index_store[index_id]:
+            continue
+        if len(page) == max_keys:
+            next_marker = page[-1]['Key']
+            break
+        page.append({'Key': key, 'Value': _index_store[index_id][key]})
+    return json.dumps({'Delimiter': '', 'Index-Id': index_id,
+                       'IsTruncated': 'true' if next_marker else 'false',
+                       'Keys': page, 'Marker': marker, 'MaxKeys': str(max_keys),
+                       'NextMarker': next_marker, 'Prefix': prefix})
+
 @app.route('/indexes/<index_id>', methods = ['GET', 'PUT'])
 def process_index_api(index_id):
     if request.method == 'GET':
         error_if_index_absent(index_id)
-        return json.dumps(_index_store[index_id])
+        return list_index(index_id)
     elif request.method == 'PUT':
         if index_id in _index_store:
             return ("Index already exists.", 409)
@@ -82,7 +139,7 @@ def process_index_api(index_id):
             _index_store[index_id] = {}
         return ("Created Index.", 201)
 
-@app.route('/indexes/<index_id>/<key>', methods = ['GET', 'PUT', 'DELETE'])
+@app.route('/indexes/<index_id>/<path:key>', methods = ['GET', 'PUT', 'DELETE'])
 def process_key_val_api(index_id, key):
     error_if_index_absent(index_id)
 
@@ -93,17 +150,18 @@ def process_key_val_api(index_id, key):
             return ("Key not found.", 404)
     elif request.method == 'PUT':
         value = request.get_data()
-        _index_store[index_id][key] = value.decode("utf-8")
+        put_key(index_id, key, value.decode("utf-8"))
         return ("Created Key.", 201)
     elif request.method == 'DELETE':
         if key in _index_store[index_id]:
+            # Listing skips deleted keys, so sorted keys stay valid.
             del _index_store[index_id][key]
         return ("Deleted Key.", 204)
     else:
         return "Method not supported"
 
 # Object APIs
-@app.route('/objects/<object_id>', methods = ['GET', 'PUT', 'DELETE'])
+@app.route('/objects/<path:object_id>', methods = ['GET', 'PUT', 'DELETE'])
 def process_object_api(object_id):
     if request.method == 'GET':
         if object_id in _object_store:
@@ -125,3 +183,9 @@ def process_object_api(object_id):
         return ("Deleted Object.", 204)
     else:
         return "Method not supported"
+
+if __name__ == '__main__':
+    # cortxs3http.py [port] [latency_ms]
+    if len(sys.argv) > 2:
+        set_latency_ms(float(sys.argv[2]))
+    app.run(port=int(sys.argv[1]) if len(sys.argv) > 1 else 5000, threaded=True)